@@ -2,14 +2,17 @@ import mesop as me
 import pandas as pd
 
 from a2a.types import AgentCard
+from demo.ui.service.types import AgentHealthInfo
 from demo.ui.state.agent_state import AgentState
 
 
 @me.component
 def agents_list(
     agents: list[AgentCard],
+    health: dict[str, AgentHealthInfo] | None = None,
 ):
-    """Agents list component."""
+    """Agents list component, with the health of each agent by name."""
+    health = health or {}
     df_data: dict[str, list[str | bool | None]] = {
         'Address': [],
         'Name': [],
@@ -19,6 +22,9 @@ def agents_list(
         'Output Modes': [],
         'Extensions': [],
         'Streaming': [],
+        'Health': [],
+        'p50 ms': [],
+        'p95 ms': [],
     }
     for agent_info in agents:
         df_data['Address'].append(agent_info.url)
@@ -37,6 +43,12 @@ def agents_list(
             if agent_info.capabilities.extensions
             else ''
         )
+        agent_health = health.get(agent_info.name)
+        df_data['Health'].append(
+            agent_health_label(agent_health) if agent_health else 'unknown'
+        )
+        df_data['p50 ms'].append(agent_health.p50_ms if agent_health else None)
+        df_data['p95 ms'].append(agent_health.p95_ms if agent_health else None)
     df = pd.DataFrame(
         pd.DataFrame(df_data),
         columns=[
@@ -48,6 +60,9 @@ def agents_list(
             'Output Modes',
             'Extensions',
             'Streaming',
+            'Health',
+            'p50 ms',
+            'p95 ms',
         ],
     )
 
@@ -89,6 +104,17 @@ def agents_list(
             me.icon(icon='upload')
 
 
+def agent_health_label(health: AgentHealthInfo) -> str:
+    label = {'closed': 'healthy', 'half_open': 'recovering'}.get(
+        health.state, health.state
+    )
+    if health.error_rate:
+        label += f' ({health.error_rate:.0%} errors)'
+    if health.last_probe_ok is False:
+        label += ', probe failing'
+    return label
+
+
 def add_agent(e: me.ClickEvent):  # pylint: disable=unused-argument
     """Import agent button handler."""
     state = me.state(AgentState)
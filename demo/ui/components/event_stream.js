@@ -0,0 +1,58 @@
+import {
+  LitElement,
+  html,
+} from 'https://cdn.jsdelivr.net/gh/lit/dist@3/core/lit-core.min.js';
+
+class EventStream extends LitElement {
+  static properties = {
+    triggerEvent: {type: String},
+    conversation_id: {type: String},
+    debounce_ms: {type: Number},
+  };
+
+  render() {
+    return html`<div></div>`;
+  }
+
+  updated(changedProperties) {
+    if (changedProperties.has('conversation_id') || !this.source) {
+      this.connect();
+    }
+  }
+
+  disconnectedCallback() {
+    super.disconnectedCallback();
+    this.close();
+  }
+
+  connect() {
+    this.close();
+    const query = this.conversation_id
+      ? `?conversation_id=${encodeURIComponent(this.conversation_id)}`
+      : '';
+    this.source = new EventSource(`/events/stream${query}`);
+    // Also refresh on (re)connect to pick up anything missed while offline.
+    this.source.onopen = () => this.scheduleRefresh();
+    this.source.onmessage = () => this.scheduleRefresh();
+  }
+
+  close() {
+    if (this.source) {
+      this.source.close();
+      this.source = null;
+    }
+  }
+
+  scheduleRefresh() {
+    // Coalesce bursts of notifications into a single refresh.
+    if (this.pending) {
+      return;
+    }
+    this.pending = setTimeout(() => {
+      this.pending = null;
+      this.dispatchEvent(new MesopEvent(this.triggerEvent, {}));
+    }, this.debounce_ms || 0);
+  }
+}
+
+customElements.define('event-stream-component', EventStream);
@@ -0,0 +1,35 @@
+from collections.abc import Callable
+from typing import Any
+
+import mesop.labs as mel
+
+
+@mel.web_component(path='./event_stream.js')
+def event_stream(
+    *,
+    trigger_event: Callable[[mel.WebEvent], Any],
+    conversation_id: str = '',
+    debounce_ms: int = 200,
+    key: str | None = None,
+):
+    """Creates an invisible component subscribed to the server event stream.
+
+    The component opens an EventSource on /events/stream, scoped to the given
+    conversation, and fires trigger_event whenever the server publishes a
+    change. Bursts of notifications are coalesced into one event every
+    debounce_ms.
+
+    Returns:
+      The web component that was created.
+    """
+    return mel.insert_web_component(
+        name='event-stream-component',
+        key=key,
+        events={
+            'triggerEvent': trigger_event,
+        },
+        properties={
+            'conversation_id': conversation_id,
+            'debounce_ms': debounce_ms,
+        },
+    )
@@ -1,60 +1,89 @@
 import asyncio
+import datetime
+import time
 
 import mesop as me
 import pandas as pd
 
-from demo.ui.state.host_agent_service import GetEvents, convert_event_to_state
+from demo.ui.service.types import EventRowQuery
+from demo.ui.state.host_agent_service import QueryEventRows
 
 
-def flatten_content(content: list[tuple[str, str]]) -> str:
-    parts = []
-    for p in content:
-        if p[1] == 'text/plain' or p[1] == 'application/json':
-            parts.append(p[0])
-        else:
-            parts.append(p[1])
+# Rows rendered per page, the table never holds more than this.
+EVENT_PAGE_SIZE = 50
+# Characters of content kept per row, truncated by the server.
+EVENT_CONTENT_LENGTH = 200
+# Time range options, in seconds back from now. 0 means no limit.
+TIME_WINDOWS = {
+    'All time': 0,
+    'Last 15 minutes': 15 * 60,
+    'Last hour': 60 * 60,
+    'Last day': 24 * 60 * 60,
+}
 
-    return '\n'.join(parts)
+
+@me.stateclass
+class EventListState:
+    """Filters and page position of the Event List"""
+
+    conversation_id: str = ''
+    actor: str = ''
+    time_window: str = 'All time'
+    # Sequence cursor of the current page, -1 for the newest page.
+    before: int = -1
+    # Cursors of the newer pages, to page back towards the newest events.
+    newer_cursors: list[int]
 
 
 @me.component
 def event_list():
-    """Events list component"""
-    df_data = {
-        'Timestamp': [],
-        'Conversation ID': [],
-        'Actor': [],
-        'Role': [],
-        'Id': [],
-        'Content': [],
-    }
-    events = asyncio.run(GetEvents())
-    
-    # Sort events by timestamp (chronological order - newest first)
-    events_sorted = sorted(events, key=lambda e: e.timestamp if hasattr(e, 'timestamp') and e.timestamp else 0, reverse=True)
-    
-    for e in events_sorted:
-        event = convert_event_to_state(e)
-        # Add timestamp formatting
-        if hasattr(e, 'timestamp') and e.timestamp:
-            import datetime
-            timestamp_str = datetime.datetime.fromtimestamp(e.timestamp).strftime('%H:%M:%S')
-        else:
-            timestamp_str = 'N/A'
-        
-        df_data['Timestamp'].append(timestamp_str)
-        df_data['Conversation ID'].append(event.context_id)
-        df_data['Role'].append(event.role)
-        df_data['Id'].append(event.id)
-        df_data['Content'].append(flatten_content(event.content))
-        df_data['Actor'].append(event.actor)
-    if not df_data['Conversation ID']:
+    """Events list component, showing one page of the newest events"""
+    state = me.state(EventListState)
+    window = TIME_WINDOWS.get(state.time_window, 0)
+    page = asyncio.run(
+        QueryEventRows(
+            EventRowQuery(
+                conversation_id=state.conversation_id,
+                actor=state.actor,
+                since=time.time() - window if window else None,
+                before=state.before if state.before >= 0 else None,
+                limit=EVENT_PAGE_SIZE,
+                content_length=EVENT_CONTENT_LENGTH,
+            )
+        )
+    )
+    with me.box(
+        style=me.Style(display='flex', flex_direction='row', gap=12)
+    ):
+        me.input(
+            label='Conversation ID',
+            value=state.conversation_id,
+            on_blur=set_conversation_filter,
+        )
+        me.input(label='Actor', value=state.actor, on_blur=set_actor_filter)
+        me.select(
+            label='Time range',
+            options=[me.SelectOption(label=k, value=k) for k in TIME_WINDOWS],
+            value=state.time_window,
+            on_selection_change=set_time_window,
+        )
+    if not page or not page.rows:
         me.text('No events found')
         return
-    df = pd.DataFrame(
-        pd.DataFrame(df_data),
-        columns=['Timestamp', 'Conversation ID', 'Actor', 'Role', 'Id', 'Content'],
-    )
+    columns = ['Timestamp', 'Conversation ID', 'Actor', 'Role', 'Id', 'Content']
+    df_data: dict[str, list[str]] = dict([(c, []) for c in columns])
+    for row in page.rows:
+        df_data['Timestamp'].append(
+            datetime.datetime.fromtimestamp(row.timestamp).strftime('%H:%M:%S')
+            if row.timestamp
+            else 'N/A'
+        )
+        df_data['Conversation ID'].append(row.conversation_id)
+        df_data['Actor'].append(row.actor)
+        df_data['Role'].append(row.role)
+        df_data['Id'].append(row.id)
+        df_data['Content'].append(row.content)
+    df = pd.DataFrame(df_data, columns=columns)
     with me.box(
         style=me.Style(
             display='flex',
@@ -73,3 +102,58 @@ def event_list():
                 'Content': me.TableColumn(sticky=True),
             },
         )
+    with me.box(
+        style=me.Style(
+            display='flex', flex_direction='row', align_items='center', gap=12
+        )
+    ):
+        me.button(
+            'Newer',
+            disabled=not state.newer_cursors,
+            on_click=show_newer_events,
+        )
+        me.text(f'{len(page.rows)} of {page.total} events')
+        me.button(
+            'Older',
+            disabled=page.next_before is None,
+            on_click=lambda e, before=page.next_before: show_older_events(
+                e, before
+            ),
+        )
+
+
+def reset_page(state: EventListState):
+    state.before = -1
+    state.newer_cursors = []
+
+
+def set_conversation_filter(e: me.InputBlurEvent):
+    state = me.state(EventListState)
+    state.conversation_id = e.value.strip()
+    reset_page(state)
+
+
+def set_actor_filter(e: me.InputBlurEvent):
+    state = me.state(EventListState)
+    state.actor = e.value.strip()
+    reset_page(state)
+
+
+def set_time_window(e: me.SelectSelectionChangeEvent):
+    state = me.state(EventListState)
+    state.time_window = e.value
+    reset_page(state)
+
+
+def show_older_events(e: me.ClickEvent, before: int | None):
+    if before is None:
+        return
+    state = me.state(EventListState)
+    state.newer_cursors.append(state.before)
+    state.before = before
+
+
+def show_newer_events(e: me.ClickEvent):
+    state = me.state(EventListState)
+    if state.newer_cursors:
+        state.before = state.newer_cursors.pop()
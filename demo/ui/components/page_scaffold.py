@@ -2,7 +2,7 @@ import mesop as me
 import mesop.labs as mel
 
 from demo.ui.state.host_agent_service import UpdateAppState
-from demo.ui.state.state import AppState
+from demo.ui.state.state import LIVE_POLLING_INTERVAL, AppState
 from demo.ui.styles.styles import (
     MAIN_COLUMN_STYLE,
     PAGE_BACKGROUND_PADDING_STYLE,
@@ -12,6 +12,7 @@ from demo.ui.styles.styles import (
 )
 
 from demo.ui.components.async_poller import AsyncAction, async_poller
+from demo.ui.components.event_stream import event_stream
 from demo.ui.components.side_nav import sidenav
 
 
@@ -27,14 +28,20 @@ async def refresh_app_state(e: mel.WebEvent):  # pylint: disable=unused-argument
 def page_scaffold():
     """Page scaffold component"""
     app_state = me.state(AppState)
-    action = (
-        AsyncAction(
-            value=app_state, duration_seconds=app_state.polling_interval
+    if app_state.polling_interval == LIVE_POLLING_INTERVAL:
+        event_stream(
+            trigger_event=refresh_app_state,
+            conversation_id=app_state.current_conversation_id,
         )
-        if app_state
-        else None
-    )
-    async_poller(action=action, trigger_event=refresh_app_state)
+    else:
+        action = (
+            AsyncAction(
+                value=app_state, duration_seconds=app_state.polling_interval
+            )
+            if app_state
+            else None
+        )
+        async_poller(action=action, trigger_event=refresh_app_state)
 
     sidenav('')
 
@@ -1,7 +1,7 @@
 import mesop as me
 
 from demo.ui.state.host_agent_service import UpdateAppState
-from demo.ui.state.state import AppState
+from demo.ui.state.state import LIVE_POLLING_INTERVAL, AppState
 
 
 @me.content_component
@@ -17,6 +17,9 @@ def polling_buttons():
         me.button_toggle(
             value=[str(state.polling_interval)],
             buttons=[
+                me.ButtonToggleButton(
+                    label='Live', value=str(LIVE_POLLING_INTERVAL)
+                ),
                 me.ButtonToggleButton(label='1s', value='1'),
                 me.ButtonToggleButton(label='5s', value='5'),
                 me.ButtonToggleButton(label='30s', value='30'),
@@ -1,34 +1,21 @@
-import json
-
 import mesop as me
 import pandas as pd
 
-from demo.ui.state.state import ContentPart, SessionTask, StateTask
-
-
-def message_string(content: ContentPart) -> str:
-    if isinstance(content, str):
-        return content
-    return json.dumps(content)
+from demo.ui.service.types import TaskRow
 
 
 @me.component
-def task_card(tasks: list[SessionTask]):
-    """Task card component"""
+def task_card(tasks: list[TaskRow]):
+    """Task card component, showing one page of task rows"""
     columns = ['Conversation ID', 'Task ID', 'Description', 'Status', 'Output']
     df_data: dict[str, list[str]] = dict([(c, []) for c in columns])
     for task in tasks:
-        df_data['Conversation ID'].append(task.context_id)
-        df_data['Task ID'].append(task.task.task_id or '')
-        df_data['Description'].append(
-            '\n'.join(message_string(x[0]) for x in task.task.message.content)
-        )
-        df_data['Status'].append(task.task.state)
-        df_data['Output'].append(flatten_artifacts(task.task))
-    df = pd.DataFrame(
-        pd.DataFrame(df_data),
-        columns=['Conversation ID', 'Actor', 'Role', 'Id', 'Content'],
-    )
+        df_data['Conversation ID'].append(task.conversation_id)
+        df_data['Task ID'].append(task.task_id)
+        df_data['Description'].append(task.description)
+        df_data['Status'].append(task.status)
+        df_data['Output'].append(task.output)
+    df = pd.DataFrame(df_data, columns=columns)
     with me.box(
         style=me.Style(
             display='flex',
@@ -41,15 +28,3 @@ def task_card(tasks: list[SessionTask]):
             header=me.TableHeader(sticky=True),
             columns=dict([(c, me.TableColumn(sticky=True)) for c in columns]),
         )
-
-
-def flatten_artifacts(task: StateTask) -> str:
-    parts = []
-    for a in task.artifacts:
-        for p in a:
-            if p[1] == 'text/plain' or p[1] == 'application/json':
-                parts.append(message_string(p[0]))
-            else:
-                parts.append(p[1])
-
-    return '\n'.join(parts)
@@ -204,6 +204,7 @@ async def lifespan(app: FastAPI):
     )
     app.setup()
     yield
+    await conversation_server.shutdown()
     await httpx_client_wrapper.stop()
 
 
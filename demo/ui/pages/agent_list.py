@@ -7,7 +7,11 @@ from demo.ui.components.dialog import dialog, dialog_actions
 from demo.ui.components.header import header
 from demo.ui.components.page_scaffold import page_frame, page_scaffold
 from demo.ui.state.agent_state import AgentState
-from demo.ui.state.host_agent_service import AddRemoteAgent, ListRemoteAgents
+from demo.ui.state.host_agent_service import (
+    AddRemoteAgent,
+    GetAgentHealth,
+    ListRemoteAgents,
+)
 from demo.ui.state.state import AppState
 from demo.ui.utils.agent_card import get_agent_card
 
@@ -20,7 +24,7 @@ def agent_list_page(app_state: AppState) -> None:
             with header('Remote Agents', 'smart_toy'):
                 pass
             agents = asyncio.run(ListRemoteAgents())
-            agents_list(agents)
+            agents_list(agents, asyncio.run(GetAgentHealth()))
             with dialog(state.agent_dialog_open):
                 with me.box(
                     style=me.Style(
@@ -77,7 +81,7 @@ async def load_agent_info(e: me.ClickEvent) -> None:
     state = me.state(AgentState)
     try:
         state.error = None
-        agent_card_response = get_agent_card(state.agent_address)
+        agent_card_response = await get_agent_card(state.agent_address)
         state.agent_name = agent_card_response.name
         state.agent_description = agent_card_response.description
         state.agent_framework_type = (
@@ -1,13 +1,98 @@
+import asyncio
+
+import mesop as me
+
 from demo.ui.components.header import header
 from demo.ui.components.page_scaffold import page_frame, page_scaffold
 from demo.ui.components.task_card import task_card
+from demo.ui.service.types import TaskRowQuery
+from demo.ui.state.host_agent_service import QueryTaskRows
 from demo.ui.state.state import AppState
 
 
+# Rows rendered per page.
+TASK_PAGE_SIZE = 50
+# Characters kept of each description and output, truncated by the server.
+TASK_CONTENT_LENGTH = 200
+
+
+@me.stateclass
+class TaskListState:
+    """Scope and page position of the Task List"""
+
+    all_conversations: bool = False
+    offset: int = 0
+
+
 def task_list_page(app_state: AppState):
     """Task List Page"""
+    state = me.state(TaskListState)
+    conversation_id = (
+        '' if state.all_conversations else app_state.current_conversation_id
+    )
     with page_scaffold():  # pylint: disable=not-context-manager
         with page_frame():
             with header('Task List', 'task'):
                 pass
-            task_card(app_state.task_list)
+            me.select(
+                label='Tasks of',
+                options=[
+                    me.SelectOption(label='Current conversation', value='current'),
+                    me.SelectOption(label='All conversations', value='all'),
+                ],
+                value='all' if state.all_conversations else 'current',
+                on_selection_change=set_scope,
+            )
+            if not conversation_id and not state.all_conversations:
+                me.text('Open a conversation to see its tasks')
+                return
+            page = asyncio.run(
+                QueryTaskRows(
+                    TaskRowQuery(
+                        conversation_id=conversation_id,
+                        offset=state.offset,
+                        limit=TASK_PAGE_SIZE,
+                        content_length=TASK_CONTENT_LENGTH,
+                    )
+                )
+            )
+            if not page or not page.rows:
+                me.text('No tasks found')
+                return
+            task_card(page.rows)
+            with me.box(
+                style=me.Style(
+                    display='flex',
+                    flex_direction='row',
+                    align_items='center',
+                    gap=12,
+                )
+            ):
+                me.button(
+                    'Newer', disabled=state.offset == 0, on_click=show_newer
+                )
+                me.text(
+                    f'{state.offset + 1}-{state.offset + len(page.rows)}'
+                    f' of {page.total} tasks'
+                )
+                me.button(
+                    'Older',
+                    disabled=state.offset + len(page.rows) >= page.total,
+                    on_click=show_older,
+                )
+
+
+def set_scope(e: me.SelectSelectionChangeEvent):
+    state = me.state(TaskListState)
+    state.all_conversations = e.value == 'all'
+    state.offset = 0
+
+
+def show_newer(e: me.ClickEvent):
+    state = me.state(TaskListState)
+    state.offset = max(state.offset - TASK_PAGE_SIZE, 0)
+
+
+def show_older(e: me.ClickEvent):
+    state = me.state(TaskListState)
+    state.offset += TASK_PAGE_SIZE
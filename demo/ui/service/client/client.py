@@ -1,4 +1,8 @@
+import asyncio
 import json
+import os
+import threading
+import time
 
 from typing import Any
 
@@ -11,17 +15,39 @@ from demo.ui.service.types import (
     CreateConversationResponse,
     DeleteConversationRequest,
     DeleteConversationResponse,
+    GetAgentHealthRequest,
+    GetAgentHealthResponse,
     GetEventRequest,
     GetEventResponse,
+    GetDispatchStatsRequest,
+    GetDispatchStatsResponse,
+    GetFastPathMetricsRequest,
+    GetFastPathMetricsResponse,
+    GetEventSinceRequest,
+    GetEventSinceResponse,
+    GetStateSnapshotRequest,
+    GetStateSnapshotResponse,
     JSONRPCRequest,
     ListAgentRequest,
     ListAgentResponse,
     ListConversationRequest,
     ListConversationResponse,
+    ListConversationSinceRequest,
+    ListConversationSinceResponse,
     ListMessageRequest,
     ListMessageResponse,
+    ListMessageSinceRequest,
+    ListMessageSinceResponse,
+    QueryEventRequest,
+    QueryEventResponse,
+    QueryEventRowsRequest,
+    QueryEventRowsResponse,
+    QueryTaskRowsRequest,
+    QueryTaskRowsResponse,
     ListTaskRequest,
     ListTaskResponse,
+    ListTaskSinceRequest,
+    ListTaskSinceResponse,
     MessageInfo,
     PendingMessageRequest,
     PendingMessageResponse,
@@ -34,9 +60,219 @@ from demo.ui.service.types import (
 )
 
 
+# Read timeouts per method, in seconds. Others use DEFAULT_TIMEOUT.
+ENDPOINT_TIMEOUTS = {
+    'message/send': 30.0,
+    'agent/register': 30.0,
+    'events/get': 20.0,
+}
+DEFAULT_TIMEOUT = 10.0
+CONNECT_TIMEOUT = 5.0
+# Methods that never change server state. Concurrent identical calls share
+# one request.
+READ_ONLY_METHODS = frozenset(
+    {
+        'conversation/list',
+        'conversation/list_since',
+        'message/list',
+        'message/list_since',
+        'message/pending',
+        'message/queue',
+        'routing/stats',
+        'task/list',
+        'task/list_since',
+        'events/get',
+        'events/get_since',
+        'events/query',
+        'events/rows',
+        'task/rows',
+        'agent/list',
+        'agent/health',
+        'state/snapshot',
+    }
+)
+# Full listings whose responses are additionally reused for a short time.
+CACHED_METHODS = frozenset(
+    {
+        'conversation/list',
+        'message/list',
+        'task/list',
+        'events/get',
+        'agent/list',
+    }
+)
+
+
+class SharedHTTPClient:
+    """Pooled keep-alive client shared by every ConversationClient.
+
+    The UI calls the server from many short lived event loops (each
+    asyncio.run in a Mesop handler makes a new one), and connections can
+    not be reused across loops. The pool therefore lives on a dedicated
+    loop thread and requests are handed to it from whatever loop the
+    caller runs in.
+
+    Concurrent identical read-only requests share one in-flight call, and
+    responses of CACHED_METHODS are reused for cache_ttl seconds. Any other
+    request clears that cache, since it may have changed the server state.
+    Expired responses are dropped when a new one is cached, and at most
+    max_cached responses are kept.
+    """
+
+    def __init__(
+        self,
+        cache_ttl: float = 1.0,
+        max_connections: int = 20,
+        transport: httpx.AsyncBaseTransport | None = None,
+        max_cached: int = 256,
+    ):
+        self.cache_ttl = cache_ttl
+        self.max_cached = max(max_cached, 1)
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=30,
+        )
+        self._transport = transport
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._client: httpx.AsyncClient | None = None
+        # Only touched from the pool loop.
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
+        # Bumped whenever the cache is cleared, so responses that were in
+        # flight during a mutation are not cached afterwards.
+        self._generation = 0
+        self.requests = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name='conversation-client',
+                    daemon=True,
+                ).start()
+                self._client = httpx.AsyncClient(
+                    limits=self._limits, transport=self._transport
+                )
+                self._loop = loop
+            return self._loop
+
+    async def post(self, base_url: str, request: JSONRPCRequest) -> dict[str, Any]:
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(
+            self._post(base_url, request), loop
+        )
+        return await asyncio.wrap_future(future)
+
+    async def _post(
+        self, base_url: str, request: JSONRPCRequest
+    ) -> dict[str, Any]:
+        body = request.model_dump(mode='json', exclude_none=True)
+        if request.method not in READ_ONLY_METHODS:
+            self._cache.clear()
+            self._generation += 1
+            return await self._fetch(base_url, request.method, body)
+        # The JSON-RPC id differs per call and does not affect the result.
+        key = (
+            base_url,
+            request.method,
+            json.dumps(body.get('params'), sort_keys=True),
+        )
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            self.cache_hits += 1
+            return cached[1]
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+        else:
+            inflight = asyncio.ensure_future(
+                self._fetch(base_url, request.method, body)
+            )
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+            if request.method in CACHED_METHODS and self.cache_ttl > 0:
+                generation = self._generation
+                inflight.add_done_callback(
+                    lambda f: self._store(key, f, generation)
+                )
+        return await asyncio.shield(inflight)
+
+    def _store(self, key: tuple, future: asyncio.Future, generation: int):
+        if generation != self._generation:
+            return
+        if future.cancelled() or future.exception() is not None:
+            return
+        now = time.monotonic()
+        # Entries share one ttl and are reinserted when replaced, so the
+        # dict is ordered by expiry and the expired ones are at the front.
+        self._cache.pop(key, None)
+        for oldest in list(self._cache):
+            if self._cache[oldest][0] > now and (
+                len(self._cache) < self.max_cached
+            ):
+                break
+            del self._cache[oldest]
+        self._cache[key] = (now + self.cache_ttl, future.result())
+
+    async def _fetch(
+        self, base_url: str, method: str, body: dict[str, Any]
+    ) -> dict[str, Any]:
+        self.requests += 1
+        timeout = httpx.Timeout(
+            ENDPOINT_TIMEOUTS.get(method, DEFAULT_TIMEOUT),
+            connect=CONNECT_TIMEOUT,
+        )
+        try:
+            response = await self._client.post(
+                base_url + '/' + method, json=body, timeout=timeout
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            print('http error', e)
+            raise AgentClientHTTPError(e.response.status_code, str(e)) from e
+        except json.JSONDecodeError as e:
+            print('decode error', e)
+            raise AgentClientJSONError(str(e)) from e
+
+    def close(self):
+        with self._lock:
+            loop, self._loop = self._loop, None
+            client, self._client = self._client, None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+
+_shared_client: SharedHTTPClient | None = None
+_shared_client_lock = threading.Lock()
+
+
+def shared_http_client() -> SharedHTTPClient:
+    """The process wide SharedHTTPClient, created on first use."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = SharedHTTPClient(
+                cache_ttl=float(os.environ.get('A2A_UI_CLIENT_CACHE_TTL', 1.0)),
+                max_connections=int(
+                    os.environ.get('A2A_UI_CLIENT_MAX_CONNECTIONS', 20)
+                ),
+            )
+        return _shared_client
+
+
 class ConversationClient:
-    def __init__(self, base_url):
+    def __init__(self, base_url, http_client: SharedHTTPClient | None = None):
         self.base_url = base_url.rstrip('/')
+        self._http_client = http_client or shared_http_client()
 
     async def send_message(
         self, payload: SendMessageRequest
@@ -49,22 +285,7 @@ class ConversationClient:
         return UnregisterAgentResponse(**await self._send_request(payload))
 
     async def _send_request(self, request: JSONRPCRequest) -> dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self.base_url + '/' + request.method,
-                    json=request.model_dump(mode='json', exclude_none=True),
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                print('http error', e)
-                raise AgentClientHTTPError(
-                    e.response.status_code, str(e)
-                ) from e
-            except json.JSONDecodeError as e:
-                print('decode error', e)
-                raise AgentClientJSONError(str(e)) from e
+        return await self._http_client.post(self.base_url, request)
 
     async def create_conversation(
         self, payload: CreateConversationRequest
@@ -81,14 +302,66 @@ class ConversationClient:
     ) -> ListConversationResponse:
         return ListConversationResponse(**await self._send_request(payload))
 
+    async def list_conversation_since(
+        self, payload: ListConversationSinceRequest
+    ) -> ListConversationSinceResponse:
+        return ListConversationSinceResponse(
+            **await self._send_request(payload)
+        )
+
     async def get_events(self, payload: GetEventRequest) -> GetEventResponse:
         return GetEventResponse(**await self._send_request(payload))
 
+    async def get_dispatch_stats(
+        self, payload: GetDispatchStatsRequest
+    ) -> GetDispatchStatsResponse:
+        return GetDispatchStatsResponse(**await self._send_request(payload))
+
+    async def get_fast_path_metrics(
+        self, payload: GetFastPathMetricsRequest
+    ) -> GetFastPathMetricsResponse:
+        return GetFastPathMetricsResponse(**await self._send_request(payload))
+
+    async def get_agent_health(
+        self, payload: GetAgentHealthRequest
+    ) -> GetAgentHealthResponse:
+        return GetAgentHealthResponse(**await self._send_request(payload))
+
+    async def get_events_since(
+        self, payload: GetEventSinceRequest
+    ) -> GetEventSinceResponse:
+        return GetEventSinceResponse(**await self._send_request(payload))
+
+    async def get_state_snapshot(
+        self, payload: GetStateSnapshotRequest
+    ) -> GetStateSnapshotResponse:
+        return GetStateSnapshotResponse(**await self._send_request(payload))
+
+    async def query_events(
+        self, payload: QueryEventRequest
+    ) -> QueryEventResponse:
+        return QueryEventResponse(**await self._send_request(payload))
+
+    async def query_event_rows(
+        self, payload: QueryEventRowsRequest
+    ) -> QueryEventRowsResponse:
+        return QueryEventRowsResponse(**await self._send_request(payload))
+
+    async def query_task_rows(
+        self, payload: QueryTaskRowsRequest
+    ) -> QueryTaskRowsResponse:
+        return QueryTaskRowsResponse(**await self._send_request(payload))
+
     async def list_messages(
         self, payload: ListMessageRequest
     ) -> ListMessageResponse:
         return ListMessageResponse(**await self._send_request(payload))
 
+    async def list_messages_since(
+        self, payload: ListMessageSinceRequest
+    ) -> ListMessageSinceResponse:
+        return ListMessageSinceResponse(**await self._send_request(payload))
+
     async def get_pending_messages(
         self, payload: PendingMessageRequest
     ) -> PendingMessageResponse:
@@ -97,6 +370,11 @@ class ConversationClient:
     async def list_tasks(self, payload: ListTaskRequest) -> ListTaskResponse:
         return ListTaskResponse(**await self._send_request(payload))
 
+    async def list_tasks_since(
+        self, payload: ListTaskSinceRequest
+    ) -> ListTaskSinceResponse:
+        return ListTaskSinceResponse(**await self._send_request(payload))
+
     async def register_agent(
         self, payload: RegisterAgentRequest
     ) -> RegisterAgentResponse:
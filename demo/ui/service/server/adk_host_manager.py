@@ -3,9 +3,8 @@ import base64
 import datetime
 import json
 import os
-import re
+import time
 import uuid
-from typing import Dict, List, Optional, Tuple
 
 import httpx
 
@@ -14,7 +13,6 @@ from a2a.types import (
     Artifact,
     DataPart,
     FilePart,
-    FileWithBytes,
     FileWithUri,
     Message,
     Part,
@@ -27,125 +25,46 @@ from a2a.types import (
     TextPart,
 )
 from google.adk import Runner
-from google.adk.artifacts import InMemoryArtifactService
 from google.adk.events.event import Event as ADKEvent
 from google.adk.events.event_actions import EventActions as ADKEventActions
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 
 from google.genai import types
-from samples.python.hosts.multiagent.host_agent import HostAgent
+from samples.python.hosts.multiagent.agent_health import OPEN
+from samples.python.hosts.multiagent.host_agent import (
+    HostAgent,
+    agent_response_prefix,
+)
 from samples.python.hosts.multiagent.remote_agent_connection import TaskCallbackArg
-from demo.ui.utils.agent_card import get_agent_card
+from demo.ui.utils.agent_card import AgentCardCache
 
+from demo.ui.service.server.agent_router import (
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    IntelligentAgentRouter,
+)
 from demo.ui.service.server.application_manager import ApplicationManager
+from demo.ui.service.server.artifact_handles import ArtifactHandles
+from demo.ui.service.server.blob_artifact_service import BlobArtifactService
+from demo.ui.service.server.blob_store import BlobQuotaError, BlobStore
+from demo.ui.service.server.file_cache import CachedFile
+from demo.ui.service.server.conversation_locks import ConversationLocks
+from demo.ui.service.server.conversation_store import ConversationStore
+from demo.ui.service.server.event_broker import EventBroker
+from demo.ui.service.server.event_log import EventLog
+from demo.ui.service.server.journal_session_service import (
+    JournalSessionService,
+)
+from demo.ui.service.server.routing_stats import FastPathStats
+from demo.ui.service.server.semantic_router import (
+    DEFAULT_THRESHOLD,
+    GenAIEmbedder,
+    HashingEmbedder,
+    SemanticAgentRouter,
+)
 from demo.ui.service.types import Conversation, Event
 
 
-class IntelligentAgentRouter:
-    """Fast, reliable agent routing system that matches requests to the best agent"""
-    
-    def __init__(self):
-        self.agent_patterns: Dict[str, List[Tuple[str, float]]] = {}
-        self.agent_capabilities: Dict[str, AgentCard] = {}
-        self.fallback_agent: Optional[str] = None
-        
-    def register_agent(self, agent_card: AgentCard):
-        """Register an agent and build routing patterns"""
-        url = agent_card.url
-        self.agent_capabilities[url] = agent_card
-        
-        # Build routing patterns from agent skills
-        patterns = []
-        
-        for skill in agent_card.skills:
-            # High priority patterns from skill name and description
-            skill_keywords = self._extract_keywords(skill.name + " " + skill.description)
-            for keyword in skill_keywords:
-                patterns.append((keyword.lower(), 0.9))
-            
-            # Medium priority patterns from tags
-            for tag in skill.tags:
-                patterns.append((tag.lower(), 0.7))
-            
-            # High priority patterns from examples
-            for example in skill.examples:
-                example_keywords = self._extract_keywords(example)
-                for keyword in example_keywords:
-                    patterns.append((keyword.lower(), 0.8))
-        
-        # Add agent-specific patterns
-        if "coder" in agent_card.name.lower() or "code" in agent_card.description.lower():
-            patterns.extend([
-                (r'\b(code|coding|program|script|function|debug|execute|run)\b', 1.0),
-                (r'\b(python|javascript|java|c\+\+|html|css|sql)\b', 0.95),
-                (r'\b(write.*code|create.*script|fix.*bug|implement)\b', 0.9),
-            ])
-            
-        elif "video" in agent_card.name.lower() or "veo" in agent_card.name.lower():
-            patterns.extend([
-                (r'\b(video|generate.*video|create.*video|veo)\b', 1.0),
-                (r'\b(animation|clip|movie|footage|visual)\b', 0.8),
-                (r'\b(generate.*from.*prompt|text.*to.*video)\b', 0.95),
-            ])
-        
-        self.agent_patterns[url] = patterns
-        
-        # Set fallback agent (prefer coder agent as general purpose)
-        if "coder" in agent_card.name.lower() and not self.fallback_agent:
-            self.fallback_agent = url
-    
-    def _extract_keywords(self, text: str) -> List[str]:
-        """Extract meaningful keywords from text"""
-        # Remove common stop words and extract meaningful terms
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'that', 'this', 'these', 'those'}
-        
-        # Extract words (3+ characters, not stop words)
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-        return [word for word in words if word not in stop_words]
-    
-    def route_message(self, message_text: str) -> Optional[str]:
-        """Route message to best agent based on content analysis"""
-        if not message_text or not self.agent_patterns:
-            return self.fallback_agent
-        
-        message_lower = message_text.lower()
-        agent_scores: Dict[str, float] = {}
-        
-        # Score each agent based on pattern matches
-        for agent_url, patterns in self.agent_patterns.items():
-            score = 0.0
-            matches = 0
-            
-            for pattern, weight in patterns:
-                if isinstance(pattern, str) and pattern.startswith('\\b'):
-                    # Regex pattern
-                    if re.search(pattern, message_lower):
-                        score += weight
-                        matches += 1
-                else:
-                    # Simple keyword match
-                    if pattern in message_lower:
-                        score += weight
-                        matches += 1
-            
-            # Normalize score by number of patterns to avoid bias toward agents with more patterns
-            if matches > 0:
-                agent_scores[agent_url] = score / len(patterns) * matches
-        
-        # Return agent with highest score, or fallback if no matches
-        if agent_scores:
-            best_agent = max(agent_scores.items(), key=lambda x: x[1])
-            if best_agent[1] > 0.1:  # Minimum confidence threshold
-                return best_agent[0]
-        
-        return self.fallback_agent
-    
-    def get_agent_info(self, agent_url: str) -> Optional[AgentCard]:
-        """Get agent card for a given URL"""
-        return self.agent_capabilities.get(agent_url)
-
-
 class ADKHostManager(ApplicationManager):
     """Enhanced host manager with intelligent agent routing"""
 
@@ -155,20 +74,94 @@ class ADKHostManager(ApplicationManager):
         api_key: str = '',
         uses_vertex_ai: bool = False,
     ):
-        self._conversations: list[Conversation] = []
-        self._messages: list[Message] = []
-        self._tasks: list[Task] = []
-        self._events: dict[str, Event] = {}
-        self._pending_message_ids: list[str] = []
+        self._store = ConversationStore(
+            EventLog(
+                capacity=int(os.environ.get('A2A_UI_EVENT_LOG_CAPACITY', 10000)),
+                overflow_path=os.environ.get('A2A_UI_EVENT_LOG_OVERFLOW') or None,
+                overflow_max_bytes=int(
+                    os.environ.get(
+                        'A2A_UI_EVENT_LOG_OVERFLOW_MAX_BYTES', 64 * 1024 * 1024
+                    )
+                ),
+            )
+        )
+        self._broker = EventBroker()
+        # Insertion ordered set of the messages being processed.
+        self._pending_message_ids: dict[str, None] = {}
+        # Turns of one conversation run one at a time, different
+        # conversations run concurrently.
+        self._conversation_locks = ConversationLocks()
+        # Restored conversations whose messages were not read yet.
+        self._unloaded_conversations: set[str] = set()
+        self._conversation_loads: dict[str, asyncio.Future] = {}
         self._agents: list[AgentCard] = []
         self._artifact_chunks: dict[str, list[Artifact]] = {}
-        self._session_service = InMemorySessionService()
-        self._artifact_service = InMemoryArtifactService()
+        if os.environ.get('A2A_UI_SESSION_STORE', '').lower() == 'journal':
+            self._session_service = JournalSessionService(
+                os.environ.get(
+                    'A2A_UI_SESSION_DIR', os.path.join(os.getcwd(), 'sessions')
+                )
+            )
+        else:
+            self._session_service = InMemorySessionService()
+        # File bytes are stored once per content on disk, messages
+        # reference them through artifact handles.
+        # Journaled conversations outlive the process, so do their blobs.
+        self._blob_store = BlobStore(
+            os.environ.get('A2A_UI_BLOB_DIR') or None,
+            max_bytes=int(
+                os.environ.get('A2A_UI_BLOB_QUOTA_BYTES', 1024 * 1024 * 1024)
+            ),
+            keep_existing=isinstance(
+                self._session_service, JournalSessionService
+            ),
+        )
+        self._artifact_service = BlobArtifactService(
+            blob_store=self._blob_store
+        )
+        self._artifact_handles = ArtifactHandles()
         self._memory_service = InMemoryMemoryService()
         self._http_client = http_client
-        self._host_agent = HostAgent([], http_client, self.task_callback)
+        self._card_cache = AgentCardCache(
+            http_client,
+            ttl_seconds=float(os.environ.get('A2A_UI_CARD_TTL', 300)),
+            timeout=float(os.environ.get('A2A_UI_CARD_TIMEOUT', 5)),
+        )
+        # Seconds between agent card probes feeding the circuit breakers.
+        self._probe_interval = float(
+            os.environ.get('A2A_UI_HEALTH_PROBE_INTERVAL', 30)
+        )
+        self._host_agent = HostAgent(
+            [],
+            http_client,
+            self.task_callback,
+            probe_interval=self._probe_interval,
+        )
         self._context_to_conversation: dict[str, str] = {}
         self._router = IntelligentAgentRouter()
+        # Requests routed with at least the threshold confidence skip the
+        # host LLM. 'keyword' scores with the IntelligentAgentRouter,
+        # 'semantic' with the embedding router.
+        fast_path_mode = os.environ.get('A2A_UI_ROUTER', '').lower()
+        if fast_path_mode not in ('keyword', 'semantic'):
+            fast_path_mode = ''
+        threshold = float(
+            os.environ.get(
+                'A2A_UI_ROUTER_THRESHOLD',
+                DEFAULT_THRESHOLD
+                if fast_path_mode == 'semantic'
+                else DEFAULT_CONFIDENCE_THRESHOLD,
+            )
+        )
+        self._fast_path_stats = FastPathStats(fast_path_mode, threshold)
+        self._semantic_router: SemanticAgentRouter | None = None
+        if fast_path_mode == 'semantic':
+            self._semantic_router = SemanticAgentRouter(
+                GenAIEmbedder()
+                if os.environ.get('A2A_UI_EMBEDDER', '').lower() == 'genai'
+                else HashingEmbedder(),
+                threshold=threshold,
+            )
         
         self.user_id = 'test_user'
         self.app_name = 'A2A'
@@ -198,6 +191,9 @@ class ADKHostManager(ApplicationManager):
         # Map to manage 'lost' message ids until protocol level id is introduced
         self._next_id: dict[str, str] = {}
         self.AGENTS_FILE = os.path.join(os.getcwd(), 'agents.json')
+        self.AGENT_VECTORS_FILE = os.path.join(
+            os.getcwd(), 'agents.vectors.npz'
+        )
         self._load_agents()
 
     def _initialize_host(self):
@@ -229,11 +225,25 @@ class ADKHostManager(ApplicationManager):
         else:
             self._agents = []
 
+    async def _load_agent_vectors(self):
+        """Embed the loaded agents, reusing the vectors saved last run"""
+        if not self._semantic_router:
+            return
+        try:
+            cached = self._semantic_router.load(self.AGENT_VECTORS_FILE)
+            for agent in self._agents:
+                await self._semantic_router.register_agent(agent, cached)
+            self._semantic_router.save(self.AGENT_VECTORS_FILE)
+        except Exception as e:
+            print(f"Error embedding agents from {self.AGENTS_FILE}: {e}")
+
     def _save_agents(self):
         """Save agents to file"""
         try:
             with open(self.AGENTS_FILE, 'w') as f:
                 json.dump([agent.dict() for agent in self._agents], f, indent=2)
+            if self._semantic_router:
+                self._semantic_router.save(self.AGENT_VECTORS_FILE)
         except Exception as e:
             print(f"Error saving agents to {self.AGENTS_FILE}: {e}")
 
@@ -243,25 +253,92 @@ class ADKHostManager(ApplicationManager):
         agent_urls = [agent.url for agent in self._agents]
         print(f"🔵 CANARY ASYNC_INIT: Agent URLs: {agent_urls}")
         
+        await self._host_agent.stop_health_probes()
         self._host_agent = HostAgent(
-            agent_urls,
+            [],
             self._http_client,
-            self.task_callback
+            self.task_callback,
+            probe_interval=self._probe_interval,
         )
-        
-        print(f"🔵 CANARY ASYNC_INIT: Initializing remote agents...")
-        try:
-            await self._host_agent.initialize_remote_agents()
-            print(f"🔵 CANARY ASYNC_INIT: Remote agents initialized successfully")
-        except Exception as e:
-            print(f"🔴 CANARY ASYNC_INIT FAIL: Error initializing remote agents: {e}")
-            import traceback
-            traceback.print_exc()
+
+        print(f"🔵 CANARY ASYNC_INIT: Fetching agent cards...")
+        cards = await self._card_cache.get_many(agent_urls)
+        for url, card in cards.items():
+            if isinstance(card, Exception):
+                print(f"🔴 CANARY ASYNC_INIT FAIL: Could not fetch card of {url}: {card!r}")
+            else:
+                self._host_agent.register_agent_card(card)
+        print(f"🔵 CANARY ASYNC_INIT: Connected to {len(self._host_agent.cards)} remote agents")
+        self._host_agent.start_health_probes()
+        await self._load_agent_vectors()
             
         print(f"🔵 CANARY ASYNC_INIT: Initializing host...")
         self._initialize_host()
+        await self._restore_conversations()
         print(f"🔵 CANARY ASYNC_INIT: Complete")
 
+    async def _restore_conversations(self):
+        """Lists the conversations persisted by a previous run.
+
+        Only the conversation ids are restored, the messages of a
+        conversation are read from its journal when it is first used.
+        """
+        if not isinstance(self._session_service, JournalSessionService):
+            return
+        session_ids = self._session_service.session_ids(
+            self.app_name, self.user_id
+        )
+        for session_id in session_ids:
+            if self._store.get_conversation(session_id):
+                continue
+            self._store.add_conversation(
+                Conversation(conversation_id=session_id, is_active=True)
+            )
+            self._unloaded_conversations.add(session_id)
+        # Blobs of conversations that were deleted or not journaled.
+        self._blob_store.retain(session_ids)
+        print(f"🔵 CANARY ASYNC_INIT: Restored {len(session_ids)} conversations")
+
+    async def load_conversation(
+        self, conversation_id: str | None
+    ) -> Conversation | None:
+        """A conversation with the messages of a restored session loaded"""
+        if conversation_id in self._unloaded_conversations:
+            loading = self._conversation_loads.get(conversation_id)
+            if loading is None:
+                loading = asyncio.ensure_future(
+                    self._load_messages(conversation_id)
+                )
+                self._conversation_loads[conversation_id] = loading
+            await loading
+        return self._store.get_conversation(conversation_id)
+
+    async def _load_messages(self, conversation_id: str):
+        try:
+            session = await self._session_service.get_session(
+                app_name=self.app_name,
+                user_id=self.user_id,
+                session_id=conversation_id,
+            )
+            conversation = self._store.get_conversation(conversation_id)
+            if not (session and conversation):
+                return
+            task_id = None
+            for event in session.events:
+                if event.actions.state_delta.get('task_id'):
+                    task_id = event.actions.state_delta['task_id']
+                if not (event.content and event.content.parts):
+                    continue
+                if event.author != 'user' and not event.is_final_response():
+                    continue
+                message = await self.adk_content_to_message(
+                    event.content, session.id, task_id
+                )
+                self._store.add_message(message, conversation)
+        finally:
+            self._unloaded_conversations.discard(conversation_id)
+            self._conversation_loads.pop(conversation_id, None)
+
     async def create_conversation(self) -> Conversation:
         """Create a new conversation"""
         session = await self._session_service.create_session(
@@ -269,15 +346,23 @@ class ADKHostManager(ApplicationManager):
         )
         conversation_id = session.id
         c = Conversation(conversation_id=conversation_id, is_active=True)
-        self._conversations.append(c)
+        self._store.add_conversation(c)
         return c
 
     async def delete_conversation(self, conversation_id: str) -> bool:
         """Delete a conversation"""
-        initial_len = len(self._conversations)
-        self._conversations = [c for c in self._conversations if c.conversation_id != conversation_id]
-        await self._session_service.delete_session(self.app_name, self.user_id, conversation_id)
-        return len(self._conversations) < initial_len
+        deleted = self._store.delete_conversation(conversation_id)
+        await self._session_service.delete_session(
+            app_name=self.app_name,
+            user_id=self.user_id,
+            session_id=conversation_id,
+        )
+        await self._artifact_service.forget_session(
+            self.app_name, self.user_id, conversation_id
+        )
+        self._artifact_handles.remove_session(conversation_id)
+        self._blob_store.release(conversation_id)
+        return deleted
 
     def update_api_key(self, api_key: str):
         """Update the API key and reinitialize if needed"""
@@ -300,13 +385,43 @@ class ADKHostManager(ApplicationManager):
                 return message
             if conversation.messages:
                 task_id = conversation.messages[-1].task_id
-                if task_id and task_still_open(
-                    next(filter(lambda x: x and x.id == task_id, self._tasks), None)
-                ):
+                if task_id and task_still_open(self._store.get_task(task_id)):
                     message.task_id = task_id
         return message
 
     async def process_message(self, message: Message):
+        """Process message with intelligent routing
+
+        Messages of one conversation are processed one at a time, in the
+        order they arrive, so their ADK session updates never interleave.
+        Task callbacks and the store writes between awaits run on the event
+        loop without awaiting, so they are atomic with respect to each other.
+        A message is pending from its arrival, including while it waits for
+        the turn before it.
+        """
+        message_id = message.message_id
+        if message_id:
+            self._pending_message_ids[message_id] = None
+            self._broker.publish(
+                'message', message.context_id, message_id=message_id, pending=True
+            )
+        try:
+            async with self._conversation_locks.hold(
+                message.context_id or message_id
+            ):
+                await self._process_message(message)
+        finally:
+            # A failed or cancelled turn must not leave its message pending.
+            if message_id in self._pending_message_ids:
+                del self._pending_message_ids[message_id]
+                self._broker.publish(
+                    'message',
+                    message.context_id,
+                    message_id=message_id,
+                    pending=False,
+                )
+
+    async def _process_message(self, message: Message):
         """Process message with intelligent routing - FULL CANARY LOGGING"""
         print(f"🔵 CANARY 1: Starting process_message for {message.message_id}")
         print(f"🔵 CANARY 1.1: Message context_id: {message.context_id}")
@@ -326,15 +441,13 @@ class ADKHostManager(ApplicationManager):
         
         print(f"🔵 CANARY 3: Setting up message processing")
         message_id = message.message_id
-        if message_id:
-            self._pending_message_ids.append(message_id)
-            print(f"🔵 CANARY 3.1: Added message {message_id} to pending list")
-        else:
+        if not message_id:
             print(f"🔴 CANARY 3.1 FAIL: No message_id found")
             
         context_id = message.context_id
         print(f"🔵 CANARY 3.2: Using context_id: {context_id}")
         
+        await self.load_conversation(context_id)
         conversation = self.get_conversation(context_id)
         if conversation:
             print(f"🔵 CANARY 3.3: Found conversation with {len(conversation.messages)} existing messages")
@@ -342,15 +455,11 @@ class ADKHostManager(ApplicationManager):
             print(f"🔴 CANARY 3.3 FAIL: No conversation found for context_id: {context_id}")
             print(f"🔵 CANARY 3.3.1: Creating new conversation for context_id: {context_id}")
             conversation = Conversation(conversation_id=context_id, is_active=True)
-            self._conversations.append(conversation)
-            print(f"🔵 CANARY 3.3.2: Created conversation. Total conversations: {len(self._conversations)}")
+            self._store.add_conversation(conversation)
+            print(f"🔵 CANARY 3.3.2: Created conversation. Total conversations: {len(self._store.conversations)}")
             
-        self._messages.append(message)
-        print(f"🔵 CANARY 3.4: Added message to global messages list (total: {len(self._messages)})")
-        
-        if conversation:
-            conversation.messages.append(message)
-            print(f"🔵 CANARY 3.5: Added message to conversation (total: {len(conversation.messages)})")
+        self._store.add_message(message, conversation)
+        print(f"🔵 CANARY 3.4: Added message to conversation (total: {len(conversation.messages)})")
             
         self.add_event(
             Event(
@@ -374,10 +483,8 @@ class ADKHostManager(ApplicationManager):
         
         # Add processing response to messages and conversation
         print(f"🔵 CANARY 3.8: Adding processing response to messages list")
-        self._messages.append(processing_response)
-        if conversation:
-            conversation.messages.append(processing_response)
-            print(f"🔵 CANARY 3.9: Added processing response to conversation (total: {len(conversation.messages)})")
+        self._store.add_message(processing_response, conversation)
+        print(f"🔵 CANARY 3.9: Added processing response to conversation (total: {len(conversation.messages)})")
             
         # Add processing event
         print(f"🔵 CANARY 3.10: Adding processing event")
@@ -442,6 +549,53 @@ class ADKHostManager(ApplicationManager):
         except Exception as e:
             print(f"🔴 CANARY 4.4 FAIL: Error appending event to session: {e}")
 
+        response: Message | None = None
+        routed_agent = await self._fast_route(message_text)
+        if routed_agent:
+            print(f"🔵 CANARY 5: Routing directly to {routed_agent}")
+            started = time.perf_counter()
+            response = await self._delegate_directly(
+                routed_agent, message, session, context_id, task_id
+            )
+            if response is None:
+                self._fast_path_stats.record_fallback()
+            else:
+                saved = self._fast_path_stats.record_direct(
+                    time.perf_counter() - started
+                )
+                print(f"🔵 CANARY 5: Fast path saved ~{saved:.2f}s, hit rate {self._fast_path_stats.hit_rate:.0%}")
+        if response is None:
+            started = time.perf_counter()
+            response = await self._run_host_agent(
+                message, session, context_id, task_id
+            )
+            self._fast_path_stats.record_host(time.perf_counter() - started)
+
+        if response:
+            self._store.add_message(response, conversation)
+            print(f"🔵 CANARY 6.6: Response added to conversation (total: {len(conversation.messages)})")
+        else:
+            print(f"🔴 CANARY 6.6 FAIL: Conversation exists but no response to add")
+            
+        if message_id and message_id in self._pending_message_ids:
+            del self._pending_message_ids[message_id]
+            self._broker.publish(
+                'message', context_id, message_id=message_id, pending=False
+            )
+            print(f"🔵 CANARY 6.7: Removed message {message_id} from pending list")
+        else:
+            print(f"🔴 CANARY 6.7 FAIL: Message {message_id} not in pending list")
+            
+        print(f"🔵 CANARY 7: process_message completed for {message.message_id}")
+
+    async def _run_host_agent(
+        self,
+        message: Message,
+        session,
+        context_id: str | None,
+        task_id: str | None,
+    ) -> Message | None:
+        """Let the host LLM handle the message and return its final response"""
         # Process message through ADK runner (original working implementation)
         print(f"🔵 CANARY 5: Starting ADK runner processing")
         final_event = None
@@ -518,45 +672,181 @@ class ADKHostManager(ApplicationManager):
                     final_event.content, context_id, task_id
                 )
                 print(f"🔵 CANARY 6.4: Response message created with {len(response.parts)} parts")
-                self._messages.append(response)
-                print(f"🔵 CANARY 6.5: Response added to global messages (total: {len(self._messages)})")
             except Exception as e:
                 print(f"🔴 CANARY 6.4 FAIL: Error creating response message: {e}")
         else:
             print(f"🔴 CANARY 6.1 FAIL: No final event received from ADK runner")
+        return response
 
-        if conversation and response:
-            conversation.messages.append(response)
-            print(f"🔵 CANARY 6.6: Response added to conversation (total: {len(conversation.messages)})")
-        elif conversation:
-            print(f"🔴 CANARY 6.6 FAIL: Conversation exists but no response to add")
-        elif response:
-            print(f"🔴 CANARY 6.6 FAIL: Response exists but no conversation found")
+    async def _fast_route(self, message_text: str) -> str | None:
+        """Name of the agent to delegate to without the host LLM, if confident"""
+        mode = self._fast_path_stats.mode
+        if not mode or not message_text:
+            return None
+        try:
+            if mode == 'semantic':
+                matches = await self._semantic_router.top_k(message_text, 1)
+                url, confidence = matches[0] if matches else (None, 0.0)
+            else:
+                url, confidence = self._router.route_with_confidence(
+                    message_text
+                )
+        except Exception as e:
+            print(f"🔴 Fast path routing failed, using host agent: {e}")
+            return None
+        if not url or confidence < self._fast_path_stats.threshold:
+            return None
+        card = self._router.get_agent_info(url)
+        if not card:
+            return None
+        connection = self._host_agent.remote_agent_connections.get(card.name)
+        # An agent with an open circuit is left to the host LLM, which can
+        # pick another one.
+        if connection and (
+            not connection.health or connection.health.state != OPEN
+        ):
+            return card.name
+        return None
+
+    async def _delegate_directly(
+        self,
+        agent_name: str,
+        message: Message,
+        session,
+        context_id: str | None,
+        task_id: str | None,
+    ) -> Message | None:
+        """Send the message straight to a remote agent, bypassing the host LLM
+
+        The exchange is recorded in the ADK session the way the host LLM
+        records a delegation: a send_message call, its response and the
+        final answer, so later turns see it as its own. Returns None if the
+        agent could not be reached.
+        """
+        connection = self._host_agent.remote_agent_connections[agent_name]
+        request = Message(
+            role=Role.user,
+            parts=message.parts,
+            message_id=message.message_id,
+            context_id=context_id,
+            task_id=task_id,
+        )
+        try:
+            result = await connection.send_message(request)
+        except Exception as e:
+            print(f"🔴 Direct delegation to {agent_name} failed, using host agent: {e}")
+            return None
+        if result is None:
+            print(f"🔴 {agent_name} sent no response, using host agent")
+            return None
+        if isinstance(result, Message):
+            parts = list(result.parts)
         else:
-            print(f"🔴 CANARY 6.6 FAIL: Neither conversation nor response found")
-            
-        if message_id and message_id in self._pending_message_ids:
-            self._pending_message_ids.remove(message_id)
-            print(f"🔵 CANARY 6.7: Removed message {message_id} from pending list")
+            task_id = result.id
+            parts = list(result.status.message.parts) if result.status.message else []
+            for artifact in result.artifacts or []:
+                parts.extend(artifact.parts)
+        prefix = agent_response_prefix(agent_name)
+        if parts and parts[0].root.kind == 'text':
+            parts[0] = Part(root=TextPart(text=prefix + parts[0].root.text))
         else:
-            print(f"🔴 CANARY 6.7 FAIL: Message {message_id} not in pending list")
-            
-        print(f"🔵 CANARY 7: process_message completed for {message.message_id}")
+            parts.insert(0, Part(root=TextPart(text=prefix)))
+        response = Message(
+            role=Role.agent,
+            parts=parts,
+            message_id=str(uuid.uuid4()),
+            context_id=context_id,
+            task_id=task_id,
+        )
+        self.add_event(
+            Event(
+                id=str(uuid.uuid4()),
+                actor=agent_name,
+                content=response,
+                timestamp=datetime.datetime.utcnow().timestamp(),
+            )
+        )
+        response_content = self.adk_content_from_message(response)
+        response_content.role = 'model'
+        invocation_id = ADKEvent.new_id()
+        call_id = f'adk-{uuid.uuid4()}'
+        request_text = '\n'.join(
+            p.root.text for p in message.parts if p.root.kind == 'text'
+        )
+        result = [p.text for p in response_content.parts if p.text]
+        try:
+            for author, content, state_delta in [
+                ('user', self.adk_content_from_message(message), None),
+                (
+                    'host_agent',
+                    types.Content(
+                        role='model',
+                        parts=[
+                            types.Part(
+                                function_call=types.FunctionCall(
+                                    id=call_id,
+                                    name='send_message',
+                                    args={
+                                        'agent_name': agent_name,
+                                        'message': request_text,
+                                    },
+                                )
+                            )
+                        ],
+                    ),
+                    None,
+                ),
+                (
+                    'host_agent',
+                    types.Content(
+                        role='user',
+                        parts=[
+                            types.Part(
+                                function_response=types.FunctionResponse(
+                                    id=call_id,
+                                    name='send_message',
+                                    response={'result': result},
+                                )
+                            )
+                        ],
+                    ),
+                    {'agent': agent_name, 'task_id': task_id},
+                ),
+                ('host_agent', response_content, None),
+            ]:
+                await self._session_service.append_event(
+                    session,
+                    ADKEvent(
+                        author=author,
+                        invocation_id=invocation_id,
+                        content=content,
+                        actions=ADKEventActions(state_delta=state_delta or {}),
+                    ),
+                )
+        except Exception as e:
+            print(f"🔴 Error recording direct delegation in session: {e}")
+        return response
 
     async def register_agent(self, url):
-        """Register a new agent"""
+        """Register a new agent
+
+        Only the new agent's connection is added to the running host agent,
+        the other agents and the runner are left untouched.
+        """
         try:
-            agent_data = get_agent_card(url)
+            agent_data = await self._card_cache.get(url, force=True)
             if not agent_data.url:
                 agent_data.url = url
-                
+            self._remove_agent(agent_data.url)
+
             self._agents.append(agent_data)
             self._router.register_agent(agent_data)
+            if self._semantic_router:
+                await self._semantic_router.register_agent(agent_data)
             self._host_agent.register_agent_card(agent_data)
             
             print(f"Registered agent: {agent_data.name} at {agent_data.url}")
             self._save_agents()
-            await self.async_init()
             
         except Exception as e:
             print(f"Failed to register agent at {url}: {e}")
@@ -564,35 +854,50 @@ class ADKHostManager(ApplicationManager):
 
     async def unregister_agent(self, url: str) -> bool:
         """Unregister an agent"""
-        initial_len = len(self._agents)
+        if not self._remove_agent(url):
+            return False
+        self._card_cache.invalidate(url)
+        self._save_agents()
+        return True
+
+    def _remove_agent(self, url: str) -> bool:
+        removed = [agent for agent in self._agents if agent.url == url]
+        if not removed:
+            return False
         self._agents = [agent for agent in self._agents if agent.url != url]
-        
-        if len(self._agents) < initial_len:
-            # Rebuild router with remaining agents
-            self._router = IntelligentAgentRouter()
-            for agent in self._agents:
-                self._router.register_agent(agent)
-                
-            self._save_agents()
-            await self.async_init()
-            return True
-        return False
+        self._router.unregister_agent(url)
+        if self._semantic_router:
+            self._semantic_router.unregister_agent(url)
+        for agent in removed:
+            self._host_agent.unregister_agent_card(agent.name)
+        return True
 
     # Task management methods (keeping existing implementation)
     def add_task(self, task: Task):
-        self._tasks.append(task)
+        self._store.add_task(task)
 
     def update_task(self, task: Task):
-        for i, t in enumerate(self._tasks):
-            if t.id == task.id:
-                self._tasks[i] = task
-                return
+        self._store.update_task(task)
 
     def task_callback(self, task: TaskCallbackArg, agent_card: AgentCard):
-        """Handle task callbacks"""
-        print(f"Task callback received: {task.id}")
+        """Handle task callbacks
+
+        Called for every streamed update of a remote task while it runs, so
+        progress is visible in the UI before the task finishes.
+        """
+        task_id = task.id if isinstance(task, Task) else task.task_id
+        print(f"Task callback received: {task_id}")
         self.emit_event(task, agent_card)
-        
+        current_task = self._apply_task_update(task)
+        self._broker.publish(
+            'task',
+            current_task.context_id,
+            task_id=current_task.id,
+            state=current_task.status.state.value,
+        )
+        return current_task
+
+    def _apply_task_update(self, task: TaskCallbackArg) -> Task:
         if isinstance(task, TaskStatusUpdateEvent):
             current_task = self.add_or_get_task(task)
             current_task.status = task.status
@@ -607,7 +912,11 @@ class ADKHostManager(ApplicationManager):
             self.update_task(current_task)
             return current_task
             
-        if not any(filter(lambda x: x and x.id == task.id, self._tasks)):
+        # The host sends remote agents the user's message id, so mapping
+        # the history lets pending messages show the task's progress.
+        for message in task.history or []:
+            self.attach_message_to_task(message, task.id)
+        if not self._store.get_task(task.id):
             self.attach_message_to_task(task.status.message, task.id)
             self.add_task(task)
             return task
@@ -701,9 +1010,7 @@ class ADKHostManager(ApplicationManager):
             task_id = event.task_id
         if not task_id:
             task_id = str(uuid.uuid4())
-        current_task = next(
-            filter(lambda x: x.id == task_id, self._tasks), None
-        )
+        current_task = self._store.get_task(task_id)
         if not current_task:
             context_id = event.context_id
             current_task = Task(
@@ -744,8 +1051,15 @@ class ADKHostManager(ApplicationManager):
 
     def add_event(self, event: Event):
         print(f"🔵 CANARY EVENT: Adding event {event.id} from {event.actor}")
-        self._events[event.id] = event
-        print(f"🔵 CANARY EVENT: Total events now: {len(self._events)}")
+        self._store.add_event(event)
+        self._broker.publish(
+            'event',
+            event.content.context_id,
+            event_id=event.id,
+            actor=event.actor,
+            timestamp=event.timestamp,
+        )
+        print(f"🔵 CANARY EVENT: Total events now: {len(self._store.events)}")
 
     def get_conversation(self, conversation_id: str | None) -> Conversation | None:
         print(f"🔵 CANARY CONV: Looking for conversation {conversation_id}")
@@ -753,18 +1067,12 @@ class ADKHostManager(ApplicationManager):
             print(f"🔴 CANARY CONV FAIL: No conversation_id provided")
             return None
         
-        conversation = next(
-            filter(
-                lambda c: c and c.conversation_id == conversation_id,
-                self._conversations,
-            ),
-            None,
-        )
+        conversation = self._store.get_conversation(conversation_id)
         
         if conversation:
             print(f"🔵 CANARY CONV: Found conversation {conversation_id} with {len(conversation.messages)} messages")
         else:
-            print(f"🔴 CANARY CONV FAIL: Conversation {conversation_id} not found. Available: {[c.conversation_id for c in self._conversations]}")
+            print(f"🔴 CANARY CONV FAIL: Conversation {conversation_id} not found")
             
         return conversation
 
@@ -772,10 +1080,7 @@ class ADKHostManager(ApplicationManager):
         rval = []
         for message_id in self._pending_message_ids:
             if message_id in self._task_map:
-                task_id = self._task_map[message_id]
-                task = next(
-                    filter(lambda x: x.id == task_id, self._tasks), None
-                )
+                task = self._store.get_task(self._task_map[message_id])
                 if not task:
                     rval.append((message_id, ''))
                 elif task.history and task.history[-1].parts:
@@ -795,22 +1100,50 @@ class ADKHostManager(ApplicationManager):
                 rval.append((message_id, ''))
         return rval
 
+    async def close(self):
+        await self._host_agent.stop_health_probes()
+        if isinstance(self._session_service, JournalSessionService):
+            await self._session_service.close()
+        self._blob_store.close()
+        await super().close()
+
     # Properties
+    @property
+    def store(self) -> ConversationStore:
+        return self._store
+
+    @property
+    def broker(self) -> EventBroker:
+        return self._broker
+
+    @property
+    def fast_path_stats(self) -> FastPathStats:
+        return self._fast_path_stats
+
+    @property
+    def blob_store(self) -> BlobStore:
+        return self._blob_store
+
+    @property
+    def agent_health(self) -> dict[str, dict]:
+        return self._host_agent.agent_health()
+
     @property
     def agents(self) -> list[AgentCard]:
         return self._agents
 
     @property
     def conversations(self) -> list[Conversation]:
-        return self._conversations
+        return self._store.conversations
 
     @property
     def tasks(self) -> list[Task]:
-        return self._tasks
+        return self._store.tasks
 
     @property
     def events(self) -> list[Event]:
-        return sorted(self._events.values(), key=lambda x: x.timestamp)
+        # Arrival order; use store.query_events for filtered or paged reads.
+        return self._store.events
 
     # Content conversion methods (keeping existing implementation)
     def adk_content_from_message(self, message: Message) -> types.Content:
@@ -833,7 +1166,7 @@ class ADKHostManager(ApplicationManager):
                 else:
                     parts.append(
                         types.Part.from_bytes(
-                            data=part.file.bytes.encode('utf-8'),
+                            data=base64.b64decode(part.file.bytes),
                             mime_type=part.file.mime_type,
                         )
                     )
@@ -862,16 +1195,7 @@ class ADKHostManager(ApplicationManager):
                 except:
                     parts.append(Part(root=TextPart(text=part.text)))
             elif part.inline_data:
-                parts.append(
-                    Part(
-                        root=FilePart(
-                            file=FileWithBytes(
-                                bytes=part.inline_data.decode('utf-8'),
-                                mime_type=part.file_data.mime_type,
-                            ),
-                        )
-                    )
-                )
+                parts.append(await self._inline_data_part(part, context_id))
             elif part.file_data:
                 parts.append(
                     Part(
@@ -928,25 +1252,12 @@ class ADKHostManager(ApplicationManager):
                         parts.append(Part(root=DataPart(data=p)))
                 elif isinstance(p, DataPart):
                     if 'artifact-file-id' in p.data:
-                        file_part = await self._artifact_service.load_artifact(
-                            user_id=self.user_id,
-                            session_id=context_id,
-                            app_name=self.app_name,
-                            filename=p.data['artifact-file-id'],
-                        )
-                        file_data = file_part.inline_data
-                        base64_data = base64.b64encode(file_data.data).decode(
-                            'utf-8'
-                        )
                         parts.append(
-                            Part(
-                                root=FilePart(
-                                    file=FileWithBytes(
-                                        bytes=base64_data,
-                                        mime_type=file_data.mime_type,
-                                        name='artifact_file',
-                                    )
-                                )
+                            await self._artifact_file_part(
+                                context_id,
+                                p.data['artifact-file-id'],
+                                p.data.get('artifact-version'),
+                                p.data.get('mime-type'),
                             )
                         )
                     else:
@@ -960,14 +1271,75 @@ class ADKHostManager(ApplicationManager):
             )
         return parts
 
-    def process_message_threadsafe(
-        self, message: Message, loop: asyncio.AbstractEventLoop
-    ):
-        """Safely run process_message from a thread using the given event loop."""
-        future = asyncio.run_coroutine_threadsafe(
-            self.process_message(message), loop
+
+    async def _artifact_file_part(
+        self,
+        session_id: str | None,
+        filename: str,
+        version: int | None,
+        mime_type: str | None,
+    ) -> Part:
+        """A file part referencing an artifact, without loading its bytes"""
+        if version is None or not mime_type:
+            # Saved without the handle details, look them up.
+            artifact_version = await self._artifact_service.get_artifact_version(
+                app_name=self.app_name,
+                user_id=self.user_id,
+                session_id=session_id,
+                filename=filename,
+                version=version,
+            )
+            if artifact_version:
+                version = artifact_version.version
+                mime_type = mime_type or artifact_version.mime_type
+        handle = self._artifact_handles.add(
+            session_id or '', filename, version, mime_type or ''
         )
-        return future
+        return Part(
+            root=FilePart(
+                file=FileWithUri(
+                    uri=handle.uri,
+                    mime_type=handle.mime_type,
+                    name=filename,
+                )
+            )
+        )
+
+    async def _inline_data_part(
+        self, part: types.Part, session_id: str | None
+    ) -> Part:
+        """Stores inline model output as an artifact and references it"""
+        blob = part.inline_data
+        filename = blob.display_name or f'inline-{uuid.uuid4()}'
+        try:
+            version = await self._artifact_service.save_artifact(
+                app_name=self.app_name,
+                user_id=self.user_id,
+                session_id=session_id,
+                filename=filename,
+                artifact=part,
+            )
+        except BlobQuotaError as e:
+            return Part(root=TextPart(text=f'[{filename} not stored: {e}]'))
+        return await self._artifact_file_part(
+            session_id, filename, version, blob.mime_type
+        )
+
+    async def load_file(self, file_id: str) -> CachedFile | None:
+        """An artifact handle or blob digest, served from the blob store"""
+        handle = self._artifact_handles.get(file_id)
+        if handle is None:
+            return self._blob_store.file(file_id)
+        digest = await self._artifact_service.get_blob_digest(
+            self.app_name,
+            self.user_id,
+            handle.filename,
+            handle.session_id or None,
+            handle.version,
+        )
+        if digest is None:
+            return None
+        return self._blob_store.file(digest, handle.mime_type)
 
 
 def get_message_id(m: Message | None) -> str | None:
@@ -0,0 +1,281 @@
+import re
+
+from a2a.types import AgentCard
+
+
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'can', 'that', 'this', 'these',
+    'those',
+})  # fmt: skip
+
+KEYWORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#]*')
+
+# Agents scoring below this never win the routing.
+MIN_ROUTE_SCORE = 0.1
+# Score at which a match alone counts as fully confident, roughly two strong
+# keyword or pattern hits.
+CONFIDENT_SCORE = 2.0
+# Confidence needed before the host LLM is skipped, see route_with_confidence.
+DEFAULT_CONFIDENCE_THRESHOLD = 0.6
+
+CODER_PATTERNS = [
+    (r'\b(code|coding|program|script|function|debug|execute|run)\b', 1.0),
+    (r'\b(python|javascript|java|c\+\+|html|css|sql)\b', 0.95),
+    (r'\b(write.*code|create.*script|fix.*bug|implement)\b', 0.9),
+]
+VIDEO_PATTERNS = [
+    (r'\b(video|generate.*video|create.*video|veo)\b', 1.0),
+    (r'\b(animation|clip|movie|footage|visual)\b', 0.8),
+    (r'\b(generate.*from.*prompt|text.*to.*video)\b', 0.95),
+]
+
+
+class _Hit:
+    """Aggregated weight of one keyword or phrase for one agent."""
+
+    __slots__ = ('agent_url', 'weight', 'count')
+
+    def __init__(self, agent_url: str):
+        self.agent_url = agent_url
+        self.weight = 0.0
+        self.count = 0
+
+
+class IntelligentAgentRouter:
+    """Fast, reliable agent routing system that matches requests to the best agent
+
+    All matching structures are built once in register_agent:
+
+    - an inverted index from token to the agents whose keywords contain it,
+    - an index of multi word keywords (tags) by their first token,
+    - one compiled regex per distinct set of regex patterns, evaluating all
+      patterns of the set in a single match and shared by every agent that
+      uses the set.
+
+    Routing a message tokenizes it once, runs each regex once and only
+    touches the agents whose keywords or patterns occur in it.
+    Keywords match whole tokens, so "run" does not match "brunch".
+    """
+
+    def __init__(self):
+        self.agent_patterns: dict[str, list[tuple[str, float]]] = {}
+        self.agent_capabilities: dict[str, AgentCard] = {}
+        self.fallback_agent: str | None = None
+        self._keyword_index: dict[str, dict[str, _Hit]] = {}
+        # First token -> remaining tokens -> agent url -> hit.
+        self._phrase_index: dict[
+            str, dict[tuple[str, ...], dict[str, _Hit]]
+        ] = {}
+        # Pattern set -> (compiled regex, weights, agent urls using it).
+        self._regex_sets: dict[
+            tuple[tuple[str, float], ...],
+            tuple[re.Pattern, list[float], dict[str, None]],
+        ] = {}
+
+    def register_agent(self, agent_card: AgentCard):
+        """Register an agent and build routing patterns"""
+        url = agent_card.url
+        if url in self.agent_patterns:
+            self.unregister_agent(url)
+        self.agent_capabilities[url] = agent_card
+
+        keywords: list[tuple[str, float]] = []
+        for skill in agent_card.skills:
+            # High priority patterns from skill name and description
+            for keyword in self._extract_keywords(
+                skill.name + ' ' + skill.description
+            ):
+                keywords.append((keyword, 0.9))
+            # Medium priority patterns from tags
+            for tag in skill.tags:
+                keywords.append((tag.lower(), 0.7))
+            # High priority patterns from examples
+            for example in skill.examples or []:
+                for keyword in self._extract_keywords(example):
+                    keywords.append((keyword, 0.8))
+
+        # Add agent-specific patterns
+        regexes: list[tuple[str, float]] = []
+        name = agent_card.name.lower()
+        if 'coder' in name or 'code' in agent_card.description.lower():
+            regexes = CODER_PATTERNS
+        elif 'video' in name or 'veo' in name:
+            regexes = VIDEO_PATTERNS
+
+        self.agent_patterns[url] = keywords + regexes
+        for keyword, weight in keywords:
+            self._index_keyword(url, keyword, weight)
+        if regexes:
+            key = tuple(regexes)
+            if key not in self._regex_sets:
+                self._regex_sets[key] = (*_compile_patterns(regexes), {})
+            self._regex_sets[key][2][url] = None
+
+        # Set fallback agent (prefer coder agent as general purpose)
+        if 'coder' in name and not self.fallback_agent:
+            self.fallback_agent = url
+
+    def unregister_agent(self, url: str):
+        """Remove an agent and its entries from all indexes"""
+        self.agent_patterns.pop(url, None)
+        self.agent_capabilities.pop(url, None)
+        for key in list(self._regex_sets):
+            urls = self._regex_sets[key][2]
+            urls.pop(url, None)
+            if not urls:
+                del self._regex_sets[key]
+        for token in list(self._keyword_index):
+            hits = self._keyword_index[token]
+            hits.pop(url, None)
+            if not hits:
+                del self._keyword_index[token]
+        for first in list(self._phrase_index):
+            phrases = self._phrase_index[first]
+            for rest in list(phrases):
+                phrases[rest].pop(url, None)
+                if not phrases[rest]:
+                    del phrases[rest]
+            if not phrases:
+                del self._phrase_index[first]
+        if self.fallback_agent == url:
+            self.fallback_agent = next(
+                (
+                    u
+                    for u, card in self.agent_capabilities.items()
+                    if 'coder' in card.name.lower()
+                ),
+                None,
+            )
+
+    def _index_keyword(self, url: str, keyword: str, weight: float):
+        tokens = TOKEN_RE.findall(keyword)
+        if not tokens:
+            return
+        if len(tokens) == 1:
+            hits = self._keyword_index.setdefault(tokens[0], {})
+        else:
+            hits = self._phrase_index.setdefault(tokens[0], {}).setdefault(
+                tuple(tokens[1:]), {}
+            )
+        hit = hits.get(url)
+        if hit is None:
+            hit = hits[url] = _Hit(url)
+        hit.weight += weight
+        hit.count += 1
+
+    def _extract_keywords(self, text: str) -> list[str]:
+        """Extract meaningful keywords from text"""
+        # Extract words (3+ characters, not stop words)
+        words = KEYWORD_RE.findall(text.lower())
+        return [word for word in words if word not in STOP_WORDS]
+
+    def score_agents(self, message_text: str) -> dict[str, float]:
+        """Scores every agent with at least one matching pattern"""
+        message_lower = message_text.lower()
+        tokens = TOKEN_RE.findall(message_lower)
+        scores: dict[str, float] = {}
+        matches: dict[str, int] = {}
+
+        def add(hits):
+            for hit in hits.values():
+                scores[hit.agent_url] = (
+                    scores.get(hit.agent_url, 0.0) + hit.weight
+                )
+                matches[hit.agent_url] = (
+                    matches.get(hit.agent_url, 0) + hit.count
+                )
+
+        for token in set(tokens):
+            hits = self._keyword_index.get(token)
+            if hits:
+                add(hits)
+        if self._phrase_index:
+            matched_phrases = set()
+            for i, token in enumerate(tokens):
+                for rest, hits in self._phrase_index.get(token, {}).items():
+                    key = (token, rest)
+                    if key in matched_phrases:
+                        continue
+                    if tuple(tokens[i + 1 : i + 1 + len(rest)]) == rest:
+                        matched_phrases.add(key)
+                        add(hits)
+
+        for regex, weights, urls in self._regex_sets.values():
+            match = regex.match(message_lower)
+            score = 0.0
+            count = 0
+            for i, weight in enumerate(weights):
+                if match.group(f'p{i}') is not None:
+                    score += weight
+                    count += 1
+            if count:
+                for url in urls:
+                    scores[url] = scores.get(url, 0.0) + score
+                    matches[url] = matches.get(url, 0) + count
+
+        # Normalize score by number of patterns to avoid bias toward agents
+        # with more patterns
+        return {
+            url: score / len(self.agent_patterns[url]) * matches[url]
+            for url, score in scores.items()
+        }
+
+    def route_message(self, message_text: str) -> str | None:
+        """Route message to best agent based on content analysis"""
+        if not message_text or not self.agent_patterns:
+            return self.fallback_agent
+        agent_scores = self.score_agents(message_text)
+        # Return agent with highest score, or fallback if no matches
+        if agent_scores:
+            best_agent = max(agent_scores.items(), key=lambda x: x[1])
+            if best_agent[1] > MIN_ROUTE_SCORE:
+                return best_agent[0]
+        return self.fallback_agent
+
+    def route_with_confidence(
+        self, message_text: str
+    ) -> tuple[str | None, float]:
+        """Best agent for the message and a confidence between 0 and 1.
+
+        The confidence grows with the best score, up to CONFIDENT_SCORE, and
+        shrinks with the share of the runner up, so a message that matches
+        two agents equally well has no confidence at all. The fallback agent
+        is never returned.
+        """
+        if not message_text:
+            return None, 0.0
+        scores = sorted(
+            self.score_agents(message_text).items(),
+            key=lambda x: x[1],
+            reverse=True,
+        )
+        if not scores or scores[0][1] <= MIN_ROUTE_SCORE:
+            return None, 0.0
+        best_url, best = scores[0]
+        runner_up = scores[1][1] if len(scores) > 1 else 0.0
+        confidence = min(best / CONFIDENT_SCORE, 1.0) * (1 - runner_up / best)
+        return best_url, confidence
+
+    def get_agent_info(self, agent_url: str) -> AgentCard | None:
+        """Get agent card for a given URL"""
+        return self.agent_capabilities.get(agent_url)
+
+
+def _compile_patterns(
+    patterns: list[tuple[str, float]],
+) -> tuple[re.Pattern, list[float]]:
+    """Compiles patterns into one regex that always matches at position 0.
+
+    Each pattern becomes an optional lookahead with its own named group, so
+    a single match call searches the whole text for every pattern
+    independently and group p<i> is set iff pattern i occurs.
+    """
+    lookaheads = ''.join(
+        f'(?=(?:[\\s\\S]*?(?P<p{i}>{pattern}))?)'
+        for i, (pattern, _) in enumerate(patterns)
+    )
+    return re.compile(lookaheads), [w for _, w in patterns]
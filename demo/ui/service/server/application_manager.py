@@ -2,6 +2,11 @@ from abc import ABC, abstractmethod
 
 from a2a.types import AgentCard, Message, Task
 
+from demo.ui.service.server.blob_store import BlobStore
+from demo.ui.service.server.conversation_store import ConversationStore
+from demo.ui.service.server.event_broker import EventBroker
+from demo.ui.service.server.file_cache import CachedFile
+from demo.ui.service.server.routing_stats import FastPathStats
 from demo.ui.service.types import Conversation, Event
 
 
@@ -36,6 +41,46 @@ class ApplicationManager(ABC):
     ) -> Conversation | None:
         pass
 
+    async def load_conversation(
+        self, conversation_id: str | None
+    ) -> Conversation | None:
+        """A conversation with all its messages, loading them if needed"""
+        return self.get_conversation(conversation_id)
+
+    async def load_file(self, file_id: str) -> CachedFile | None:
+        """A file referenced by id, if the manager holds it"""
+        return None
+
+    @property
+    def blob_store(self) -> BlobStore | None:
+        """Shared content addressed file store, if the manager has one"""
+        return None
+
+    async def close(self):
+        """Stops background work, called when the server shuts down"""
+        self.store.event_log.close()
+
+    @property
+    @abstractmethod
+    def store(self) -> ConversationStore:
+        pass
+
+    @property
+    @abstractmethod
+    def broker(self) -> EventBroker:
+        pass
+
+    @property
+    @abstractmethod
+    def fast_path_stats(self) -> FastPathStats:
+        pass
+
+    @property
+    @abstractmethod
+    def agent_health(self) -> dict[str, dict]:
+        """Health summary of each remote agent, by agent name"""
+        pass
+
     @property
     @abstractmethod
     def conversations(self) -> list[Conversation]:
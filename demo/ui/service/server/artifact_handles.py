@@ -0,0 +1,71 @@
+import dataclasses
+import hashlib
+
+
+# Route the ConversationServer serves file contents from.
+FILE_ROUTE = '/message/file'
+
+
+@dataclasses.dataclass(frozen=True)
+class ArtifactHandle:
+    """Reference to file bytes held by the ADK artifact service.
+
+    Messages carry the handle's uri instead of the bytes, which are read
+    from the artifact service only when the file endpoint serves them.
+    """
+
+    handle_id: str
+    session_id: str
+    filename: str
+    version: int | None
+    mime_type: str
+
+    @property
+    def uri(self) -> str:
+        return f'{FILE_ROUTE}/{self.handle_id}'
+
+
+class ArtifactHandles:
+    """Registry of the artifact handles given out in messages."""
+
+    def __init__(self):
+        self._handles: dict[str, ArtifactHandle] = {}
+
+    def add(
+        self,
+        session_id: str,
+        filename: str,
+        version: int | None,
+        mime_type: str,
+    ) -> ArtifactHandle:
+        """Handle of an artifact version, the same one for repeated calls."""
+        key = f'{session_id}\0{filename}\0{version}'
+        handle_id = hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+        handle = self._handles.get(handle_id)
+        if handle is None:
+            handle = ArtifactHandle(
+                handle_id=handle_id,
+                session_id=session_id,
+                filename=filename,
+                version=version,
+                mime_type=mime_type or 'application/octet-stream',
+            )
+            self._handles[handle_id] = handle
+        return handle
+
+    def get(self, handle_id: str) -> ArtifactHandle | None:
+        return self._handles.get(handle_id)
+
+    def remove_session(self, session_id: str) -> int:
+        """Forgets the handles of a deleted conversation."""
+        stale = [
+            handle_id
+            for handle_id, handle in self._handles.items()
+            if handle.session_id == session_id
+        ]
+        for handle_id in stale:
+            del self._handles[handle_id]
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._handles)
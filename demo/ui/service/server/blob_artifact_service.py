@@ -0,0 +1,144 @@
+import asyncio
+
+from typing import Any, Optional, Union
+
+from google.adk.artifacts.base_artifact_service import ensure_part
+from google.adk.artifacts.in_memory_artifact_service import (
+    InMemoryArtifactService,
+)
+from google.genai import types
+from pydantic import ConfigDict
+
+from demo.ui.service.server.blob_store import BlobStore
+
+
+BLOB_URI_PREFIX = 'blob://'
+
+
+class BlobArtifactService(InMemoryArtifactService):
+    """Artifact service keeping the bytes of binary artifacts in a BlobStore.
+
+    Inline data is stored once per distinct content, owned by the session it
+    was saved in (or by the user, for user scoped artifacts), and the
+    version index only holds a reference to it. Loading an artifact reads
+    its bytes back from disk.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    blob_store: BlobStore
+
+    async def save_artifact(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        filename: str,
+        artifact: Union[types.Part, dict[str, Any]],
+        session_id: Optional[str] = None,
+        custom_metadata: Optional[dict[str, Any]] = None,
+    ) -> int:
+        artifact = ensure_part(artifact)
+        blob = artifact.inline_data
+        if blob is not None and blob.data is not None:
+            # Hashing and writing large media would stall the event loop.
+            digest = await asyncio.to_thread(
+                self.blob_store.put,
+                blob.data,
+                blob.mime_type,
+                session_id or f'user:{user_id}',
+            )
+            artifact = types.Part(
+                file_data=types.FileData(
+                    file_uri=f'{BLOB_URI_PREFIX}{digest}',
+                    mime_type=blob.mime_type,
+                    display_name=blob.display_name,
+                )
+            )
+        return await super().save_artifact(
+            app_name=app_name,
+            user_id=user_id,
+            filename=filename,
+            artifact=artifact,
+            session_id=session_id,
+            custom_metadata=custom_metadata,
+        )
+
+    async def load_artifact(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        filename: str,
+        session_id: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> Optional[types.Part]:
+        artifact = await super().load_artifact(
+            app_name=app_name,
+            user_id=user_id,
+            filename=filename,
+            session_id=session_id,
+            version=version,
+        )
+        digest = blob_digest(artifact)
+        if digest is None:
+            return artifact
+        data = await asyncio.to_thread(self.blob_store.read, digest)
+        if data is None:
+            return None
+        return types.Part(
+            inline_data=types.Blob(
+                data=data,
+                mime_type=artifact.file_data.mime_type,
+                display_name=artifact.file_data.display_name,
+            )
+        )
+
+    async def get_blob_digest(
+        self,
+        app_name: str,
+        user_id: str,
+        filename: str,
+        session_id: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> str | None:
+        """Digest of an artifact version's bytes, without reading them."""
+        # The base service returns the stored reference, not the bytes.
+        artifact = await super().load_artifact(
+            app_name=app_name,
+            user_id=user_id,
+            filename=filename,
+            session_id=session_id,
+            version=version,
+        )
+        return blob_digest(artifact)
+
+    async def forget_session(
+        self, app_name: str, user_id: str, session_id: str
+    ):
+        """Drops the session's artifacts from the index.
+
+        User scoped artifacts are kept. The bytes stay in the BlobStore
+        until the session's references there are released.
+        """
+        filenames = await self.list_artifact_keys(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+        for filename in filenames:
+            if filename.startswith('user:'):
+                continue
+            await self.delete_artifact(
+                app_name=app_name,
+                user_id=user_id,
+                filename=filename,
+                session_id=session_id,
+            )
+
+
+def blob_digest(artifact: types.Part | None) -> str | None:
+    if artifact is None or artifact.file_data is None:
+        return None
+    uri = artifact.file_data.file_uri or ''
+    if not uri.startswith(BLOB_URI_PREFIX):
+        return None
+    return uri[len(BLOB_URI_PREFIX) :]
@@ -0,0 +1,215 @@
+import dataclasses
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import urllib.parse
+
+from demo.ui.service.server.file_cache import CachedFile
+
+
+# Subdirectory of the root holding the store's files, and the file marking
+# it as created by a BlobStore.
+BLOB_SUBDIR = 'blobs'
+MARKER_FILE = '.a2a-blob-store'
+
+
+class BlobQuotaError(Exception):
+    """Raised when storing a blob would exceed the store's quota."""
+
+
+@dataclasses.dataclass
+class _Blob:
+    size: int
+    mime_type: str
+    # Conversations referencing the blob, it is deleted when none are left.
+    owners: set[str] = dataclasses.field(default_factory=set)
+
+
+class BlobStore:
+    """Content addressed store of file bytes on disk.
+
+    Blobs are keyed by the SHA-256 digest of their bytes, so storing the
+    same content again only adds a reference to it. References are held
+    by owners, the conversations the content was shared in; a blob is
+    removed from disk once its last owner is released. The total size of
+    the stored blobs is bounded by max_bytes.
+
+    The store keeps its files in a subdirectory of root marked as its own,
+    and never touches anything else there. Every reference is recorded as
+    a small file, so with keep_existing a restarted store picks up the
+    blobs and owners of the previous run, otherwise it starts empty.
+    Without a root directory a temporary one is used and removed on close.
+    """
+
+    def __init__(
+        self,
+        root: str | None = None,
+        max_bytes: int = 1024**3,
+        keep_existing: bool = False,
+    ):
+        self._temporary = root is None
+        self.root = root or tempfile.mkdtemp(prefix='a2a-blobs-')
+        self.max_bytes = max_bytes
+        self.stored_bytes = 0
+        self._blobs: dict[str, _Blob] = {}
+        self._lock = threading.Lock()
+        self._dir = os.path.join(self.root, BLOB_SUBDIR)
+        marker = os.path.join(self._dir, MARKER_FILE)
+        if os.path.isdir(self._dir) and os.listdir(self._dir):
+            if not os.path.exists(marker):
+                raise ValueError(
+                    f'{self._dir} exists but was not created by a BlobStore'
+                )
+            if keep_existing:
+                self._load_existing()
+            else:
+                shutil.rmtree(self._dir)
+        os.makedirs(self._refs_dir, exist_ok=True)
+        with open(marker, 'a'):
+            pass
+
+    @property
+    def _refs_dir(self) -> str:
+        return os.path.join(self._dir, 'refs')
+
+    def _owner_dir(self, owner: str) -> str:
+        return os.path.join(self._refs_dir, urllib.parse.quote(owner, safe=''))
+
+    def _load_existing(self):
+        """Rebuilds the blobs and owners from the reference files on disk.
+
+        Blobs without references and references without blobs, left by an
+        interrupted write or release, are removed.
+        """
+        os.makedirs(self._refs_dir, exist_ok=True)
+        for owner_name in os.listdir(self._refs_dir):
+            owner = urllib.parse.unquote(owner_name)
+            owner_dir = os.path.join(self._refs_dir, owner_name)
+            for digest in os.listdir(owner_dir):
+                ref = os.path.join(owner_dir, digest)
+                try:
+                    size = os.path.getsize(self.path(digest))
+                except OSError:
+                    os.remove(ref)
+                    continue
+                with open(ref, encoding='utf-8') as f:
+                    mime_type = f.read() or 'application/octet-stream'
+                blob = self._blobs.get(digest)
+                if blob is None:
+                    blob = self._blobs[digest] = _Blob(size, mime_type)
+                    self.stored_bytes += size
+                blob.owners.add(owner)
+        for name in os.listdir(self._dir):
+            if len(name) != 2:
+                continue
+            for digest in os.listdir(os.path.join(self._dir, name)):
+                if digest not in self._blobs:
+                    os.remove(os.path.join(self._dir, name, digest))
+
+    def put(self, data: bytes, mime_type: str, owner: str) -> str:
+        """Stores the bytes for owner and returns their digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            blob = self._blobs.get(digest)
+            if blob is None:
+                if self.stored_bytes + len(data) > self.max_bytes:
+                    raise BlobQuotaError(
+                        f'Storing {len(data)} bytes would exceed the'
+                        f' {self.max_bytes} byte quota'
+                    )
+                self._write(digest, data)
+                blob = _Blob(len(data), mime_type or 'application/octet-stream')
+                self._blobs[digest] = blob
+                self.stored_bytes += blob.size
+            if owner not in blob.owners:
+                self._write_ref(owner, digest, blob.mime_type)
+                blob.owners.add(owner)
+        return digest
+
+    def _write_ref(self, owner: str, digest: str, mime_type: str):
+        owner_dir = self._owner_dir(owner)
+        os.makedirs(owner_dir, exist_ok=True)
+        with open(os.path.join(owner_dir, digest), 'w', encoding='utf-8') as f:
+            f.write(mime_type)
+
+    def _write(self, digest: str, data: bytes):
+        path = self.path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def path(self, digest: str) -> str:
+        return os.path.join(self._dir, digest[:2], digest)
+
+    def read(self, digest: str) -> bytes | None:
+        if digest not in self._blobs:
+            return None
+        with open(self.path(digest), 'rb') as f:
+            return f.read()
+
+    def file(self, digest: str, mime_type: str | None = None) -> CachedFile | None:
+        """The blob as a file entry that is served straight from disk."""
+        blob = self._blobs.get(digest)
+        if blob is None:
+            return None
+        return CachedFile(
+            file_id=digest,
+            mime_type=mime_type or blob.mime_type,
+            size=blob.size,
+            etag=f'"{digest}"',
+            path=self.path(digest),
+        )
+
+    def owners(self, digest: str) -> set[str]:
+        blob = self._blobs.get(digest)
+        return set(blob.owners) if blob else set()
+
+    def release(self, owner: str) -> int:
+        """Drops the references of owner, returns the number of blobs removed."""
+        removed = 0
+        with self._lock:
+            shutil.rmtree(self._owner_dir(owner), ignore_errors=True)
+            for digest, blob in list(self._blobs.items()):
+                if owner not in blob.owners:
+                    continue
+                blob.owners.discard(owner)
+                if blob.owners:
+                    continue
+                del self._blobs[digest]
+                self.stored_bytes -= blob.size
+                try:
+                    os.remove(self.path(digest))
+                    os.rmdir(os.path.dirname(self.path(digest)))
+                except OSError:
+                    pass
+                removed += 1
+        return removed
+
+    def retain(self, owners) -> int:
+        """Releases every owner not in owners, returns the blobs removed.
+
+        Used after a restart to drop the references of conversations that
+        were not restored.
+        """
+        keep = set(owners)
+        stale = {
+            owner
+            for blob in self._blobs.values()
+            for owner in blob.owners
+            if owner not in keep
+        }
+        return sum(self.release(owner) for owner in stale)
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._blobs
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def close(self):
+        if self._temporary:
+            shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,39 @@
+import asyncio
+import contextlib
+
+from collections.abc import AsyncIterator
+
+
+class ConversationLocks:
+    """asyncio locks per conversation, created on demand.
+
+    Holding a conversation's lock serializes its turns while different
+    conversations proceed concurrently. A lock is dropped once no task
+    holds or waits for it, so idle conversations cost nothing.
+    """
+
+    def __init__(self):
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._users: dict[str, int] = {}
+
+    @contextlib.asynccontextmanager
+    async def hold(self, conversation_id: str) -> AsyncIterator[None]:
+        lock = self._locks.get(conversation_id)
+        if lock is None:
+            lock = self._locks[conversation_id] = asyncio.Lock()
+        self._users[conversation_id] = self._users.get(conversation_id, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._users[conversation_id] -= 1
+            if not self._users[conversation_id]:
+                del self._users[conversation_id]
+                del self._locks[conversation_id]
+
+    def locked(self, conversation_id: str) -> bool:
+        lock = self._locks.get(conversation_id)
+        return lock is not None and lock.locked()
+
+    def __len__(self) -> int:
+        return len(self._locks)
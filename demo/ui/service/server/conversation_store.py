@@ -0,0 +1,390 @@
+import bisect
+import dataclasses
+import itertools
+import secrets
+
+from collections.abc import Callable
+from typing import Any
+
+from a2a.types import Message, Task
+
+from demo.ui.service.server.event_log import EventLog
+from demo.ui.service.types import Conversation, Event
+
+
+# Cursors hold the store's epoch above this many version bits.
+_VERSION_BITS = 40
+
+
+@dataclasses.dataclass(frozen=True)
+class StoreSnapshot:
+    """Copies of the conversations and tasks at one store version."""
+
+    version: int
+    conversations: tuple[Conversation, ...]
+    tasks: tuple[Task, ...]
+
+
+class ConversationStore:
+    """Indexed in-memory store for conversations, messages, tasks and events.
+
+    Records are kept in insertion ordered dicts keyed by their ids so lookups
+    are O(1) while listings keep the order in which records were first added.
+    Tasks are additionally indexed by their context id.
+
+    Every mutation bumps a monotonically increasing version. The `*_since`
+    methods take and return cursors, the version combined with an epoch
+    picked per store, and only return the records that changed after the
+    given cursor. A cursor of another store, such as one handed out before a
+    server restart, gets a full listing.
+
+    Events are kept in a bounded EventLog; pass one to change its capacity
+    or to archive evicted events to disk.
+
+    snapshot() gives readers copies that later writes never touch.
+    """
+
+    def __init__(self, event_log: EventLog | None = None):
+        self._version = 0
+        self._epoch = secrets.randbits(20) + 1
+        self._conversations: dict[str, Conversation] = {}
+        self._messages: dict[str, Message] = {}
+        self._tasks: dict[str, Task] = {}
+        self._event_log = event_log or EventLog()
+        # Insertion ordered sets of task ids per context id.
+        self._tasks_by_context: dict[str, dict[str, None]] = {}
+        # Change logs, each ordered by ascending version. Keys are moved to
+        # the end whenever the record changes again.
+        self._conversation_changes: dict[str, int] = {}
+        self._conversation_deletes: dict[str, int] = {}
+        self._task_changes: dict[str, int] = {}
+        self._task_deletes: dict[str, int] = {}
+        # Context ids of the deleted tasks, for scoped deltas.
+        self._deleted_task_contexts: dict[str, str] = {}
+        # Versions of the messages of each conversation, parallel to
+        # Conversation.messages. Messages never change once added.
+        self._message_versions: dict[str, list[int]] = {}
+        self._snapshot = StoreSnapshot(0, (), ())
+        # Record copies of the latest snapshot with the version they were
+        # copied at, reused until the record changes.
+        self._conversation_copies: dict[str, tuple[int, Conversation]] = {}
+        self._task_copies: dict[str, tuple[int, Task]] = {}
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def _next_version(self) -> int:
+        self._version += 1
+        return self._version
+
+    @property
+    def cursor(self) -> int:
+        """Cursor of the current version."""
+        return (self._epoch << _VERSION_BITS) | self._version
+
+    def _cursor_version(self, cursor: int) -> int | None:
+        """Version of a cursor, None if it needs a full read."""
+        version = cursor & ((1 << _VERSION_BITS) - 1)
+        if cursor >> _VERSION_BITS != self._epoch or version > self._version:
+            return None
+        return version
+
+    # Conversations
+    def add_conversation(self, conversation: Conversation) -> Conversation:
+        self._conversations[conversation.conversation_id] = conversation
+        self._conversation_deletes.pop(conversation.conversation_id, None)
+        self._touch_conversation(conversation.conversation_id)
+        self._message_versions[conversation.conversation_id] = [
+            self._version for _ in conversation.messages
+        ]
+        return conversation
+
+    def get_conversation(
+        self, conversation_id: str | None
+    ) -> Conversation | None:
+        if not conversation_id:
+            return None
+        return self._conversations.get(conversation_id)
+
+    def delete_conversation(self, conversation_id: str) -> bool:
+        """Removes a conversation, its messages and its context's tasks."""
+        conversation = self._conversations.pop(conversation_id, None)
+        if conversation is None:
+            return False
+        for message in conversation.messages:
+            self._messages.pop(message.message_id, None)
+        version = self._next_version()
+        for task_id in self._tasks_by_context.pop(conversation_id, {}):
+            self._tasks.pop(task_id, None)
+            self._task_changes.pop(task_id, None)
+            self._task_deletes.pop(task_id, None)
+            self._task_deletes[task_id] = version
+            self._deleted_task_contexts[task_id] = conversation_id
+        self._message_versions.pop(conversation_id, None)
+        self._conversation_changes.pop(conversation_id, None)
+        self._conversation_deletes[conversation_id] = version
+        return True
+
+    @property
+    def conversations(self) -> list[Conversation]:
+        return list(self._conversations.values())
+
+    def conversations_since(
+        self, cursor: int
+    ) -> tuple[int, list[Conversation], list[str], bool]:
+        """Returns (cursor, changed, deleted ids, is full listing)."""
+        cursor = self._cursor_version(cursor)
+        if cursor is None:
+            return self.cursor, self.conversations, [], True
+        changed = [
+            self._conversations[conversation_id]
+            for conversation_id in _changed_since(
+                self._conversation_changes, cursor
+            )
+        ]
+        deleted = _changed_since(self._conversation_deletes, cursor)
+        return self.cursor, changed, deleted, False
+
+    def _touch_conversation(self, conversation_id: str):
+        self._conversation_changes.pop(conversation_id, None)
+        self._conversation_changes[conversation_id] = self._next_version()
+
+    # Messages
+    def add_message(
+        self, message: Message, conversation: Conversation | None = None
+    ) -> Message:
+        """Index a message and append it to its conversation, if given."""
+        self._messages[message.message_id] = message
+        if conversation:
+            conversation.messages.append(message)
+            self._touch_conversation(conversation.conversation_id)
+            self._message_versions.setdefault(
+                conversation.conversation_id, []
+            ).append(self._version)
+        return message
+
+    def get_message(self, message_id: str | None) -> Message | None:
+        if not message_id:
+            return None
+        return self._messages.get(message_id)
+
+    @property
+    def messages(self) -> list[Message]:
+        return list(self._messages.values())
+
+    def messages_since(
+        self, conversation_id: str, cursor: int
+    ) -> tuple[int, list[Message], bool]:
+        """Returns (cursor, messages added after cursor, is full listing)."""
+        conversation = self.get_conversation(conversation_id)
+        if not conversation:
+            return self.cursor, [], True
+        cursor = self._cursor_version(cursor)
+        if cursor is None:
+            return self.cursor, list(conversation.messages), True
+        versions = self._message_versions.get(conversation_id, [])
+        start = bisect.bisect_right(versions, cursor)
+        return self.cursor, conversation.messages[start:], False
+
+    # Tasks
+    def add_task(self, task: Task) -> Task:
+        self._tasks[task.id] = task
+        self._task_deletes.pop(task.id, None)
+        self._deleted_task_contexts.pop(task.id, None)
+        self._index_task(task)
+        self._touch_task(task.id)
+        return task
+
+    def update_task(self, task: Task) -> bool:
+        """Replace a known task, keeping its position.
+
+        Returns False if the task is unknown.
+        """
+        previous = self._tasks.get(task.id)
+        if previous is None:
+            return False
+        if previous.context_id != task.context_id:
+            self._unindex_task(previous)
+        self._tasks[task.id] = task
+        self._index_task(task)
+        self._touch_task(task.id)
+        return True
+
+    def get_task(self, task_id: str | None) -> Task | None:
+        if not task_id:
+            return None
+        return self._tasks.get(task_id)
+
+    def tasks_for_context(self, context_id: str | None) -> list[Task]:
+        if not context_id:
+            return []
+        return [
+            self._tasks[task_id]
+            for task_id in self._tasks_by_context.get(context_id, {})
+        ]
+
+    @property
+    def tasks(self) -> list[Task]:
+        return list(self._tasks.values())
+
+    def page_tasks(
+        self, context_id: str | None = None, offset: int = 0, limit: int = 50
+    ) -> tuple[list[Task], int]:
+        """Returns (tasks newest first, total) for one page of tasks."""
+        task_ids = (
+            self._tasks
+            if context_id is None
+            else self._tasks_by_context.get(context_id, {})
+        )
+        page = itertools.islice(reversed(task_ids), offset, offset + limit)
+        return [self._tasks[task_id] for task_id in page], len(task_ids)
+
+    def tasks_since(
+        self, cursor: int, context_id: str | None = None
+    ) -> tuple[int, list[Task], list[str], bool]:
+        """Returns (cursor, changed, deleted ids, is full listing).
+
+        With a context_id only the tasks of that context are returned.
+        """
+        cursor = self._cursor_version(cursor)
+        if cursor is None:
+            if context_id is not None:
+                return (
+                    self.cursor,
+                    self.tasks_for_context(context_id),
+                    [],
+                    True,
+                )
+            return self.cursor, self.tasks, [], True
+        changed = [
+            self._tasks[task_id]
+            for task_id in _changed_since(self._task_changes, cursor)
+        ]
+        deleted = _changed_since(self._task_deletes, cursor)
+        if context_id is not None:
+            changed = [
+                task for task in changed if task.context_id == context_id
+            ]
+            deleted = [
+                task_id
+                for task_id in deleted
+                if self._deleted_task_contexts[task_id] == context_id
+            ]
+        return self.cursor, changed, deleted, False
+
+    def _touch_task(self, task_id: str):
+        self._task_changes.pop(task_id, None)
+        self._task_changes[task_id] = self._next_version()
+
+    def _index_task(self, task: Task):
+        if task.context_id:
+            self._tasks_by_context.setdefault(task.context_id, {})[task.id] = (
+                None
+            )
+
+    def _unindex_task(self, task: Task):
+        task_ids = self._tasks_by_context.get(task.context_id or '')
+        if task_ids is not None:
+            task_ids.pop(task.id, None)
+            if not task_ids:
+                del self._tasks_by_context[task.context_id]
+
+    # Events
+    @property
+    def event_log(self) -> EventLog:
+        return self._event_log
+
+    def add_event(self, event: Event) -> Event:
+        # Re-recording an event (same id) replaces it at a new version, so
+        # events_since readers see the replacement.
+        return self._event_log.append(event, self._next_version())
+
+    @property
+    def events(self) -> list[Event]:
+        return self._event_log.events
+
+    def events_since(self, cursor: int) -> tuple[int, list[Event], bool]:
+        """Returns (cursor, events added after cursor, is full listing)."""
+        cursor = self._cursor_version(cursor)
+        if cursor is None:
+            return self.cursor, self.events, True
+        return self.cursor, self._event_log.since_version(cursor), False
+
+    def query_events(self, **filters) -> tuple[list[Event], int | None]:
+        """See EventLog.query."""
+        return self._event_log.query(**filters)
+
+    def count_events(self, **filters) -> int:
+        """See EventLog.count."""
+        return self._event_log.count(**filters)
+
+    # Snapshots
+    def snapshot(self) -> StoreSnapshot:
+        """Read-only copies of the conversations and tasks.
+
+        Copy on write: the first read after a change copies the records that
+        changed since the previous snapshot, and the result is shared by all
+        readers until the next change. Readers take no lock and never see a
+        record mid-update.
+        """
+        if self._snapshot.version == self._version:
+            return self._snapshot
+        self._snapshot = StoreSnapshot(
+            self._version,
+            _copy_changed(
+                self._conversations,
+                self._conversation_changes,
+                self._conversation_copies,
+                _copy_conversation,
+            ),
+            _copy_changed(
+                self._tasks, self._task_changes, self._task_copies, _copy_task
+            ),
+        )
+        return self._snapshot
+
+
+def _copy_changed(
+    records: dict[str, Any],
+    changes: dict[str, int],
+    copies: dict[str, tuple[int, Any]],
+    copy: Callable[[Any], Any],
+) -> tuple:
+    """Copies of the records, reusing those that did not change."""
+    rval = []
+    for record_id, record in records.items():
+        version = changes.get(record_id, 0)
+        cached = copies.get(record_id)
+        if cached is None or cached[0] != version:
+            cached = copies[record_id] = (version, copy(record))
+        rval.append(cached[1])
+    for record_id in [r for r in copies if r not in records]:
+        del copies[record_id]
+    return tuple(rval)
+
+
+def _copy_conversation(conversation: Conversation) -> Conversation:
+    return conversation.model_copy(
+        update={'messages': list(conversation.messages)}
+    )
+
+
+def _copy_task(task: Task) -> Task:
+    update = {}
+    if task.history is not None:
+        update['history'] = list(task.history)
+    if task.artifacts is not None:
+        update['artifacts'] = list(task.artifacts)
+    return task.model_copy(update=update)
+
+
+def _changed_since(changes: dict[str, int], cursor: int) -> list[str]:
+    """Keys of a version ordered change log that changed after cursor."""
+    changed = []
+    for key in reversed(changes):
+        if changes[key] <= cursor:
+            break
+        changed.append(key)
+    changed.reverse()
+    return changed
@@ -0,0 +1,107 @@
+import asyncio
+
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from a2a.types import Message
+
+
+class DispatcherBusyError(Exception):
+    """Raised when the dispatch queue is full."""
+
+
+class MessageDispatcher:
+    """Bounded work queue feeding a fixed pool of worker tasks.
+
+    Messages are queued per conversation. A conversation is handed to at most
+    one worker at a time, so messages of one conversation are processed
+    serially and in order while different conversations run concurrently.
+    Once max_queue_size messages are waiting, submit raises
+    DispatcherBusyError instead of queueing more work.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Message], Awaitable[Any]],
+        max_workers: int = 4,
+        max_queue_size: int = 100,
+    ):
+        self.max_workers = max(max_workers, 1)
+        self.max_queue_size = max(max_queue_size, 1)
+        self.processed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self._handler = handler
+        self._pending: dict[str, deque[Message]] = {}
+        # Conversations with pending messages that no worker holds.
+        self._ready: asyncio.Queue[str] | None = None
+        self._queue_depth = 0
+        self._workers: list[asyncio.Task] = []
+
+    def start(self):
+        """Starts the workers. Must be called from the serving event loop."""
+        if self._workers:
+            return
+        self._ready = asyncio.Queue()
+        self._workers = [
+            asyncio.create_task(self._work(), name=f'dispatch-worker-{i}')
+            for i in range(self.max_workers)
+        ]
+
+    async def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def submit(self, message: Message):
+        """Queues a message, raising DispatcherBusyError when saturated."""
+        if self._ready is None:
+            raise RuntimeError('Dispatcher is not started')
+        if self._queue_depth >= self.max_queue_size:
+            self.rejected += 1
+            raise DispatcherBusyError(
+                f'{self._queue_depth} messages already queued'
+            )
+        key = message.context_id or message.message_id
+        pending = self._pending.get(key)
+        if pending is None:
+            # Not queued and not held by a worker, schedule it.
+            pending = self._pending[key] = deque()
+            self._ready.put_nowait(key)
+        pending.append(message)
+        self._queue_depth += 1
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue_depth
+
+    @property
+    def active_conversations(self) -> int:
+        return len(self._pending)
+
+    async def _work(self):
+        while True:
+            key = await self._ready.get()
+            pending = self._pending[key]
+            message = pending.popleft()
+            self._queue_depth -= 1
+            self.in_flight += 1
+            try:
+                await self._handler(message)
+                self.processed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                print(f'Failed to process message {message.message_id}: {e}')
+            finally:
+                self.in_flight -= 1
+                if pending:
+                    # Go to the back of the line so busy conversations
+                    # cannot starve the others.
+                    self._ready.put_nowait(key)
+                else:
+                    del self._pending[key]
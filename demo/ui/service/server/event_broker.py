@@ -0,0 +1,106 @@
+import asyncio
+import json
+
+from typing import Any
+
+
+# Marker queued in place of the backlog of a subscriber that fell behind.
+RESYNC = json.dumps({'kind': 'resync'})
+
+
+class Subscription:
+    """A single subscriber with a bounded queue of serialized notifications.
+
+    When the queue is full the backlog is replaced with a single resync
+    marker, so a slow consumer costs at most max_queue_size entries and is
+    told to refetch its state instead of replaying every missed change.
+    """
+
+    def __init__(
+        self,
+        conversation_id: str | None,
+        max_queue_size: int,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        self.conversation_id = conversation_id
+        self.dropped = 0
+        self._loop = loop
+        self._queue: asyncio.Queue[str] = asyncio.Queue(
+            maxsize=max(max_queue_size, 1)
+        )
+
+    def wants(self, conversation_id: str | None) -> bool:
+        return not self.conversation_id or (
+            conversation_id == self.conversation_id
+        )
+
+    def offer(self, item: str):
+        """Queue an item from any thread without ever blocking the publisher."""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._offer(item)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._offer, item)
+
+    def _offer(self, item: str):
+        if self._queue.full():
+            self.dropped += self._queue.qsize()
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            item = RESYNC
+        self._queue.put_nowait(item)
+
+    async def get(self, timeout: float | None = None) -> str | None:
+        """Next item, or None if nothing arrived within timeout."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize()
+
+
+class EventBroker:
+    """Fans out host notifications to subscribers, scoped per conversation.
+
+    Notifications are small JSON objects carrying the kind of change and the
+    ids involved. Subscribers fetch the changed records through the cursor
+    based list endpoints, so large payloads are never queued per subscriber.
+    """
+
+    def __init__(self, max_queue_size: int = 100):
+        self.max_queue_size = max_queue_size
+        self._subscriptions: set[Subscription] = set()
+
+    def subscribe(self, conversation_id: str | None = None) -> Subscription:
+        """Must be called from the event loop that will consume the queue."""
+        subscription = Subscription(
+            conversation_id, self.max_queue_size, asyncio.get_running_loop()
+        )
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscriptions.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def publish(self, kind: str, conversation_id: str | None, **data: Any):
+        subscribers = [
+            s for s in list(self._subscriptions) if s.wants(conversation_id)
+        ]
+        if not subscribers:
+            return
+        # Serialize once, whatever the number of subscribers.
+        item = json.dumps(
+            {'kind': kind, 'conversation_id': conversation_id or '', **data}
+        )
+        for subscription in subscribers:
+            subscription.offer(item)
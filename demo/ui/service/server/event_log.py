@@ -0,0 +1,379 @@
+import bisect
+import json
+import os
+
+from demo.ui.service.types import Event
+
+
+# Bytes read per step when reading the overflow file backwards.
+_TAIL_BLOCK = 64 * 1024
+
+
+class _Ring:
+    """List backed FIFO with O(1) append, popleft and indexing."""
+
+    def __init__(self):
+        self._items: list = []
+        self._head = 0
+
+    def append(self, item):
+        self._items.append(item)
+
+    def popleft(self):
+        item = self._items[self._head]
+        self._items[self._head] = None
+        self._head += 1
+        if self._head > 1024 and self._head * 2 > len(self._items):
+            del self._items[: self._head]
+            self._head = 0
+        return item
+
+    def __len__(self) -> int:
+        return len(self._items) - self._head
+
+    def __getitem__(self, i: int):
+        if i < 0:
+            i += len(self)
+        return self._items[self._head + i]
+
+    def __iter__(self):
+        return iter(self._items[self._head :])
+
+    def bisect_left(self, value, key=None) -> int:
+        return (
+            bisect.bisect_left(self._items, value, lo=self._head, key=key)
+            - self._head
+        )
+
+    def bisect_right(self, value, key=None) -> int:
+        return (
+            bisect.bisect_right(self._items, value, lo=self._head, key=key)
+            - self._head
+        )
+
+
+class _Entry:
+    __slots__ = (
+        'seq',
+        'version',
+        'event',
+        'conversation_id',
+        'max_timestamp',
+        'replaced',
+    )
+
+    def __init__(self, seq, version, event, conversation_id, max_timestamp):
+        self.seq = seq
+        self.version = version
+        self.event = event
+        self.conversation_id = conversation_id
+        # Largest timestamp seen up to this entry, monotonic in seq, used to
+        # bisect time ranges even if events arrive slightly out of order.
+        self.max_timestamp = max_timestamp
+        # Set once a newer entry holds the event, the entry keeps its slot
+        # so sequence numbers stay contiguous but matches nothing.
+        self.replaced = False
+
+
+class _Candidates:
+    """Entries at a descending range of sequence numbers, read lazily.
+
+    positions are sequence numbers, or positions in seqs if an index ring
+    is given.
+    """
+
+    def __init__(self, entries: _Ring, first_seq: int, positions: range, seqs):
+        self._entries = entries
+        self._first_seq = first_seq
+        self._positions = positions
+        self._seqs = seqs
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __iter__(self):
+        for position in self._positions:
+            seq = position if self._seqs is None else self._seqs[position]
+            yield self._entries[seq - self._first_seq]
+
+
+class EventLog:
+    """Append ordered ring buffer of events with secondary indexes.
+
+    At most capacity events are kept in memory. Older events are evicted
+    first and, if overflow_path is set, appended to a JSONL file there.
+    Once that file reaches overflow_max_bytes it is rotated to
+    overflow_path + '.1', replacing the previous rotation, so the archive
+    stays below twice that size.
+    Events are indexed by conversation (the context id of their message)
+    and by actor, and every entry has a sequence number that pages of
+    results use as their cursor. Appending an event with a known id adds
+    it as a new entry and retires the old one, which still takes up its
+    slot until it is evicted.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        overflow_path: str | None = None,
+        overflow_max_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.capacity = max(capacity, 1)
+        self.overflow_path = overflow_path
+        self.overflow_max_bytes = max(overflow_max_bytes, 1)
+        self.evicted = 0
+        self._entries = _Ring()
+        self._by_id: dict[str, _Entry] = {}
+        self._by_conversation: dict[str, _Ring] = {}
+        self._by_actor: dict[str, _Ring] = {}
+        self._next_seq = 0
+        self._overflow = None
+        # Retired entries still in the ring.
+        self._replaced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries) - self._replaced
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._by_id
+
+    def append(self, event: Event, version: int) -> Event:
+        """Adds an event. An event with a known id replaces the old entry.
+
+        The replacement is indexed and versioned like a new event, so it is
+        returned by since_version and matched by its own conversation and
+        actor.
+        """
+        previous_entry = self._by_id.get(event.id)
+        if previous_entry is not None:
+            previous_entry.replaced = True
+            self._replaced += 1
+        if len(self._entries) >= self.capacity:
+            self._evict()
+        previous = self._entries[-1].max_timestamp if self._entries else 0.0
+        entry = _Entry(
+            self._next_seq,
+            version,
+            event,
+            event.content.context_id or '',
+            max(previous, event.timestamp),
+        )
+        self._next_seq += 1
+        self._entries.append(entry)
+        self._by_id[event.id] = entry
+        self._by_conversation.setdefault(entry.conversation_id, _Ring()).append(
+            entry.seq
+        )
+        self._by_actor.setdefault(event.actor, _Ring()).append(entry.seq)
+        return event
+
+    def _evict(self):
+        entry = self._entries.popleft()
+        if entry.replaced:
+            self._replaced -= 1
+        else:
+            del self._by_id[entry.event.id]
+        for index, key in (
+            (self._by_conversation, entry.conversation_id),
+            (self._by_actor, entry.event.actor),
+        ):
+            # The evicted entry is the oldest of its keys too.
+            seqs = index[key]
+            seqs.popleft()
+            if not seqs:
+                del index[key]
+        if entry.replaced:
+            return
+        self.evicted += 1
+        if self.overflow_path:
+            if self._overflow is None:
+                os.makedirs(
+                    os.path.dirname(os.path.abspath(self.overflow_path)),
+                    exist_ok=True,
+                )
+                self._overflow = open(self.overflow_path, 'a', encoding='utf-8')
+            self._overflow.write(entry.event.model_dump_json() + '\n')
+            if self._overflow.tell() >= self.overflow_max_bytes:
+                self._overflow.close()
+                self._overflow = None
+                os.replace(self.overflow_path, self.overflow_path + '.1')
+
+    @property
+    def events(self) -> list[Event]:
+        return [entry.event for entry in self._entries if not entry.replaced]
+
+    def since_version(self, version: int) -> list[Event]:
+        """Events added after the given store version."""
+        start = self._entries.bisect_left(
+            version + 1, key=lambda entry: entry.version
+        )
+        return [
+            self._entries[i].event
+            for i in range(start, len(self._entries))
+            if not self._entries[i].replaced
+        ]
+
+    def query(
+        self,
+        conversation_id: str | None = None,
+        actor: str | None = None,
+        since: float | None = None,
+        before: int | None = None,
+        limit: int = 100,
+        until: float | None = None,
+    ) -> tuple[list[Event], int | None]:
+        """Returns (events, next_before) for the newest matching events.
+
+        Events are returned oldest first. Only events with a sequence number
+        below before are considered; pass the returned next_before to get
+        the previous page. next_before is None on the last page.
+
+        since and until bound the event timestamps. The until bound is found
+        by arrival order, so an event logged after a newer one is treated as
+        newer than until.
+        """
+        if limit <= 0:
+            return [], None
+        found = self._candidates(conversation_id, actor, since, until, before)
+        if found is None:
+            return [], None
+        high_seq, candidates = found
+        page: list[Event] = []
+        next_before = None
+        last_seq = high_seq
+        for entry in candidates:
+            if not self._matches(entry, conversation_id, actor, since):
+                continue
+            if len(page) == limit:
+                next_before = last_seq
+                break
+            page.append(entry.event)
+            last_seq = entry.seq
+        page.reverse()
+        return page, next_before
+
+    def count(
+        self,
+        conversation_id: str | None = None,
+        actor: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> int:
+        """Number of events query would page through with these filters.
+
+        With at most one of conversation_id and actor, no since bound and
+        no replaced entries the count is taken from the indexes, otherwise
+        the candidate entries are checked one by one.
+        """
+        found = self._candidates(conversation_id, actor, since, until, None)
+        if found is None:
+            return 0
+        _, candidates = found
+        if (
+            since is None
+            and (conversation_id is None or actor is None)
+            and not self._replaced
+        ):
+            return len(candidates)
+        return sum(
+            1
+            for entry in candidates
+            if self._matches(entry, conversation_id, actor, since)
+        )
+
+    def _candidates(self, conversation_id, actor, since, until, before):
+        """(high_seq, entries newest first) that may match, None if none can.
+
+        The entries are narrowed by the smallest index and the time bounds,
+        _matches applies the remaining filters.
+        """
+        if not self._entries:
+            return None
+        first_seq = self._entries[0].seq
+        seqs = None
+        if conversation_id is not None:
+            seqs = self._by_conversation.get(conversation_id)
+            if seqs is None:
+                return None
+        if actor is not None:
+            actor_seqs = self._by_actor.get(actor)
+            if actor_seqs is None:
+                return None
+            if seqs is None or len(actor_seqs) < len(seqs):
+                seqs = actor_seqs
+
+        low_seq = first_seq
+        if since is not None:
+            low_seq += self._entries.bisect_left(
+                since, key=lambda entry: entry.max_timestamp
+            )
+        high_seq = self._next_seq if before is None else min(before, self._next_seq)
+        if until is not None:
+            high_seq = min(
+                high_seq,
+                first_seq
+                + self._entries.bisect_right(
+                    until, key=lambda entry: entry.max_timestamp
+                ),
+            )
+        if seqs is None:
+            positions = range(high_seq - 1, low_seq - 1, -1)
+        else:
+            low = seqs.bisect_left(low_seq)
+            high = seqs.bisect_left(high_seq)
+            positions = range(high - 1, low - 1, -1)
+        return high_seq, _Candidates(self._entries, first_seq, positions, seqs)
+
+    @staticmethod
+    def _matches(entry: _Entry, conversation_id, actor, since) -> bool:
+        if entry.replaced:
+            return False
+        if conversation_id is not None and (
+            entry.conversation_id != conversation_id
+        ):
+            return False
+        if actor is not None and entry.event.actor != actor:
+            return False
+        return since is None or entry.event.timestamp >= since
+
+    def archived(self, limit: int = 100) -> list[Event]:
+        """The most recently evicted events, read back from the overflow file.
+
+        Only the tail of the file is read, the rotated file too if the
+        current one holds fewer than limit events.
+        """
+        if not self.overflow_path or limit <= 0:
+            return []
+        if self._overflow is not None:
+            self._overflow.flush()
+        lines: list[bytes] = []
+        for path in (self.overflow_path, self.overflow_path + '.1'):
+            if len(lines) >= limit:
+                break
+            lines = _tail_lines(path, limit - len(lines)) + lines
+        return [Event.model_validate(json.loads(line)) for line in lines]
+
+    def close(self):
+        if self._overflow is not None:
+            self._overflow.close()
+            self._overflow = None
+
+
+def _tail_lines(path: str, limit: int) -> list[bytes]:
+    """The last limit lines of a file, read backwards in blocks."""
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return []
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        tail = b''
+        # One newline more than lines wanted marks a complete first line.
+        while position > 0 and tail.count(b'\n') <= limit:
+            step = min(_TAIL_BLOCK, position)
+            position -= step
+            f.seek(position)
+            tail = f.read(step) + tail
+    lines = tail.splitlines()
+    return [line for line in lines[-limit:] if line.strip()]
@@ -0,0 +1,175 @@
+import dataclasses
+import hashlib
+import os
+import threading
+import time
+
+from collections import OrderedDict
+
+
+@dataclasses.dataclass
+class CachedFile:
+    """Decoded file content, held in memory or spilled to disk."""
+
+    file_id: str
+    mime_type: str
+    size: int
+    etag: str
+    expires_at: float | None = None
+    data: bytes | None = None
+    path: str | None = None
+
+
+class FileCache:
+    """Byte-budgeted LRU cache of decoded file contents.
+
+    Entries are kept in memory until max_bytes is exceeded. The least
+    recently used entries are then written to spill_dir, when configured,
+    or dropped. Spilled entries are bounded by max_disk_bytes the same way.
+    Entries older than ttl_seconds are dropped on access.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float | None = None,
+        spill_dir: str | None = None,
+        max_disk_bytes: int = 1024 * 1024 * 1024,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.spill_dir = spill_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self._entries: OrderedDict[str, CachedFile] = OrderedDict()
+        self._lock = threading.Lock()
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def put(self, file_id: str, data: bytes, mime_type: str) -> CachedFile:
+        entry = CachedFile(
+            file_id=file_id,
+            mime_type=mime_type,
+            size=len(data),
+            etag=f'"{hashlib.sha256(data).hexdigest()}"',
+            expires_at=(
+                time.monotonic() + self.ttl_seconds
+                if self.ttl_seconds
+                else None
+            ),
+            data=data,
+        )
+        with self._lock:
+            self._remove(file_id)
+            self._entries[file_id] = entry
+            self.memory_bytes += entry.size
+            self._enforce_budgets()
+        return entry
+
+    def get(self, file_id: str) -> CachedFile | None:
+        with self._lock:
+            entry = self._entries.get(file_id)
+            if entry is None:
+                return None
+            if entry.expires_at is not None and (
+                entry.expires_at <= time.monotonic()
+            ):
+                self._remove(file_id)
+                return None
+            self._entries.move_to_end(file_id)
+            return entry
+
+    def read(self, entry: CachedFile, start: int = 0, end: int | None = None) -> bytes:
+        """Reads bytes [start, end) of an entry without loading spilled files whole."""
+        end = entry.size if end is None else min(end, entry.size)
+        data = entry.data
+        if data is not None:
+            return data[start:end]
+        if not entry.path:
+            return b''
+        with open(entry.path, 'rb') as f:
+            f.seek(start)
+            return f.read(max(end - start, 0))
+
+    def __contains__(self, file_id: str) -> bool:
+        return self.get(file_id) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _enforce_budgets(self):
+        # Oldest entries first, the most recently used one is always kept.
+        for file_id in list(self._entries)[:-1]:
+            if self.memory_bytes <= self.max_bytes:
+                break
+            entry = self._entries[file_id]
+            if entry.data is None:
+                continue
+            if self.spill_dir and entry.size <= self.max_disk_bytes:
+                self._spill(entry)
+            else:
+                self._remove(file_id)
+        for file_id in list(self._entries):
+            if self.disk_bytes <= self.max_disk_bytes:
+                break
+            if self._entries[file_id].path:
+                self._remove(file_id)
+
+    def _spill(self, entry: CachedFile):
+        path = os.path.join(self.spill_dir, entry.file_id)
+        with open(path, 'wb') as f:
+            f.write(entry.data)
+        entry.path = path
+        entry.data = None
+        self.memory_bytes -= entry.size
+        self.disk_bytes += entry.size
+
+    def _remove(self, file_id: str):
+        entry = self._entries.pop(file_id, None)
+        if entry is None:
+            return
+        if entry.data is not None:
+            self.memory_bytes -= entry.size
+        if entry.path:
+            self.disk_bytes -= entry.size
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Parses a single 'bytes=' Range header into an inclusive (start, end).
+
+    Returns None when the header should be ignored and the whole content
+    served. Raises ValueError when the range cannot be satisfied.
+    """
+    unit, _, spec = header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in spec:
+        return None
+    first, _, last = spec.strip().partition('-')
+    try:
+        if not first:
+            # Suffix range: the last N bytes.
+            length = int(last)
+            if length <= 0:
+                raise ValueError('Empty suffix range')
+            return max(size - length, 0), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError as e:
+        raise ValueError(f'Invalid range {header}') from e
+    if start >= size or end < start:
+        raise ValueError(f'Unsatisfiable range {header}')
+    return start, min(end, size - 1)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == etag:
+            return True
+    return False
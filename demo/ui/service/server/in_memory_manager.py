@@ -1,5 +1,7 @@
 import asyncio
 import datetime
+import json
+import os
 import uuid
 
 from a2a.types import (
@@ -17,6 +19,9 @@ from a2a.types import (
 from demo.ui.utils.agent_card import get_agent_card
 
 from .application_manager import ApplicationManager
+from .conversation_store import ConversationStore
+from .event_broker import EventBroker
+from .routing_stats import FastPathStats
 from . import test_image
 from ..types import Conversation, Event
 
@@ -29,19 +34,16 @@ class InMemoryFakeAgentManager(ApplicationManager):
     uses to send messages to the agent and provide details about the executions.
     """
 
-    _conversations: list[Conversation]
-    _messages: list[Message]
-    _tasks: list[Task]
-    _events: list[Event]
+    _store: ConversationStore
+    _broker: EventBroker
     _pending_message_ids: list[str]
     _next_message_idx: int
     _agents: list[AgentCard]
 
     def __init__(self):
-        self._conversations = []
-        self._messages = []
-        self._tasks = []
-        self._events = []
+        self._store = ConversationStore()
+        self._fast_path_stats = FastPathStats()
+        self._broker = EventBroker()
         self._pending_message_ids = []
         self._next_message_idx = 0
         self._agents = []
@@ -71,13 +73,11 @@ class InMemoryFakeAgentManager(ApplicationManager):
     def create_conversation(self) -> Conversation:
         conversation_id = str(uuid.uuid4())
         c = Conversation(conversation_id=conversation_id, is_active=True)
-        self._conversations.append(c)
+        self._store.add_conversation(c)
         return c
 
     def delete_conversation(self, conversation_id: str) -> bool:
-        initial_len = len(self._conversations)
-        self._conversations = [c for c in self._conversations if c.conversation_id != conversation_id]
-        return len(self._conversations) < initial_len
+        return self._store.delete_conversation(conversation_id)
 
     def sanitize_message(self, message: Message) -> Message:
         conversation = self.get_conversation(message.context_id)
@@ -86,29 +86,24 @@ class InMemoryFakeAgentManager(ApplicationManager):
         # Check if the last event in the conversation was tied to a task.
         if conversation.messages:
             if conversation.messages[-1].task_id and task_still_open(
-                next(
-                    filter(
-                        lambda x: x.id == conversation.messages[-1].task_id,
-                        self._tasks,
-                    ),
-                    None,
-                )
+                self._store.get_task(conversation.messages[-1].task_id)
             ):
                 message.task_id = conversation.messages[-1].task_id
 
         return message
 
     async def process_message(self, message: Message):
-        self._messages.append(message)
         message_id = message.message_id
         context_id = message.context_id or ''
         task_id = message.task_id or ''
         if message_id:
             self._pending_message_ids.append(message_id)
+            self._broker.publish(
+                'message', context_id, message_id=message_id, pending=True
+            )
         conversation = self.get_conversation(context_id)
-        if conversation:
-            conversation.messages.append(message)
-        self._events.append(
+        self._store.add_message(message, conversation)
+        self.add_event(
             Event(
                 id=str(uuid.uuid4()),
                 actor='host',
@@ -132,9 +127,8 @@ class InMemoryFakeAgentManager(ApplicationManager):
             self.add_task(task)
         await asyncio.sleep(self._next_message_idx)
         response = self.next_message()
-        if conversation:
-            conversation.messages.append(response)
-        self._events.append(
+        self._store.add_message(response, conversation)
+        self.add_event(
             Event(
                 id=str(uuid.uuid4()),
                 actor='host',
@@ -143,6 +137,9 @@ class InMemoryFakeAgentManager(ApplicationManager):
             )
         )
         self._pending_message_ids.remove(message_id)
+        self._broker.publish(
+            'message', context_id, message_id=message_id, pending=False
+        )
         # Now clean up the task
         if task:
             task.status.state = TaskState.completed
@@ -160,16 +157,20 @@ class InMemoryFakeAgentManager(ApplicationManager):
             self.update_task(task)
 
     def add_task(self, task: Task):
-        self._tasks.append(task)
+        self._store.add_task(task)
 
     def update_task(self, task: Task):
-        for i, t in enumerate(self._tasks):
-            if t.id == task.id:
-                self._tasks[i] = task
-                return
+        self._store.update_task(task)
 
     def add_event(self, event: Event):
-        self._events.append(event)
+        self._store.add_event(event)
+        self._broker.publish(
+            'event',
+            event.content.context_id,
+            event_id=event.id,
+            actor=event.actor,
+            timestamp=event.timestamp,
+        )
 
     def next_message(self) -> Message:
         message = _message_queue[self._next_message_idx]
@@ -181,24 +182,13 @@ class InMemoryFakeAgentManager(ApplicationManager):
     def get_conversation(
         self, conversation_id: str | None
     ) -> Conversation | None:
-        if not conversation_id:
-            return None
-        return next(
-            filter(
-                lambda c: c and c.conversation_id == conversation_id,
-                self._conversations,
-            ),
-            None,
-        )
+        return self._store.get_conversation(conversation_id)
 
     def get_pending_messages(self) -> list[tuple[str, str]]:
         rval: list[tuple[str, str]] = []
         for message_id in self._pending_message_ids:
             if message_id in self._task_map:
-                task_id = self._task_map[message_id]
-                task = next(
-                    filter(lambda x: x.id == task_id, self._tasks), None
-                )
+                task = self._store.get_task(self._task_map[message_id])
                 if not task:
                     rval.append((message_id, ''))
                 elif task.history and task.history[-1].parts:
@@ -219,14 +209,14 @@ class InMemoryFakeAgentManager(ApplicationManager):
             return rval
         return [(x, '') for x in self._pending_message_ids]
 
-    def register_agent(self, url):
-        agent_data = get_agent_card(url)
+    async def register_agent(self, url):
+        agent_data = await get_agent_card(url)
         if not agent_data.url:
             agent_data.url = url
         self._agents.append(agent_data)
         self._save_agents()
 
-    def unregister_agent(self, url: str) -> bool:
+    async def unregister_agent(self, url: str) -> bool:
         initial_len = len(self._agents)
         self._agents = [agent for agent in self._agents if agent.url != url]
         if len(self._agents) < initial_len:
@@ -234,17 +224,33 @@ class InMemoryFakeAgentManager(ApplicationManager):
             return True
         return False
 
+    @property
+    def store(self) -> ConversationStore:
+        return self._store
+
+    @property
+    def broker(self) -> EventBroker:
+        return self._broker
+
+    @property
+    def fast_path_stats(self) -> FastPathStats:
+        return self._fast_path_stats
+
+    @property
+    def agent_health(self) -> dict[str, dict]:
+        return {}
+
     @property
     def agents(self) -> list[AgentCard]:
         return self._agents
 
     @property
     def conversations(self) -> list[Conversation]:
-        return self._conversations
+        return self._store.conversations
 
     @property
     def tasks(self) -> list[Task]:
-        return self._tasks
+        return self._store.tasks
 
     @property
     def events(self) -> list[Event]:
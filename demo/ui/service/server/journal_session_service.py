@@ -0,0 +1,310 @@
+import asyncio
+import json
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+from urllib.parse import quote, unquote
+
+from google.adk.events.event import Event as ADKEvent
+from google.adk.sessions.base_session_service import (
+    GetSessionConfig,
+    ListSessionsResponse,
+)
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.sessions.session import Session as ADKSession
+from google.adk.sessions.state import State
+
+
+JOURNAL_SUFFIX = '.jsonl'
+
+SessionKey = tuple[str, str, str]
+
+
+class JournalSessionService(InMemorySessionService):
+    """Session service persisting each session to an append-only JSONL journal.
+
+    Sessions live in <root_dir>/<app_name>/<user_id>/<session_id>.jsonl. The
+    first line of a journal is a snapshot of the session, every appended
+    event adds one compact line. After compact_after appended events the
+    journal is rewritten as a single snapshot. Journals are only read when
+    their session is first requested, and all file I/O runs on a single
+    writer thread so the event loop never blocks on disk and writes land in
+    order.
+
+    App and user scoped state are restored from the journals of the sessions
+    that have been loaded so far.
+    """
+
+    def __init__(self, root_dir: str = 'sessions', compact_after: int = 500):
+        super().__init__()
+        self.root_dir = root_dir
+        self.compact_after = compact_after
+        self._journals: dict[SessionKey, str] = {}
+        self._appended: dict[SessionKey, int] = {}
+        self._load_lock = asyncio.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='session-journal'
+        )
+        os.makedirs(root_dir, exist_ok=True)
+        self._scan()
+
+    def _scan(self):
+        """Indexes journals on disk without reading them."""
+        for app_dir in os.scandir(self.root_dir):
+            if not app_dir.is_dir():
+                continue
+            for user_dir in os.scandir(app_dir.path):
+                if not user_dir.is_dir():
+                    continue
+                for entry in os.scandir(user_dir.path):
+                    if entry.name.endswith(JOURNAL_SUFFIX):
+                        key = (
+                            unquote(app_dir.name),
+                            unquote(user_dir.name),
+                            unquote(entry.name[: -len(JOURNAL_SUFFIX)]),
+                        )
+                        self._journals[key] = entry.path
+
+    def _path(self, key: SessionKey) -> str:
+        app_name, user_id, session_id = key
+        return os.path.join(
+            self.root_dir,
+            quote(app_name, safe=''),
+            quote(user_id, safe=''),
+            quote(session_id, safe='') + JOURNAL_SUFFIX,
+        )
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> ADKSession:
+        if session_id:
+            await self._ensure_loaded((app_name, user_id, session_id.strip()))
+        session = await super().create_session(
+            app_name=app_name,
+            user_id=user_id,
+            state=state,
+            session_id=session_id,
+        )
+        key = (app_name, user_id, session.id)
+        self._journals[key] = self._path(key)
+        await self._write_snapshot(key)
+        return session
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[ADKSession]:
+        if session_id:
+            await self._ensure_loaded((app_name, user_id, session_id.strip()))
+        return await super().get_session(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            config=config,
+        )
+
+    async def list_sessions(
+        self, *, app_name: str, user_id: Optional[str] = None
+    ) -> ListSessionsResponse:
+        for key in list(self._journals):
+            if key[0] == app_name and user_id in (None, key[1]):
+                await self._ensure_loaded(key)
+        return await super().list_sessions(app_name=app_name, user_id=user_id)
+
+    def session_ids(self, app_name: str, user_id: str) -> list[str]:
+        """Ids of the sessions with a journal, without reading them."""
+        return [
+            key[2] for key in self._journals if key[:2] == (app_name, user_id)
+        ]
+
+    async def delete_session(
+        self, *, app_name: str, user_id: str, session_id: str
+    ) -> None:
+        await super().delete_session(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+        key = (app_name, user_id, session_id.strip())
+        self._appended.pop(key, None)
+        path = self._journals.pop(key, None)
+        if path:
+            await self._run(_remove, path)
+
+    async def append_event(
+        self, session: ADKSession, event: ADKEvent
+    ) -> ADKEvent:
+        key = (session.app_name, session.user_id, session.id)
+        await self._ensure_loaded(key)
+        storage_session = self._storage_session(key)
+        count = len(storage_session.events) if storage_session else 0
+        event = await super().append_event(session=session, event=event)
+        if storage_session is None or len(storage_session.events) == count:
+            # Partial or re-delivered events are not persisted.
+            return event
+        # The stored event has its temp state already trimmed.
+        line = (
+            '{"event":'
+            + storage_session.events[-1].model_dump_json(exclude_none=True)
+            + '}\n'
+        )
+        await self._run(_append, self._journals[key], line)
+        self._appended[key] = self._appended.get(key, 0) + 1
+        if self._appended[key] >= self.compact_after:
+            await self._write_snapshot(key)
+        return event
+
+    async def close(self):
+        await self._run(lambda: None)
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, fn, *args
+        )
+
+    def _storage_session(self, key: SessionKey) -> ADKSession | None:
+        app_name, user_id, session_id = key
+        return self.sessions.get(app_name, {}).get(user_id, {}).get(session_id)
+
+    async def _write_snapshot(self, key: SessionKey):
+        """Rewrites a journal as a single snapshot line."""
+        app_name, user_id, _ = key
+        session = self._storage_session(key)
+        if session is None:
+            return
+        line = json.dumps(
+            {
+                'app_state': self.app_state.get(app_name, {}),
+                'user_state': self.user_state.get(app_name, {}).get(
+                    user_id, {}
+                ),
+            },
+            separators=(',', ':'),
+            default=str,
+        )
+        line = (
+            line[:-1]
+            + ',"snapshot":'
+            + session.model_dump_json(exclude_none=True)
+            + '}\n'
+        )
+        self._appended[key] = 0
+        await self._run(_replace, self._journals[key], line)
+
+    async def _ensure_loaded(self, key: SessionKey):
+        if self._storage_session(key) or key not in self._journals:
+            return
+        async with self._load_lock:
+            if self._storage_session(key) or key not in self._journals:
+                return
+            try:
+                record, events, torn = await self._run(
+                    _read_journal, self._journals[key]
+                )
+            except (OSError, ValueError) as e:
+                print(
+                    'Could not load session journal'
+                    f' {self._journals[key]}: {e}'
+                )
+                return
+            self._restore(key, record, events)
+            self._appended[key] = len(events)
+            if torn:
+                # Drop the partially written tail before appending again.
+                await self._write_snapshot(key)
+
+    def _restore(
+        self,
+        key: SessionKey,
+        record: dict[str, Any],
+        events: list[ADKEvent],
+    ):
+        app_name, user_id, session_id = key
+        session = ADKSession.model_validate(record['snapshot'])
+        app_state = self.app_state.setdefault(app_name, {})
+        for k, value in record.get('app_state', {}).items():
+            app_state.setdefault(k, value)
+        user_state = self.user_state.setdefault(app_name, {}).setdefault(
+            user_id, {}
+        )
+        for k, value in record.get('user_state', {}).items():
+            user_state.setdefault(k, value)
+        for event in events:
+            session.events.append(event)
+            session.last_update_time = event.timestamp
+            if not (event.actions and event.actions.state_delta):
+                continue
+            deltas = _split_state_delta(event.actions.state_delta)
+            app_state.update(deltas['app'])
+            user_state.update(deltas['user'])
+            session.state.update(deltas['session'])
+        self.sessions.setdefault(app_name, {}).setdefault(user_id, {})[
+            session_id
+        ] = session
+
+
+def _split_state_delta(delta: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Splits a state delta into app, user and session state by key prefix.
+
+    Temporary keys are dropped, as InMemorySessionService does when an
+    event is appended.
+    """
+    deltas: dict[str, dict[str, Any]] = {'app': {}, 'user': {}, 'session': {}}
+    for key, value in delta.items():
+        if key.startswith(State.APP_PREFIX):
+            deltas['app'][key.removeprefix(State.APP_PREFIX)] = value
+        elif key.startswith(State.USER_PREFIX):
+            deltas['user'][key.removeprefix(State.USER_PREFIX)] = value
+        elif not key.startswith(State.TEMP_PREFIX):
+            deltas['session'][key] = value
+    return deltas
+
+
+def _read_journal(path: str) -> tuple[dict[str, Any], list[ADKEvent], bool]:
+    """Returns (snapshot record, events appended after it, has torn tail)."""
+    with open(path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    if not lines:
+        raise ValueError('empty journal')
+    record = json.loads(lines[0])
+    events = []
+    torn = False
+    for line in lines[1:]:
+        try:
+            events.append(ADKEvent.model_validate(json.loads(line)['event']))
+        except (ValueError, KeyError):
+            # A crash can leave a partially written last line.
+            torn = True
+            break
+    return record, events, torn
+
+
+def _append(path: str, line: str):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(line)
+
+
+def _replace(path: str, content: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,73 @@
+from demo.ui.service.types import FastPathMetrics
+
+
+class FastPathStats:
+    """Hit rate and latency of routing that bypasses the host LLM.
+
+    Latencies are exponentially weighted moving averages. The time saved by
+    a fast path request is estimated as the average host LLM latency minus
+    the request's own latency, since the same request can not be timed both
+    ways.
+    """
+
+    def __init__(self, mode: str = '', threshold: float = 0.0, alpha: float = 0.2):
+        self.mode = mode
+        self.threshold = threshold
+        self.alpha = alpha
+        self.requests = 0
+        self.fast_path_hits = 0
+        self.fallbacks = 0
+        self.host_latency: float | None = None
+        self.direct_latency: float | None = None
+        self.saved_seconds = 0.0
+        self.last_saved_seconds = 0.0
+
+    def _average(self, current: float | None, seconds: float) -> float:
+        if current is None:
+            return seconds
+        return current + self.alpha * (seconds - current)
+
+    def record_host(self, seconds: float):
+        """A request that was answered by the host LLM."""
+        self.requests += 1
+        self.host_latency = self._average(self.host_latency, seconds)
+
+    def record_direct(self, seconds: float) -> float:
+        """A request answered on the fast path, returns the estimated saving."""
+        self.requests += 1
+        self.fast_path_hits += 1
+        self.direct_latency = self._average(self.direct_latency, seconds)
+        saved = 0.0
+        if self.host_latency is not None:
+            saved = max(self.host_latency - seconds, 0.0)
+        self.saved_seconds += saved
+        self.last_saved_seconds = saved
+        return saved
+
+    def record_fallback(self):
+        """A confident route whose agent failed, so the host LLM took over."""
+        self.fallbacks += 1
+
+    @property
+    def hit_rate(self) -> float:
+        return self.fast_path_hits / self.requests if self.requests else 0.0
+
+    def metrics(self) -> FastPathMetrics:
+        return FastPathMetrics(
+            mode=self.mode,
+            threshold=self.threshold,
+            requests=self.requests,
+            fast_path_hits=self.fast_path_hits,
+            fallbacks=self.fallbacks,
+            hit_rate=self.hit_rate,
+            host_latency=self.host_latency or 0.0,
+            direct_latency=self.direct_latency or 0.0,
+            saved_seconds=self.saved_seconds,
+            saved_seconds_per_hit=(
+                self.saved_seconds / self.fast_path_hits
+                if self.fast_path_hits
+                else 0.0
+            ),
+            last_saved_seconds=self.last_saved_seconds,
+        )
+
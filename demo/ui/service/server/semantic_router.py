@@ -0,0 +1,231 @@
+import asyncio
+import hashlib
+import os
+
+from collections.abc import Callable
+
+import numpy as np
+
+from a2a.types import AgentCard
+
+from demo.ui.service.server.agent_router import TOKEN_RE
+
+
+# Embeds a batch of texts into an (n, dim) array. Embedders may block, for
+# example on a network call, the router runs them in a worker thread.
+Embedder = Callable[[list[str]], np.ndarray]
+
+# Cosine similarity the best agent needs to be routed without the LLM.
+DEFAULT_THRESHOLD = 0.35
+
+
+class HashingEmbedder:
+    """Deterministic feature hashing embedder that works offline.
+
+    Tokens and token bigrams are hashed into a fixed number of signed
+    buckets, so texts sharing words get similar vectors. It needs no model
+    or network access and gives the same vectors on every run.
+    """
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+        self.name = f'hashing-{dim}'
+
+    def __call__(self, texts: list[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = TOKEN_RE.findall(text.lower())
+            features = tokens + [
+                f'{a} {b}' for a, b in zip(tokens, tokens[1:], strict=False)
+            ]
+            for feature in features:
+                digest = hashlib.blake2b(
+                    feature.encode('utf-8'), digest_size=8
+                ).digest()
+                value = int.from_bytes(digest, 'little')
+                sign = 1.0 if value & 1 else -1.0
+                vectors[row, (value >> 1) % self.dim] += sign
+        return vectors
+
+
+class GenAIEmbedder:
+    """Embedder backed by the Gemini embedding API."""
+
+    def __init__(self, model: str = 'text-embedding-004'):
+        from google import genai
+
+        self._client = genai.Client()
+        self.model = model
+        self.name = f'genai-{model}'
+
+    def __call__(self, texts: list[str]) -> np.ndarray:
+        response = self._client.models.embed_content(
+            model=self.model, contents=texts
+        )
+        return np.array(
+            [e.values for e in response.embeddings], dtype=np.float32
+        )
+
+
+def card_texts(card: AgentCard) -> list[str]:
+    """Texts embedded for an agent, one per skill and per example."""
+    texts = [f'{card.name}. {card.description}']
+    for skill in card.skills:
+        texts.append(
+            f'{skill.name}. {skill.description}. {" ".join(skill.tags)}'
+        )
+        texts.extend(skill.examples or [])
+    return texts
+
+
+def fingerprint(embedder_name: str, texts: list[str]) -> str:
+    digest = hashlib.sha256(embedder_name.encode('utf-8'))
+    for text in texts:
+        digest.update(b'\0' + text.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class SemanticAgentRouter:
+    """Routes messages to agents by embedding similarity.
+
+    Every skill and example of a registered agent is embedded once. The
+    vectors of all agents are stacked into one normalized matrix, so routing
+    a message is a single embedding call, one matrix-vector product and a
+    per-agent max. Agents whose best similarity is below threshold are not
+    routed, leaving the decision to the host LLM. Embedding calls run in a
+    worker thread so a remote embedder does not block the event loop.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder | None = None,
+        threshold: float = DEFAULT_THRESHOLD,
+    ):
+        self.embedder = embedder or HashingEmbedder()
+        self.threshold = threshold
+        self._vectors: dict[str, np.ndarray] = {}
+        self._fingerprints: dict[str, str] = {}
+        self._matrix: np.ndarray | None = None
+        self._owners: np.ndarray | None = None
+        self._urls: list[str] = []
+
+    @property
+    def embedder_name(self) -> str:
+        return getattr(self.embedder, 'name', type(self.embedder).__name__)
+
+    async def register_agent(
+        self,
+        agent_card: AgentCard,
+        cached: dict[str, tuple[str, np.ndarray]] | None = None,
+    ):
+        """Embeds an agent, reusing cached vectors whose fingerprint matches."""
+        texts = card_texts(agent_card)
+        key = fingerprint(self.embedder_name, texts)
+        cached_entry = (cached or {}).get(agent_card.url)
+        if cached_entry and cached_entry[0] == key:
+            vectors = cached_entry[1]
+        else:
+            vectors = _normalize(await self._embed(texts))
+        self._vectors[agent_card.url] = vectors
+        self._fingerprints[agent_card.url] = key
+        self._matrix = None
+
+    def unregister_agent(self, url: str):
+        self._vectors.pop(url, None)
+        self._fingerprints.pop(url, None)
+        self._matrix = None
+
+    async def _embed(self, texts: list[str]) -> np.ndarray:
+        return await asyncio.to_thread(self.embedder, texts)
+
+    def _build(self):
+        self._urls = list(self._vectors)
+        if not self._urls:
+            self._matrix = np.zeros((0, 0), dtype=np.float32)
+            self._owners = np.zeros(0, dtype=np.int64)
+            return
+        self._matrix = np.concatenate(
+            [self._vectors[url] for url in self._urls]
+        )
+        self._owners = np.concatenate(
+            [
+                np.full(len(self._vectors[url]), i, dtype=np.int64)
+                for i, url in enumerate(self._urls)
+            ]
+        )
+
+    async def top_k(
+        self, message_text: str, k: int = 3
+    ) -> list[tuple[str, float]]:
+        """Best k agents as (url, cosine similarity), best first."""
+        if self._matrix is None:
+            self._build()
+        # Agents may be registered while the message is embedded.
+        matrix, owners, urls = self._matrix, self._owners, self._urls
+        if not urls or not message_text:
+            return []
+        query = _normalize(await self._embed([message_text]))[0]
+        similarities = matrix @ query
+        scores = np.full(len(urls), -np.inf, dtype=np.float32)
+        np.maximum.at(scores, owners, similarities)
+        k = min(k, len(scores))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        return [(urls[i], float(scores[i])) for i in best]
+
+    async def route_message(self, message_text: str) -> str | None:
+        """Best agent url, or None when no agent reaches the threshold."""
+        matches = await self.top_k(message_text, k=1)
+        if matches and matches[0][1] >= self.threshold:
+            return matches[0][0]
+        return None
+
+    def save(self, path: str):
+        urls = list(self._vectors)
+        np.savez(
+            path,
+            embedder=np.array(self.embedder_name),
+            urls=np.array(urls, dtype=str),
+            fingerprints=np.array(
+                [self._fingerprints[url] for url in urls], dtype=str
+            ),
+            counts=np.array(
+                [len(self._vectors[url]) for url in urls], dtype=np.int64
+            ),
+            matrix=(
+                np.concatenate([self._vectors[url] for url in urls])
+                if urls
+                else np.zeros((0, 0), dtype=np.float32)
+            ),
+        )
+
+    def load(self, path: str) -> dict[str, tuple[str, np.ndarray]]:
+        """Reads vectors saved by save, keyed by agent url.
+
+        The result is meant to be passed to register_agent, which only uses
+        vectors whose fingerprint matches the current card and embedder.
+        """
+        if not os.path.exists(path):
+            return {}
+        try:
+            with np.load(path) as data:
+                if str(data['embedder']) != self.embedder_name:
+                    return {}
+                cached = {}
+                offsets = np.cumsum(np.concatenate([[0], data['counts']]))
+                for i, url in enumerate(data['urls']):
+                    cached[str(url)] = (
+                        str(data['fingerprints'][i]),
+                        data['matrix'][offsets[i] : offsets[i + 1]],
+                    )
+                return cached
+        except (OSError, KeyError, ValueError) as e:
+            print(f'Could not load agent embeddings from {path}: {e}')
+            return {}
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
@@ -1,35 +1,76 @@
 import asyncio
 import base64
+import binascii
 import os
-import threading
-import uuid
-
-from typing import cast
 
 import httpx
 
 from a2a.types import FilePart, FileWithUri, Message, Part, Role
 from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from ..types import (
+    AgentHealthInfo,
+    ConversationDelta,
     CreateConversationResponse,
+    CursorParams,
     DeleteConversationResponse,
+    DispatchStats,
+    EventDelta,
+    EventPage,
+    EventQuery,
+    EventRowPage,
+    EventRowQuery,
+    GetAgentHealthResponse,
     GetEventResponse,
+    GetDispatchStatsResponse,
+    GetFastPathMetricsResponse,
+    GetEventSinceResponse,
+    GetStateSnapshotResponse,
+    JSONRPCError,
     ListAgentResponse,
     ListConversationResponse,
+    ListConversationSinceResponse,
     ListMessageResponse,
+    ListMessageSinceResponse,
     ListTaskResponse,
+    ListTaskSinceResponse,
+    MessageDelta,
     MessageInfo,
     PendingMessageResponse,
+    QueryEventResponse,
+    QueryEventRowsResponse,
+    QueryTaskRowsResponse,
     RegisterAgentResponse,
     SendMessageResponse,
+    SnapshotParams,
+    StateSnapshot,
+    TaskDelta,
+    TaskRowPage,
+    TaskRowQuery,
     UnregisterAgentRequest,
     UnregisterAgentResponse,
 )
 
 from .adk_host_manager import ADKHostManager, get_message_id
 from .application_manager import ApplicationManager
+from .artifact_handles import FILE_ROUTE
+from .blob_store import BlobQuotaError
+from .dispatcher import DispatcherBusyError, MessageDispatcher
+from .file_cache import FileCache, etag_matches, parse_range
 from .in_memory_manager import InMemoryFakeAgentManager
+from .table_rows import event_row, task_row
+
+
+# Seconds between SSE keep-alive comments on an idle stream.
+STREAM_HEARTBEAT_SECONDS = 15
+# JSON-RPC error code returned with HTTP 429 when the dispatcher is full.
+BUSY_ERROR_CODE = -32000
+# Largest page returned by a single events/query, events/rows or task/rows
+# call.
+MAX_EVENT_PAGE = 1000
+# Bytes per chunk when streaming a file from disk.
+FILE_CHUNK_SIZE = 64 * 1024
 
 
 class ConversationServer:
@@ -48,9 +89,16 @@ class ConversationServer:
         )
 
         self.manager: ApplicationManager = None
+        self._dispatcher: MessageDispatcher = None
 
-        self._file_cache = {}  # dict[str, FilePart] maps file id to message data
-        self._message_to_cache = {}  # dict[str, str] maps message id to cache id
+        self._file_cache = FileCache(
+            max_bytes=int(
+                os.environ.get('A2A_UI_FILE_CACHE_BYTES', 64 * 1024 * 1024)
+            ),
+            ttl_seconds=float(os.environ.get('A2A_UI_FILE_CACHE_TTL', 0))
+            or None,
+            spill_dir=os.environ.get('A2A_UI_FILE_CACHE_DIR') or None,
+        )
 
         app.add_api_route(
             '/conversation/create', self._create_conversation, methods=['POST']
@@ -69,16 +117,50 @@ class ConversationServer:
         app.add_api_route(
             '/message/pending', self._pending_messages, methods=['POST']
         )
+        app.add_api_route(
+            '/message/queue', self._dispatch_stats, methods=['POST']
+        )
+        app.add_api_route(
+            '/routing/stats', self._routing_stats, methods=['POST']
+        )
         app.add_api_route('/task/list', self._list_tasks, methods=['POST'])
+        app.add_api_route('/task/rows', self._query_task_rows, methods=['POST'])
+        app.add_api_route(
+            '/conversation/list_since',
+            self._list_conversation_since,
+            methods=['POST'],
+        )
+        app.add_api_route(
+            '/message/list_since', self._list_messages_since, methods=['POST']
+        )
+        app.add_api_route(
+            '/task/list_since', self._list_tasks_since, methods=['POST']
+        )
+        app.add_api_route(
+            '/events/get_since', self._get_events_since, methods=['POST']
+        )
+        app.add_api_route(
+            '/state/snapshot', self._state_snapshot, methods=['POST']
+        )
+        app.add_api_route(
+            '/events/query', self._query_events, methods=['POST']
+        )
+        app.add_api_route(
+            '/events/rows', self._query_event_rows, methods=['POST']
+        )
+        app.add_api_route(
+            '/events/stream', self._stream_events, methods=['GET']
+        )
         app.add_api_route(
             '/agent/register', self._register_agent, methods=['POST']
         )
         app.add_api_route('/agent/list', self._list_agents, methods=['POST'])
+        app.add_api_route('/agent/health', self._agent_health, methods=['POST'])
         app.add_api_route(
             '/agent/unregister', self._unregister_agent, methods=['POST']
         )
         app.add_api_route(
-            '/message/file/{file_id}', self._files, methods=['GET']
+            f'{FILE_ROUTE}/{{file_id}}', self._files, methods=['GET']
         )
         app.add_api_route(
             '/api_key/update', self._update_api_key, methods=['POST']
@@ -101,6 +183,19 @@ class ConversationServer:
             self.manager = InMemoryFakeAgentManager()
         if isinstance(self.manager, ADKHostManager):
             self.manager.update_api_key(self._api_key)
+        self._dispatcher = MessageDispatcher(
+            lambda message: self.manager.process_message(message),
+            max_workers=int(os.environ.get('A2A_UI_DISPATCH_WORKERS', 4)),
+            max_queue_size=int(
+                os.environ.get('A2A_UI_DISPATCH_QUEUE_SIZE', 100)
+            ),
+        )
+        self._dispatcher.start()
+
+    async def shutdown(self):
+        if self._dispatcher:
+            await self._dispatcher.stop()
+        await self.manager.close()
 
     async def _create_conversation(self):
         c = await self.manager.create_conversation()
@@ -118,21 +213,23 @@ class ConversationServer:
         if isinstance(params.get("role"), str):
             params["role"] = Role(params["role"])
         message = Message(**params)
+        await self.manager.load_conversation(message.context_id)
         message = self.manager.sanitize_message(message)
-        loop = asyncio.get_event_loop()
-        if isinstance(self.manager, ADKHostManager):
-            t = threading.Thread(
-                target=lambda: cast(
-                    'ADKHostManager', self.manager
-                ).process_message_threadsafe(message, loop)
-            )
-        else:
-            t = threading.Thread(
-                target=lambda: asyncio.run(
-                    self.manager.process_message(message)
-                )
+        try:
+            self._dispatcher.submit(message)
+        except DispatcherBusyError as e:
+            return JSONResponse(
+                status_code=429,
+                headers={'Retry-After': '1'},
+                content=SendMessageResponse(
+                    id=message_data.get('id'),
+                    error=JSONRPCError(
+                        code=BUSY_ERROR_CODE,
+                        message='Server busy, retry later',
+                        data=str(e),
+                    ),
+                ).model_dump(mode='json'),
             )
-        t.start()
         return SendMessageResponse(
             result=MessageInfo(
                 message_id=message.message_id,
@@ -143,62 +240,315 @@ class ConversationServer:
     async def _list_messages(self, request: Request):
         message_data = await request.json()
         conversation_id = message_data['params']
-        conversation = self.manager.get_conversation(conversation_id)
+        conversation = await self.manager.load_conversation(conversation_id)
         if conversation:
             return ListMessageResponse(
-                result=self.cache_content(conversation.messages)
+                result=await self.cache_content(conversation.messages)
             )
         return ListMessageResponse(result=[])
 
-    def cache_content(self, messages: list[Message]):
+    async def cache_content(self, messages: list[Message]):
+        """Replaces inline file bytes with url references for a listing.
+
+        Bytes that go to the manager's blob store are kept there as long as
+        the conversation exists, so those parts are replaced in the stored
+        message too and decoded only once. Bytes that only fit the bounded
+        file cache stay in the message, which is the copy the cache entry is
+        refilled from after it was evicted, and only the listed copy of the
+        message links to the cache.
+        """
         rval = []
         for m in messages:
-            message_id = get_message_id(m)
+            message_id = get_message_id(m) or m.message_id
             if not message_id:
                 rval.append(m)
                 continue
-            new_parts: list[Part] = []
+            stored_parts: list[Part] = []
+            listed_parts: list[Part] = []
+            linked_to_cache = False
             for i, p in enumerate(m.parts):
                 part = p.root
-                if part.kind != 'file':
-                    new_parts.append(p)
+                if part.kind != 'file' or isinstance(part.file, FileWithUri):
+                    stored_parts.append(p)
+                    listed_parts.append(p)
                     continue
-                message_part_id = f'{message_id}:{i}'
-                if message_part_id in self._message_to_cache:
-                    cache_id = self._message_to_cache[message_part_id]
-                else:
-                    cache_id = str(uuid.uuid4())
-                    self._message_to_cache[message_part_id] = cache_id
+                mime_type = part.file.mime_type or 'application/octet-stream'
+                file_id = f'{message_id}-{i}'
+                blob_id = None
+                if self._file_cache.get(file_id) is None:
+                    data = decode_file_bytes(part.file.bytes)
+                    blob_id = await self._store_blob(
+                        data, mime_type, m.context_id or ''
+                    )
+                    if blob_id is None:
+                        self._file_cache.put(file_id, data, mime_type)
+                linked_to_cache = linked_to_cache or blob_id is None
                 # Replace the part data with a url reference
-                new_parts.append(
-                    Part(
-                        root=FilePart(
-                            file=FileWithUri(
-                                mime_type=part.file.mime_type,
-                                uri=f'/message/file/{cache_id}',
-                            )
+                url_part = Part(
+                    root=FilePart(
+                        file=FileWithUri(
+                            mime_type=mime_type,
+                            name=part.file.name,
+                            uri=f'{FILE_ROUTE}/{blob_id or file_id}',
                         )
                     )
                 )
-                if cache_id not in self._file_cache:
-                    self._file_cache[cache_id] = part
-            m.parts = new_parts
+                stored_parts.append(url_part if blob_id else p)
+                listed_parts.append(url_part)
+            m.parts = stored_parts
+            if linked_to_cache:
+                m = m.model_copy(update={'parts': listed_parts})
             rval.append(m)
         return rval
 
+    async def _store_blob(
+        self, data: bytes, mime_type: str, conversation_id: str
+    ) -> str | None:
+        """Stores file bytes in the manager's blob store, returns their id.
+
+        The bytes are hashed and written in a worker thread. Returns None
+        when the manager has no blob store or its quota is reached.
+        """
+        blob_store = self.manager.blob_store
+        if blob_store is None:
+            return None
+        try:
+            return await asyncio.to_thread(
+                blob_store.put, data, mime_type, conversation_id
+            )
+        except BlobQuotaError as e:
+            print(f'File not stored in the blob store: {e}')
+            return None
+
     async def _pending_messages(self):
         return PendingMessageResponse(
             result=self.manager.get_pending_messages()
         )
 
-    def _list_conversation(self):
-        return ListConversationResponse(result=self.manager.conversations)
+    async def _dispatch_stats(self):
+        dispatcher = self._dispatcher
+        return GetDispatchStatsResponse(
+            result=DispatchStats(
+                queue_depth=dispatcher.queue_depth,
+                in_flight=dispatcher.in_flight,
+                active_conversations=dispatcher.active_conversations,
+                workers=dispatcher.max_workers,
+                max_queue_size=dispatcher.max_queue_size,
+                processed=dispatcher.processed,
+                failed=dispatcher.failed,
+                rejected=dispatcher.rejected,
+            )
+        )
 
-    def _get_events(self):
+    async def _routing_stats(self):
+        return GetFastPathMetricsResponse(
+            result=self.manager.fast_path_stats.metrics()
+        )
+
+    async def _agent_health(self):
+        return GetAgentHealthResponse(
+            result=[
+                AgentHealthInfo(name=name, **summary)
+                for name, summary in self.manager.agent_health.items()
+            ]
+        )
+
+    # The list handlers are async so they run on the event loop, never in a
+    # worker thread concurrently with the writers. They return snapshot
+    # copies, which stay unchanged while the response is serialized.
+    async def _list_conversation(self):
+        return ListConversationResponse(
+            result=list(self.manager.store.snapshot().conversations)
+        )
+
+    async def _get_events(self):
         return GetEventResponse(result=self.manager.events)
 
-    def _list_tasks(self):
-        return ListTaskResponse(result=self.manager.tasks)
+    async def _list_tasks(self):
+        return ListTaskResponse(
+            result=list(self.manager.store.snapshot().tasks)
+        )
+
+    async def _list_conversation_since(self, request: Request):
+        params = await self._cursor_params(request)
+        cursor, conversations, deleted_ids, reset = (
+            self.manager.store.conversations_since(params.cursor)
+        )
+        return ListConversationSinceResponse(
+            result=ConversationDelta(
+                cursor=cursor,
+                reset=reset,
+                conversations=conversations,
+                deleted_ids=deleted_ids,
+            )
+        )
+
+    async def _list_messages_since(self, request: Request):
+        params = await self._cursor_params(request)
+        await self.manager.load_conversation(params.conversation_id)
+        cursor, messages, reset = self.manager.store.messages_since(
+            params.conversation_id, params.cursor
+        )
+        return ListMessageSinceResponse(
+            result=MessageDelta(
+                cursor=cursor,
+                reset=reset,
+                messages=await self.cache_content(messages),
+            )
+        )
+
+    async def _list_tasks_since(self, request: Request):
+        params = await self._cursor_params(request)
+        cursor, tasks, deleted_ids, reset = self.manager.store.tasks_since(
+            params.cursor
+        )
+        return ListTaskSinceResponse(
+            result=TaskDelta(
+                cursor=cursor,
+                reset=reset,
+                tasks=tasks,
+                deleted_ids=deleted_ids,
+            )
+        )
+
+    async def _get_events_since(self, request: Request):
+        params = await self._cursor_params(request)
+        cursor, events, reset = self.manager.store.events_since(params.cursor)
+        return GetEventSinceResponse(
+            result=EventDelta(cursor=cursor, reset=reset, events=events)
+        )
+
+    async def _state_snapshot(self, request: Request):
+        message_data = await request.json()
+        params = SnapshotParams(**(message_data.get('params') or {}))
+        await self.manager.load_conversation(params.conversation_id)
+        store = self.manager.store
+        # Every part is read at the same version before awaiting the file
+        # bytes of the changed messages being stored.
+        messages = None
+        changed = []
+        if params.conversation_id:
+            cursor, changed, reset = store.messages_since(
+                params.conversation_id, params.message_cursor
+            )
+            messages = MessageDelta(cursor=cursor, reset=reset, messages=[])
+        cursor, conversations, deleted_ids, reset = store.conversations_since(
+            params.conversation_cursor
+        )
+        conversation_delta = ConversationDelta(
+            cursor=cursor,
+            reset=reset,
+            conversations=conversations,
+            deleted_ids=deleted_ids,
+        )
+        cursor, tasks, deleted_ids, reset = store.tasks_since(
+            params.task_cursor, params.conversation_id
+        )
+        snapshot = StateSnapshot(
+            version=store.version,
+            messages=messages,
+            conversations=conversation_delta,
+            tasks=TaskDelta(
+                cursor=cursor,
+                reset=reset,
+                tasks=tasks,
+                deleted_ids=deleted_ids,
+            ),
+            pending=self.manager.get_pending_messages(),
+        )
+        if messages is not None:
+            messages.messages = await self.cache_content(changed)
+        return GetStateSnapshotResponse(result=snapshot)
+
+    async def _query_events(self, request: Request):
+        message_data = await request.json()
+        query = EventQuery(**(message_data.get('params') or {}))
+        events, next_before = self._run_event_query(query)
+        return QueryEventResponse(
+            result=EventPage(
+                events=events,
+                next_before=next_before,
+                total=self._count_events(query),
+            )
+        )
+
+    async def _query_event_rows(self, request: Request):
+        message_data = await request.json()
+        query = EventRowQuery(**(message_data.get('params') or {}))
+        events, next_before = self._run_event_query(query)
+        return QueryEventRowsResponse(
+            result=EventRowPage(
+                rows=[
+                    event_row(event, query.content_length)
+                    for event in reversed(events)
+                ],
+                next_before=next_before,
+                total=self._count_events(query),
+            )
+        )
+
+    def _run_event_query(self, query: EventQuery):
+        return self.manager.store.query_events(
+            conversation_id=query.conversation_id or None,
+            actor=query.actor or None,
+            since=query.since,
+            until=query.until,
+            before=query.before,
+            limit=min(max(query.limit, 0), MAX_EVENT_PAGE),
+        )
+
+    def _count_events(self, query: EventQuery) -> int:
+        return self.manager.store.count_events(
+            conversation_id=query.conversation_id or None,
+            actor=query.actor or None,
+            since=query.since,
+            until=query.until,
+        )
+
+    async def _query_task_rows(self, request: Request):
+        message_data = await request.json()
+        query = TaskRowQuery(**(message_data.get('params') or {}))
+        tasks, total = self.manager.store.page_tasks(
+            query.conversation_id or None,
+            offset=max(query.offset, 0),
+            limit=min(max(query.limit, 0), MAX_EVENT_PAGE),
+        )
+        return QueryTaskRowsResponse(
+            result=TaskRowPage(
+                rows=[task_row(task, query.content_length) for task in tasks],
+                total=total,
+            )
+        )
+
+    async def _stream_events(self, request: Request, conversation_id: str = ''):
+        """Server-Sent Events stream of host notifications.
+
+        Scoped to one conversation when conversation_id is given. Each
+        subscriber has a bounded queue, see EventBroker.
+        """
+        broker = self.manager.broker
+        subscription = broker.subscribe(conversation_id or None)
+
+        async def stream():
+            try:
+                while not await request.is_disconnected():
+                    item = await subscription.get(STREAM_HEARTBEAT_SECONDS)
+                    if item is None:
+                        yield ': keep-alive\n\n'
+                    else:
+                        yield f'data: {item}\n\n'
+            finally:
+                broker.unsubscribe(subscription)
+
+        return StreamingResponse(
+            stream(),
+            media_type='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+        )
+
+    async def _cursor_params(self, request: Request) -> CursorParams:
+        message_data = await request.json()
+        return CursorParams(**(message_data.get('params') or {}))
 
     async def _register_agent(self, request: Request):
         message_data = await request.json()
@@ -215,16 +565,60 @@ class ConversationServer:
     async def _list_agents(self):
         return ListAgentResponse(result=self.manager.agents)
 
-    def _files(self, file_id):
-        if file_id not in self._file_cache:
-            raise Exception('file not found')
-        part = self._file_cache[file_id]
-        if 'image' in part.file.mime_type:
+    async def _files(self, file_id: str, request: Request):
+        entry = self._file_cache.get(file_id)
+        if entry is None:
+            # Artifact handles and blobs are served from the manager's blob
+            # store on disk.
+            entry = await self.manager.load_file(file_id)
+            if entry is None:
+                return Response(status_code=404)
+        headers = {
+            'ETag': entry.etag,
+            'Accept-Ranges': 'bytes',
+            'Cache-Control': 'private, max-age=3600',
+        }
+        if etag_matches(request.headers.get('if-none-match'), entry.etag):
+            return Response(status_code=304, headers=headers)
+        byte_range = None
+        range_header = request.headers.get('range')
+        if range_header and etag_matches(
+            request.headers.get('if-range') or entry.etag, entry.etag
+        ):
+            try:
+                byte_range = parse_range(range_header, entry.size)
+            except ValueError:
+                return Response(
+                    status_code=416,
+                    headers={'Content-Range': f'bytes */{entry.size}'},
+                )
+        status_code = 200
+        start, length = 0, entry.size
+        if byte_range is not None:
+            start, end = byte_range
+            length = end + 1 - start
+            status_code = 206
+            headers['Content-Range'] = f'bytes {start}-{end}/{entry.size}'
+        try:
+            if entry.data is None and entry.path:
+                # Files on disk are streamed in chunks, not read whole, and
+                # opened off the event loop.
+                f = await asyncio.to_thread(_open_at, entry.path, start)
+                return StreamingResponse(
+                    _read_chunks(f, length),
+                    status_code=status_code,
+                    media_type=entry.mime_type,
+                    headers={**headers, 'Content-Length': str(length)},
+                )
             return Response(
-                content=base64.b64decode(part.file.bytes),
-                media_type=part.file.mime_type,
+                content=self._file_cache.read(entry, start, start + length),
+                status_code=status_code,
+                media_type=entry.mime_type,
+                headers=headers,
             )
-        return Response(content=part.file.bytes, media_type=part.file.mime_type)
+        except FileNotFoundError:
+            # The spilled or stored file was removed meanwhile.
+            return Response(status_code=404)
 
     async def _update_api_key(self, request: Request):
         """Update the API key"""
@@ -240,3 +634,35 @@ class ConversationServer:
         except Exception as e:
             print(e)
             return {'status': 'error', 'message': str(e)}
+
+
+def decode_file_bytes(data: str) -> bytes:
+    """Decodes the base64 bytes of a file part, keeping raw text as is."""
+    try:
+        return base64.b64decode(data, validate=True)
+    except (binascii.Error, ValueError):
+        return data.encode('utf-8')
+
+
+def _open_at(path: str, offset: int):
+    """Opens a binary file positioned at offset."""
+    f = open(path, 'rb')
+    f.seek(offset)
+    return f
+
+
+def _read_chunks(f, length: int | None = None):
+    """Yields the rest of an open binary file in chunks, then closes it.
+
+    With a length only that many bytes are read.
+    """
+    with f:
+        while length is None or length > 0:
+            size = FILE_CHUNK_SIZE
+            if length is not None:
+                size = min(size, length)
+                length -= size
+            chunk = f.read(size)
+            if not chunk:
+                break
+            yield chunk
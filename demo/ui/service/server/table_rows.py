@@ -0,0 +1,65 @@
+import json
+
+from a2a.types import Part, Task
+
+from demo.ui.service.types import Event, EventRow, TaskRow
+
+
+def truncate(text: str, max_length: int) -> str:
+    if max_length <= 0 or len(text) <= max_length:
+        return text
+    return text[: max_length - 1] + '…'
+
+
+def summarize_parts(parts: list[Part], max_length: int) -> str:
+    """Text of the parts, one per line, with media types for binary parts."""
+    lines = []
+    length = 0
+    for p in parts:
+        part = p.root
+        if part.kind == 'text':
+            line = part.text
+        elif part.kind == 'data':
+            line = json.dumps(part.data)
+        else:
+            line = part.file.mime_type or 'file'
+        lines.append(line)
+        length += len(line) + 1
+        if max_length > 0 and length > max_length:
+            break
+    return truncate('\n'.join(lines), max_length)
+
+
+def event_row(event: Event, max_length: int) -> EventRow:
+    return EventRow(
+        id=event.id,
+        timestamp=event.timestamp,
+        conversation_id=event.content.context_id or '',
+        actor=event.actor,
+        role=event.content.role.name,
+        content=summarize_parts(event.content.parts, max_length),
+    )
+
+
+def task_row(task: Task, max_length: int) -> TaskRow:
+    """Projects a task the way the Task List shows it.
+
+    The first history message is the description, the latest message and
+    the artifacts are the output.
+    """
+    output_parts: list[Part] = []
+    if task.history:
+        description = summarize_parts(task.history[0].parts, max_length)
+        if len(task.history) > 1:
+            output_parts.extend(task.history[-1].parts)
+    else:
+        description = 'No history'
+    for artifact in task.artifacts or []:
+        output_parts.extend(artifact.parts)
+    return TaskRow(
+        task_id=task.id,
+        conversation_id=task.context_id or '',
+        description=description,
+        status=task.status.state.value,
+        output=summarize_parts(output_parts, max_length),
+    )
@@ -146,6 +146,260 @@ class UnregisterAgentResponse(JSONRPCResponse):
     result: bool | None = None # True if successful, False otherwise
 
 
+class CursorParams(BaseModel):
+    # Cursor returned by the previous call, 0 requests a full listing.
+    cursor: int = 0
+    conversation_id: str = ''
+
+
+class MessageDelta(BaseModel):
+    cursor: int
+    # True when this is a full listing that replaces any local copy.
+    reset: bool = False
+    messages: list[Message] = Field(default_factory=list)
+
+
+class ListMessageSinceRequest(JSONRPCRequest):
+    method: Literal['message/list_since'] = 'message/list_since'
+    params: CursorParams
+
+
+class ListMessageSinceResponse(JSONRPCResponse):
+    result: MessageDelta | None = None
+
+
+class TaskDelta(BaseModel):
+    cursor: int
+    reset: bool = False
+    tasks: list[Task] = Field(default_factory=list)
+    deleted_ids: list[str] = Field(default_factory=list)
+
+
+class ListTaskSinceRequest(JSONRPCRequest):
+    method: Literal['task/list_since'] = 'task/list_since'
+    params: CursorParams
+
+
+class ListTaskSinceResponse(JSONRPCResponse):
+    result: TaskDelta | None = None
+
+
+class EventDelta(BaseModel):
+    cursor: int
+    reset: bool = False
+    events: list[Event] = Field(default_factory=list)
+
+
+class GetEventSinceRequest(JSONRPCRequest):
+    method: Literal['events/get_since'] = 'events/get_since'
+    params: CursorParams
+
+
+class GetEventSinceResponse(JSONRPCResponse):
+    result: EventDelta | None = None
+
+
+class EventQuery(BaseModel):
+    # Empty strings and None mean no filter.
+    conversation_id: str = ''
+    actor: str = ''
+    since: float | None = None
+    until: float | None = None
+    # Sequence cursor from a previous page, None starts at the newest event.
+    before: int | None = None
+    limit: int = 100
+
+
+class EventPage(BaseModel):
+    # Oldest first.
+    events: list[Event] = Field(default_factory=list)
+    # Cursor for the previous (older) page, None on the last page.
+    next_before: int | None = None
+    # Events matching the filters, over all pages.
+    total: int = 0
+
+
+class QueryEventRequest(JSONRPCRequest):
+    method: Literal['events/query'] = 'events/query'
+    params: EventQuery
+
+
+class QueryEventResponse(JSONRPCResponse):
+    result: EventPage | None = None
+
+
+class EventRowQuery(EventQuery):
+    # Content longer than this is truncated by the server.
+    content_length: int = 200
+
+
+class EventRow(BaseModel):
+    id: str
+    timestamp: float = 0
+    conversation_id: str = ''
+    actor: str = ''
+    role: str = ''
+    content: str = ''
+
+
+class EventRowPage(BaseModel):
+    # Newest first.
+    rows: list[EventRow] = Field(default_factory=list)
+    next_before: int | None = None
+    # Events matching the filters, over all pages.
+    total: int = 0
+
+
+class QueryEventRowsRequest(JSONRPCRequest):
+    method: Literal['events/rows'] = 'events/rows'
+    params: EventRowQuery
+
+
+class QueryEventRowsResponse(JSONRPCResponse):
+    result: EventRowPage | None = None
+
+
+class TaskRowQuery(BaseModel):
+    # Empty for the tasks of every conversation.
+    conversation_id: str = ''
+    offset: int = 0
+    limit: int = 50
+    content_length: int = 200
+
+
+class TaskRow(BaseModel):
+    task_id: str
+    conversation_id: str = ''
+    description: str = ''
+    status: str = ''
+    output: str = ''
+
+
+class TaskRowPage(BaseModel):
+    # Newest first.
+    rows: list[TaskRow] = Field(default_factory=list)
+    total: int = 0
+
+
+class QueryTaskRowsRequest(JSONRPCRequest):
+    method: Literal['task/rows'] = 'task/rows'
+    params: TaskRowQuery
+
+
+class QueryTaskRowsResponse(JSONRPCResponse):
+    result: TaskRowPage | None = None
+
+
+class ConversationDelta(BaseModel):
+    cursor: int
+    reset: bool = False
+    conversations: list[Conversation] = Field(default_factory=list)
+    deleted_ids: list[str] = Field(default_factory=list)
+
+
+class ListConversationSinceRequest(JSONRPCRequest):
+    method: Literal['conversation/list_since'] = 'conversation/list_since'
+    params: CursorParams
+
+
+class ListConversationSinceResponse(JSONRPCResponse):
+    result: ConversationDelta | None = None
+
+
+class SnapshotParams(BaseModel):
+    conversation_id: str = ''
+    # Cursors returned by the previous snapshot, 0 requests full listings.
+    # The message and task cursors are only valid for the same conversation.
+    message_cursor: int = 0
+    conversation_cursor: int = 0
+    task_cursor: int = 0
+
+
+class StateSnapshot(BaseModel):
+    # Store version every part of the snapshot was read at.
+    version: int
+    # None when no conversation_id was given.
+    messages: MessageDelta | None = None
+    conversations: ConversationDelta
+    # Only the tasks of conversation_id.
+    tasks: TaskDelta
+    pending: list[tuple[str, str]] = Field(default_factory=list)
+
+
+class GetStateSnapshotRequest(JSONRPCRequest):
+    method: Literal['state/snapshot'] = 'state/snapshot'
+    params: SnapshotParams
+
+
+class GetStateSnapshotResponse(JSONRPCResponse):
+    result: StateSnapshot | None = None
+
+
+
+class DispatchStats(BaseModel):
+    queue_depth: int = 0
+    in_flight: int = 0
+    active_conversations: int = 0
+    workers: int = 0
+    max_queue_size: int = 0
+    processed: int = 0
+    failed: int = 0
+    rejected: int = 0
+
+
+class GetDispatchStatsRequest(JSONRPCRequest):
+    method: Literal['message/queue'] = 'message/queue'
+
+
+class GetDispatchStatsResponse(JSONRPCResponse):
+    result: DispatchStats | None = None
+
+
+class FastPathMetrics(BaseModel):
+    # Router deciding when to skip the host LLM, empty when disabled.
+    mode: str = ''
+    threshold: float = 0
+    requests: int = 0
+    fast_path_hits: int = 0
+    fallbacks: int = 0
+    hit_rate: float = 0
+    # Moving averages, in seconds.
+    host_latency: float = 0
+    direct_latency: float = 0
+    saved_seconds: float = 0
+    saved_seconds_per_hit: float = 0
+    last_saved_seconds: float = 0
+
+
+class GetFastPathMetricsRequest(JSONRPCRequest):
+    method: Literal['routing/stats'] = 'routing/stats'
+
+
+class GetFastPathMetricsResponse(JSONRPCResponse):
+    result: FastPathMetrics | None = None
+
+
+class AgentHealthInfo(BaseModel):
+    name: str
+    # Circuit state: closed, open (failing fast) or half_open.
+    state: str = 'closed'
+    # Latency percentiles of recent requests, None before the first one.
+    p50_ms: int | None = None
+    p95_ms: int | None = None
+    error_rate: float = 0
+    timeouts: int = 0
+    # Result of the latest agent card probe, None before the first probe.
+    last_probe_ok: bool | None = None
+    last_error: str = ''
+
+
+class GetAgentHealthRequest(JSONRPCRequest):
+    method: Literal['agent/health'] = 'agent/health'
+
+
+class GetAgentHealthResponse(JSONRPCResponse):
+    result: list[AgentHealthInfo] | None = None
+
 AgentRequest = TypeAdapter(
     Annotated[
         SendMessageRequest | ListConversationRequest,
@@ -4,24 +4,40 @@ import sys
 import traceback
 import uuid
 
-from typing import Any
+from collections.abc import Callable
+from typing import Any, TypeVar
 
 from a2a.types import FileWithBytes, Message, Part, Role, Task, TaskState
 from ..service.client.client import ConversationClient
 from ..service.types import (
+    AgentClientHTTPError,
+    AgentHealthInfo,
     Conversation,
     CreateConversationRequest,
     DeleteConversationRequest,
     Event,
+    EventPage,
+    EventQuery,
+    EventRowPage,
+    EventRowQuery,
+    GetAgentHealthRequest,
     GetEventRequest,
+    GetStateSnapshotRequest,
     ListAgentRequest,
     ListConversationRequest,
     ListMessageRequest,
     ListTaskRequest,
     MessageInfo,
     PendingMessageRequest,
+    QueryEventRequest,
+    QueryEventRowsRequest,
+    QueryTaskRowsRequest,
     RegisterAgentRequest,
     SendMessageRequest,
+    SnapshotParams,
+    StateSnapshot,
+    TaskRowPage,
+    TaskRowQuery,
     UnregisterAgentRequest,
 )
 
@@ -37,6 +53,8 @@ from .state import (
 
 server_url = 'http://localhost:8000'
 
+T = TypeVar('T')
+
 
 async def ListConversations() -> list[Conversation]:
     client = ConversationClient(server_url)
@@ -53,6 +71,12 @@ async def SendMessage(message: Message) -> Message | MessageInfo | None:
     try:
         response = await client.send_message(SendMessageRequest(params=message))
         return response.result
+    except AgentClientHTTPError as e:
+        if e.status_code == 429:
+            print('Server busy, message was not sent: ', message.message_id)
+        else:
+            traceback.print_exc()
+            print('Failed to send message: ', e)
     except Exception as e:
         traceback.print_exc()
         print('Failed to send message: ', e)
@@ -92,6 +116,16 @@ async def ListRemoteAgents():
         print('Failed to read agents', e)
 
 
+async def GetAgentHealth() -> dict[str, AgentHealthInfo]:
+    client = ConversationClient(server_url)
+    try:
+        response = await client.get_agent_health(GetAgentHealthRequest())
+        return {health.name: health for health in response.result or []}
+    except Exception as e:
+        print('Failed to read agent health', e)
+    return {}
+
+
 async def AddRemoteAgent(path: str):
     client = ConversationClient(server_url)
     try:
@@ -155,33 +189,173 @@ async def ListMessages(conversation_id: str) -> list[Message]:
     return []
 
 
+async def QueryEvents(
+    conversation_id: str = '',
+    actor: str = '',
+    since: float | None = None,
+    before: int | None = None,
+    limit: int = 100,
+) -> EventPage | None:
+    client = ConversationClient(server_url)
+    try:
+        response = await client.query_events(
+            QueryEventRequest(
+                params=EventQuery(
+                    conversation_id=conversation_id,
+                    actor=actor,
+                    since=since,
+                    before=before,
+                    limit=limit,
+                )
+            )
+        )
+        return response.result
+    except Exception as e:
+        print('Failed to query events: ', e)
+    return None
+
+
+async def QueryEventRows(query: EventRowQuery) -> EventRowPage | None:
+    client = ConversationClient(server_url)
+    try:
+        response = await client.query_event_rows(
+            QueryEventRowsRequest(params=query)
+        )
+        return response.result
+    except Exception as e:
+        print('Failed to query event rows: ', e)
+    return None
+
+
+async def QueryTaskRows(query: TaskRowQuery) -> TaskRowPage | None:
+    client = ConversationClient(server_url)
+    try:
+        response = await client.query_task_rows(
+            QueryTaskRowsRequest(params=query)
+        )
+        return response.result
+    except Exception as e:
+        print('Failed to query task rows: ', e)
+    return None
+
+
+async def GetStateSnapshot(
+    conversation_id: str,
+    message_cursor: int = 0,
+    conversation_cursor: int = 0,
+    task_cursor: int = 0,
+) -> StateSnapshot | None:
+    client = ConversationClient(server_url)
+    try:
+        response = await client.get_state_snapshot(
+            GetStateSnapshotRequest(
+                params=SnapshotParams(
+                    conversation_id=conversation_id,
+                    message_cursor=message_cursor,
+                    conversation_cursor=conversation_cursor,
+                    task_cursor=task_cursor,
+                )
+            )
+        )
+        return response.result
+    except Exception as e:
+        print('Failed to get state snapshot: ', e)
+    return None
+
+
+def merge_by_key(
+    current: list[T], updates: list[T], key: Callable[[T], str]
+) -> list[T]:
+    """Merges updated records into current, replacing records with the same key."""
+    if not updates:
+        return current
+    merged = list(current)
+    positions = {key(x): i for i, x in enumerate(merged)}
+    for update in updates:
+        k = key(update)
+        if k in positions:
+            merged[positions[k]] = update
+        else:
+            positions[k] = len(merged)
+            merged.append(update)
+    return merged
+
+
 async def UpdateAppState(state: AppState, conversation_id: str):
-    """Update the app state."""
+    """Update the app state with the changes since the last update.
+
+    Everything is read with a single state/snapshot call.
+    """
     try:
         if conversation_id:
             state.current_conversation_id = conversation_id
-            messages = await ListMessages(conversation_id)
-            if not messages:
-                state.messages = []
-            else:
-                state.messages = [convert_message_to_state(x) for x in messages]
-        conversations = await ListConversations()
-        if not conversations:
-            state.conversations = []
-        else:
-            state.conversations = [
-                convert_conversation_to_state(x) for x in conversations
-            ]
+        if state.messages_conversation_id != conversation_id:
+            # Message and task cursors are only valid for one conversation.
+            state.messages_conversation_id = conversation_id
+            state.message_cursor = 0
+            state.task_cursor = 0
+        snapshot = await GetStateSnapshot(
+            conversation_id,
+            message_cursor=state.message_cursor,
+            conversation_cursor=state.conversation_cursor,
+            task_cursor=state.task_cursor,
+        )
+        if not snapshot:
+            return
 
-        state.task_list = []
-        for task in await GetTasks():
-            state.task_list.append(
-                SessionTask(
-                    context_id=extract_conversation_id(task),
-                    task=convert_task_to_state(task),
+        message_delta = snapshot.messages
+        if message_delta:
+            messages = [
+                convert_message_to_state(x) for x in message_delta.messages
+            ]
+            state.messages = (
+                messages
+                if message_delta.reset
+                else merge_by_key(
+                    state.messages or [], messages, lambda x: x.message_id
                 )
             )
-        state.background_tasks = await GetProcessingMessages()
+            state.message_cursor = message_delta.cursor
+
+        conversation_delta = snapshot.conversations
+        conversations = [
+            convert_conversation_to_state(x)
+            for x in conversation_delta.conversations
+        ]
+        if conversation_delta.reset:
+            state.conversations = conversations
+        else:
+            deleted = set(conversation_delta.deleted_ids)
+            state.conversations = merge_by_key(
+                [
+                    x
+                    for x in state.conversations or []
+                    if x.conversation_id not in deleted
+                ],
+                conversations,
+                lambda x: x.conversation_id,
+            )
+        state.conversation_cursor = conversation_delta.cursor
+
+        task_delta = snapshot.tasks
+        tasks = [
+            SessionTask(
+                context_id=extract_conversation_id(task),
+                task=convert_task_to_state(task),
+            )
+            for task in task_delta.tasks
+        ]
+        if task_delta.reset:
+            state.task_list = tasks
+        else:
+            deleted = set(task_delta.deleted_ids)
+            state.task_list = merge_by_key(
+                [x for x in state.task_list if x.task.task_id not in deleted],
+                tasks,
+                lambda x: x.task.task_id,
+            )
+        state.task_cursor = task_delta.cursor
+        state.background_tasks = dict(snapshot.pending)
         state.message_aliases = GetMessageAliases()
     except Exception as e:
         print('Failed to update state: ', e)
@@ -9,6 +9,10 @@ from pydantic.dataclasses import dataclass
 
 ContentPart = str | dict[str, Any]
 
+# Polling interval that subscribes to the server event stream instead of
+# polling on a timer.
+LIVE_POLLING_INTERVAL = -1
+
 
 class State:
   pass
@@ -91,7 +95,13 @@ class AppState:
     )
     # This is used to track the message sent to agent with form data
     form_responses: dict[str, str] = dataclasses.field(default_factory=dict)
-    polling_interval: int = 1
+    polling_interval: int = LIVE_POLLING_INTERVAL
+    # Cursors returned by the state snapshot. The message and task cursors
+    # are only valid for messages_conversation_id.
+    conversation_cursor: int = 0
+    task_cursor: int = 0
+    message_cursor: int = 0
+    messages_conversation_id: str = ''
 
     # Added for API key management
     api_key: str = ''
@@ -0,0 +1,116 @@
+"""Micro-benchmark for IntelligentAgentRouter.route_message.
+
+Registers synthetic agents with many skill keywords and compares the
+indexed router with the previous linear scan over every agent and pattern.
+
+    PYTHONPATH=. python demo/ui/tests/benchmark_agent_router.py --agents 200
+"""
+
+import argparse
+import random
+import re
+import time
+
+from a2a.types import AgentCapabilities, AgentCard, AgentSkill
+from demo.ui.service.server.agent_router import IntelligentAgentRouter
+
+
+def make_vocabulary(size: int, rng: random.Random) -> list[str]:
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    return list(
+        {''.join(rng.choices(letters, k=rng.randint(4, 9))) for _ in range(size)}
+    )
+
+
+def make_agent(index: int, vocabulary: list[str], rng: random.Random) -> AgentCard:
+    skills = [
+        AgentSkill(
+            id=f'skill-{index}-{s}',
+            name=' '.join(rng.sample(vocabulary, 3)),
+            description=' '.join(rng.sample(vocabulary, 12)),
+            tags=rng.sample(vocabulary, 4) + [' '.join(rng.sample(vocabulary, 2))],
+            examples=[' '.join(rng.sample(vocabulary, 8)) for _ in range(3)],
+        )
+        for s in range(4)
+    ]
+    name = f'Agent {index}'
+    if index % 10 == 0:
+        name = f'Coder {index}'
+    elif index % 10 == 1:
+        name = f'Video {index}'
+    return AgentCard(
+        name=name,
+        description=f'Synthetic agent {index}',
+        url=f'http://agent-{index}',
+        version='1.0.0',
+        capabilities=AgentCapabilities(),
+        default_input_modes=['text'],
+        default_output_modes=['text'],
+        skills=skills,
+    )
+
+
+def linear_route(router: IntelligentAgentRouter, message_text: str) -> str | None:
+    """The routing loop used before the router was indexed."""
+    message_lower = message_text.lower()
+    agent_scores = {}
+    for agent_url, patterns in router.agent_patterns.items():
+        score = 0.0
+        matches = 0
+        for pattern, weight in patterns:
+            if pattern.startswith('\\b'):
+                hit = re.search(pattern, message_lower)
+            else:
+                hit = pattern in message_lower
+            if hit:
+                score += weight
+                matches += 1
+        if matches > 0:
+            agent_scores[agent_url] = score / len(patterns) * matches
+    if agent_scores:
+        best_agent = max(agent_scores.items(), key=lambda x: x[1])
+        if best_agent[1] > 0.1:
+            return best_agent[0]
+    return router.fallback_agent
+
+
+def timed(fn, messages: list[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for message in messages:
+            fn(message)
+    return (time.perf_counter() - start) / (repeat * len(messages))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--agents', type=int, default=150)
+    parser.add_argument('--messages', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    vocabulary = make_vocabulary(5000, rng)
+    router = IntelligentAgentRouter()
+    start = time.perf_counter()
+    for index in range(args.agents):
+        router.register_agent(make_agent(index, vocabulary, rng))
+    register_ms = (time.perf_counter() - start) * 1000
+    messages = [
+        ' '.join(rng.sample(vocabulary, rng.randint(5, 30)))
+        + ' please write code for a video'
+        for _ in range(args.messages)
+    ]
+    keywords = sum(len(p) for p in router.agent_patterns.values())
+
+    indexed = timed(router.route_message, messages, args.repeat)
+    linear = timed(lambda m: linear_route(router, m), messages, args.repeat)
+    print(f'agents: {args.agents}, patterns: {keywords}')
+    print(f'register: {register_ms:.1f} ms total')
+    print(f'indexed route_message: {indexed * 1e6:.1f} us/message')
+    print(f'linear scan:           {linear * 1e6:.1f} us/message')
+    print(f'speedup: {linear / indexed:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import asyncio
+import unittest
+
+import httpx
+
+from a2a.types import AgentCapabilities, AgentCard
+from utils.agent_card import AgentCardCache
+
+
+def card_json(name: str) -> dict:
+    return AgentCard(
+        name=name,
+        description=name,
+        url=f'http://{name}',
+        version='1.0.0',
+        capabilities=AgentCapabilities(),
+        default_input_modes=['text'],
+        default_output_modes=['text'],
+        skills=[],
+    ).model_dump(mode='json', exclude_none=True)
+
+
+class AgentCardCacheTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for the AgentCardCache."""
+
+    async def asyncSetUp(self) -> None:
+        self.requests: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            await asyncio.sleep(0.01)
+            if request.url.host == 'down':
+                raise httpx.ConnectError('unreachable')
+            if request.headers.get('if-none-match') == '"1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, json=card_json(request.url.host), headers={'etag': '"1"'}
+            )
+
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self) -> None:
+        await self.client.aclose()
+
+    async def test_concurrent_gets_share_one_fetch(self) -> None:
+        cache = AgentCardCache(self.client)
+        cards = await asyncio.gather(*(cache.get('agent') for _ in range(5)))
+        self.assertEqual({card.name for card in cards}, {'agent'})
+        self.assertEqual(len(self.requests), 1)
+        await cache.get('agent')
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_expired_cards_are_revalidated(self) -> None:
+        cache = AgentCardCache(self.client, ttl_seconds=0)
+        first = await cache.get('agent')
+        second = await cache.get('agent')
+        self.assertIs(first, second)
+        self.assertEqual(self.requests[-1].headers['if-none-match'], '"1"')
+
+    async def test_get_many_isolates_failures(self) -> None:
+        results = await AgentCardCache(self.client).get_many(['agent', 'down'])
+        self.assertIsInstance(results['agent'], AgentCard)
+        self.assertIsInstance(results['down'], httpx.ConnectError)
+
+
+if __name__ == '__main__':
+    unittest.main()
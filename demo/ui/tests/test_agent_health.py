@@ -0,0 +1,41 @@
+import unittest
+
+from samples.python.hosts.multiagent.agent_health import AgentHealth
+
+
+class AgentHealthTest(unittest.TestCase):
+    """Tests for the remote agent circuit breaker."""
+
+    def test_circuit_opens_and_recovers_through_half_open(self) -> None:
+        health = AgentHealth(failure_count=3, open_seconds=0)
+        for i in range(10):
+            health.record_success(i / 10)
+        self.assertEqual(health.summary()['p50_ms'], 500)
+        self.assertEqual(health.summary()['p95_ms'], 900)
+        for _ in range(3):
+            health.record_failure(TimeoutError(), timeout=True)
+        self.assertEqual(health._state, 'open')
+        self.assertEqual(health.timeouts, 3)
+        # open_seconds has passed: a single trial request is let through.
+        self.assertTrue(health.allow_request())
+        self.assertFalse(health.allow_request())
+        health.record_failure(ValueError('down'))
+        self.assertEqual(health._state, 'open')
+        self.assertTrue(health.allow_request())
+        health.record_success(0.1)
+        self.assertEqual(health.state, 'closed')
+        self.assertEqual(health.error_rate, 0)
+
+    def test_error_rate_opens_circuit(self) -> None:
+        health = AgentHealth(failure_count=3, error_rate=0.5, open_seconds=60)
+        for _ in range(2):
+            health.record_success(0.1)
+            health.record_failure(ValueError('flaky'))
+        self.assertEqual(health.state, 'open')
+        self.assertFalse(health.allow_request())
+        health.record_probe(True, 0.01)
+        self.assertEqual(health.state, 'half_open')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from a2a.types import AgentCapabilities, AgentCard, AgentSkill
+from service.server.agent_router import IntelligentAgentRouter
+
+
+def make_card(name: str, url: str, tags: list[str], description: str = '') -> AgentCard:
+    return AgentCard(
+        name=name,
+        description=description or name,
+        url=url,
+        version='1.0.0',
+        capabilities=AgentCapabilities(),
+        default_input_modes=['text'],
+        default_output_modes=['text'],
+        skills=[
+            AgentSkill(
+                id=f'{url}-skill',
+                name=name,
+                description=description or name,
+                tags=tags,
+                examples=[],
+            )
+        ],
+    )
+
+
+class IntelligentAgentRouterTest(unittest.TestCase):
+    """Tests for the indexed IntelligentAgentRouter."""
+
+    def setUp(self) -> None:
+        self.router = IntelligentAgentRouter()
+        self.router.register_agent(
+            make_card('Coder', 'http://coder', ['python'], 'Writes code')
+        )
+        self.router.register_agent(
+            make_card(
+                'Travel', 'http://travel', ['flights', 'road trip'], 'Books trips'
+            )
+        )
+
+    def test_keywords_match_whole_words(self) -> None:
+        self.assertIn('http://travel', self.router.score_agents('cheap flights'))
+        self.assertNotIn(
+            'http://travel', self.router.score_agents('inflightsnacks')
+        )
+
+    def test_multi_word_tags_match_as_phrases(self) -> None:
+        self.assertIn(
+            'http://travel', self.router.score_agents('plan a road trip')
+        )
+        self.assertNotIn(
+            'http://travel', self.router.score_agents('trip on the road')
+        )
+
+    def test_regex_patterns_and_fallback(self) -> None:
+        self.assertEqual(
+            self.router.route_message('please debug my script'), 'http://coder'
+        )
+        self.assertEqual(self.router.route_message('hello'), 'http://coder')
+
+    def test_confidence_requires_a_clear_winner(self) -> None:
+        url, confidence = self.router.route_with_confidence(
+            'write python code to debug a script'
+        )
+        self.assertEqual((url, confidence), ('http://coder', 1.0))
+        _, confidence = self.router.route_with_confidence('flights and python')
+        self.assertLess(confidence, 0.6)
+        self.assertEqual(self.router.route_with_confidence('hello'), (None, 0.0))
+
+    def test_unregister_removes_agent_from_indexes(self) -> None:
+        self.router.unregister_agent('http://coder')
+        self.assertIsNone(self.router.fallback_agent)
+        self.assertEqual(self.router.score_agents('debug python code'), {})
+        self.router.unregister_agent('http://travel')
+        self.assertEqual(self.router._keyword_index, {})
+        self.assertEqual(self.router._phrase_index, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,23 @@
+import unittest
+
+from service.server.artifact_handles import ArtifactHandles
+
+
+class ArtifactHandlesTest(unittest.TestCase):
+    """Tests for the artifact handle registry."""
+
+    def test_handles_are_stable_per_artifact_version(self) -> None:
+        handles = ArtifactHandles()
+        first = handles.add('c1', 'img.png', 0, 'image/png')
+        self.assertIs(handles.add('c1', 'img.png', 0, 'image/png'), first)
+        self.assertNotEqual(handles.add('c1', 'img.png', 1, '').handle_id, first.handle_id)
+        self.assertEqual(first.uri, f'/message/file/{first.handle_id}')
+        self.assertEqual(handles.get(first.handle_id).filename, 'img.png')
+        handles.add('c2', 'img.png', 0, 'image/png')
+        self.assertEqual(handles.remove_session('c1'), 2)
+        self.assertIsNone(handles.get(first.handle_id))
+        self.assertEqual(len(handles), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
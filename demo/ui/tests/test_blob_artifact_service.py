@@ -0,0 +1,59 @@
+import unittest
+
+from demo.ui.service.server.blob_artifact_service import BlobArtifactService
+from demo.ui.service.server.blob_store import BlobStore
+from google.genai import types
+
+
+def image(data: bytes) -> types.Part:
+    return types.Part.from_bytes(data=data, mime_type='image/png')
+
+
+class BlobArtifactServiceTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for artifacts whose bytes are kept in a BlobStore."""
+
+    async def asyncSetUp(self) -> None:
+        self.blob_store = BlobStore()
+        self.service = BlobArtifactService(blob_store=self.blob_store)
+
+    async def asyncTearDown(self) -> None:
+        self.blob_store.close()
+
+    async def save(self, filename: str, data: bytes) -> int:
+        return await self.service.save_artifact(
+            app_name='app',
+            user_id='u',
+            session_id='s1',
+            filename=filename,
+            artifact=image(data),
+        )
+
+    async def test_bytes_are_read_back_from_the_store(self) -> None:
+        await self.save('photo.png', b'first')
+        await self.save('photo.png', b'second')
+        digest = await self.service.get_blob_digest(
+            'app', 'u', 'photo.png', 's1', version=0
+        )
+        self.assertEqual(self.blob_store.read(digest), b'first')
+        latest = await self.service.load_artifact(
+            app_name='app', user_id='u', session_id='s1', filename='photo.png'
+        )
+        self.assertEqual(latest.inline_data.data, b'second')
+        self.assertIsNone(
+            await self.service.get_blob_digest('app', 'u', 'other.png', 's1')
+        )
+
+    async def test_forget_session_keeps_user_artifacts(self) -> None:
+        await self.save('photo.png', b'session')
+        await self.save('user:avatar.png', b'user')
+        await self.service.forget_session('app', 'u', 's1')
+        self.assertEqual(
+            await self.service.list_artifact_keys(
+                app_name='app', user_id='u', session_id='s1'
+            ),
+            ['user:avatar.png'],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
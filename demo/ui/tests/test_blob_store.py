@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+from service.server.blob_store import BlobQuotaError, BlobStore
+
+
+class BlobStoreTest(unittest.TestCase):
+    """Tests for the content addressed blob store."""
+
+    def test_same_content_is_stored_once_until_released(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            store = BlobStore(root, max_bytes=10)
+            digest = store.put(b'image', 'image/png', 'c1')
+            self.assertEqual(store.put(b'image', 'image/png', 'c2'), digest)
+            self.assertEqual((len(store), store.stored_bytes), (1, 5))
+            self.assertEqual(store.read(digest), b'image')
+            self.assertEqual(store.file(digest).etag, f'"{digest}"')
+            with self.assertRaises(BlobQuotaError):
+                store.put(b'another image', 'image/png', 'c1')
+            self.assertEqual(store.release('c1'), 0)
+            self.assertEqual(store.release('c2'), 1)
+            self.assertEqual(store.stored_bytes, 0)
+            self.assertFalse(os.path.exists(store.path(digest)))
+            self.assertIsNone(store.file(digest))
+
+    def test_restarted_store_keeps_referenced_blobs(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            unrelated = os.path.join(root, 'ab')
+            os.makedirs(unrelated)
+            store = BlobStore(root)
+            kept = store.put(b'kept', 'image/png', 'c1')
+            dropped = store.put(b'dropped', 'text/plain', 'c2')
+            self.assertTrue(os.path.isdir(unrelated))
+
+            restarted = BlobStore(root, keep_existing=True)
+            self.assertEqual(restarted.file(kept).mime_type, 'image/png')
+            self.assertEqual(restarted.stored_bytes, 11)
+            self.assertEqual(restarted.retain(['c1']), 1)
+            self.assertEqual(restarted.read(kept), b'kept')
+            self.assertFalse(os.path.exists(store.path(dropped)))
+
+            self.assertEqual(len(BlobStore(root)), 0)
+            self.assertFalse(os.path.exists(store.path(kept)))
+            self.assertTrue(os.path.isdir(unrelated))
+
+    def test_unmarked_directory_is_not_used(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, 'blobs', 'ab'))
+            with self.assertRaises(ValueError):
+                BlobStore(root)
+            self.assertTrue(os.path.isdir(os.path.join(root, 'blobs', 'ab')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import asyncio
+import unittest
+
+import httpx
+
+from service.client.client import ConversationClient, SharedHTTPClient
+from service.types import (
+    CreateConversationRequest,
+    ListConversationRequest,
+    ListTaskRequest,
+)
+
+
+class SharedHTTPClientTest(unittest.TestCase):
+    """Tests for the pooled client behind ConversationClient."""
+
+    def setUp(self) -> None:
+        self.paths: list[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            self.paths.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={'jsonrpc': '2.0'})
+
+        self.http = SharedHTTPClient(
+            cache_ttl=60, transport=httpx.MockTransport(handler)
+        )
+        self.client = ConversationClient('http://server', self.http)
+
+    def tearDown(self) -> None:
+        self.http.close()
+
+    def test_concurrent_reads_share_one_request(self) -> None:
+        async def poll():
+            return await asyncio.gather(
+                *(self.client.list_tasks(ListTaskRequest()) for _ in range(5))
+            )
+
+        self.assertEqual(len(asyncio.run(poll())), 5)
+        # A new event loop, as in another Mesop handler, hits the cache.
+        asyncio.run(self.client.list_tasks(ListTaskRequest()))
+        self.assertEqual(self.paths, ['/task/list'])
+        self.assertEqual(self.http.coalesced, 4)
+        self.assertEqual(self.http.cache_hits, 1)
+
+    def test_writes_invalidate_the_cache(self) -> None:
+        async def run():
+            await self.client.list_conversation(ListConversationRequest())
+            await self.client.create_conversation(CreateConversationRequest())
+            await self.client.list_conversation(ListConversationRequest())
+
+        asyncio.run(run())
+        self.assertEqual(
+            self.paths,
+            ['/conversation/list', '/conversation/create', '/conversation/list'],
+        )
+
+    def test_cache_drops_expired_and_oldest_entries(self) -> None:
+        self.http.max_cached = 2
+
+        async def run():
+            for i in range(3):
+                await self.client.list_tasks(ListTaskRequest(params=str(i)))
+
+        asyncio.run(run())
+        self.assertEqual(len(self.http._cache), 2)
+        for key, (_, result) in self.http._cache.items():
+            self.http._cache[key] = (0.0, result)
+        asyncio.run(self.client.list_tasks(ListTaskRequest(params='3')))
+        self.assertEqual(len(self.http._cache), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import asyncio
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+
+import httpx
+
+from a2a.types import Message, Part, Role, TextPart
+from service.server.adk_host_manager import ADKHostManager
+
+
+CONVERSATIONS = 300
+TURNS = 3
+
+
+class ConcurrentConversationsTest(unittest.IsolatedAsyncioTestCase):
+    """Stress test of ADKHostManager with many conversations at once."""
+
+    async def asyncSetUp(self) -> None:
+        self._cwd = os.getcwd()
+        self._dir = tempfile.TemporaryDirectory()
+        os.chdir(self._dir.name)
+        self._http_client = httpx.AsyncClient()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.manager = ADKHostManager(self._http_client)
+        self.active: dict[str, int] = {}
+        self.max_active_per_conversation = 0
+        self.max_active = 0
+        self.manager._run_host_agent = self.stub_agent
+
+    async def asyncTearDown(self) -> None:
+        await self.manager.close()
+        await self._http_client.aclose()
+        os.chdir(self._cwd)
+        self._dir.cleanup()
+
+    async def stub_agent(self, message, session, context_id, task_id):
+        """Echoes the message after a few awaits, tracking overlap."""
+        self.active[context_id] = self.active.get(context_id, 0) + 1
+        self.max_active_per_conversation = max(
+            self.max_active_per_conversation, self.active[context_id]
+        )
+        self.max_active = max(self.max_active, sum(self.active.values()))
+        for _ in range(3):
+            await asyncio.sleep(random.random() / 100)
+        current = await self.manager._session_service.get_session(
+            app_name='A2A', user_id='test_user', session_id=context_id
+        )
+        # The turn's own state update must not have been overwritten.
+        assert current.state['message_id'] == message.message_id
+        self.active[context_id] -= 1
+        return Message(
+            role=Role.agent,
+            message_id=f'reply-{message.message_id}',
+            context_id=context_id,
+            parts=[Part(root=TextPart(text=message.parts[0].root.text))],
+        )
+
+    async def test_turns_are_serialized_per_conversation_only(self) -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            conversations = [
+                await self.manager.create_conversation()
+                for _ in range(CONVERSATIONS)
+            ]
+            await asyncio.gather(
+                *(
+                    self.manager.process_message(
+                        Message(
+                            role=Role.user,
+                            message_id=f'{c.conversation_id}-{turn}',
+                            context_id=c.conversation_id,
+                            parts=[Part(root=TextPart(text=str(turn)))],
+                        )
+                    )
+                    for turn in range(TURNS)
+                    for c in conversations
+                )
+            )
+        self.assertEqual(self.max_active_per_conversation, 1)
+        self.assertGreater(self.max_active, CONVERSATIONS // 2)
+        self.assertEqual(self.manager.get_pending_messages(), [])
+        self.assertEqual(len(self.manager._conversation_locks), 0)
+        snapshot = self.manager.store.snapshot()
+        self.assertEqual(len(snapshot.conversations), CONVERSATIONS)
+        for conversation in snapshot.conversations:
+            replies = [
+                m.parts[0].root.text
+                for m in conversation.messages
+                if m.message_id.startswith('reply-')
+            ]
+            # User message, processing notice and reply per turn, in order.
+            self.assertEqual(len(conversation.messages), 3 * TURNS)
+            self.assertEqual(replies, [str(turn) for turn in range(TURNS)])
+
+    async def test_waiting_message_is_pending(self) -> None:
+        release = asyncio.Event()
+        echo = self.manager._run_host_agent
+
+        async def blocked_agent(message, session, context_id, task_id):
+            await release.wait()
+            return await echo(message, session, context_id, task_id)
+
+        self.manager._run_host_agent = blocked_agent
+        with contextlib.redirect_stdout(io.StringIO()):
+            conversation = await self.manager.create_conversation()
+            turns = [
+                asyncio.create_task(
+                    self.manager.process_message(
+                        Message(
+                            role=Role.user,
+                            message_id=f'm{turn}',
+                            context_id=conversation.conversation_id,
+                            parts=[Part(root=TextPart(text=str(turn)))],
+                        )
+                    )
+                )
+                for turn in range(2)
+            ]
+            await asyncio.sleep(0.01)
+            # m1 waits for m0's turn but is already shown as pending.
+            pending = [m for m, _ in self.manager.get_pending_messages()]
+            self.assertEqual(pending, ['m0', 'm1'])
+            turns[1].cancel()
+            release.set()
+            await asyncio.gather(*turns, return_exceptions=True)
+        self.assertEqual(self.manager.get_pending_messages(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
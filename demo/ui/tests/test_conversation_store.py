@@ -0,0 +1,167 @@
+import unittest
+
+from a2a.types import Message, Part, Role, Task, TaskState, TaskStatus, TextPart
+from service.server.conversation_store import ConversationStore
+from service.types import Conversation
+
+
+def make_task(task_id: str, context_id: str) -> Task:
+    return Task(
+        id=task_id,
+        context_id=context_id,
+        status=TaskStatus(state=TaskState.working),
+    )
+
+
+class ConversationStoreTest(unittest.TestCase):
+    """Tests for the indexed ConversationStore."""
+
+    def setUp(self) -> None:
+        self.store = ConversationStore()
+
+    def test_conversations_keep_insertion_order(self) -> None:
+        for conversation_id in ['c', 'a', 'b']:
+            self.store.add_conversation(
+                Conversation(conversation_id=conversation_id, is_active=True)
+            )
+        self.assertTrue(self.store.delete_conversation('a'))
+        self.assertFalse(self.store.delete_conversation('a'))
+        self.assertEqual(
+            [c.conversation_id for c in self.store.conversations], ['c', 'b']
+        )
+        self.assertIsNone(self.store.get_conversation('a'))
+        self.assertIsNone(self.store.get_conversation(None))
+
+    def test_delete_conversation_removes_messages_and_tasks(self) -> None:
+        conversation = self.store.add_conversation(
+            Conversation(conversation_id='c1', is_active=True)
+        )
+        self.store.add_message(
+            Message(
+                role=Role.user,
+                parts=[Part(root=TextPart(text='hi'))],
+                message_id='m1',
+                context_id='c1',
+            ),
+            conversation,
+        )
+        self.store.add_task(make_task('t1', 'c1'))
+        self.store.add_task(make_task('t2', 'c2'))
+        self.store.snapshot()
+        self.assertTrue(self.store.delete_conversation('c1'))
+        self.assertIsNone(self.store.get_message('m1'))
+        self.assertIsNone(self.store.get_task('t1'))
+        self.assertEqual([t.id for t in self.store.tasks], ['t2'])
+        self.assertEqual(self.store.page_tasks()[1], 1)
+        self.assertEqual(self.store.tasks_for_context('c1'), [])
+        self.assertEqual([t.id for t in self.store.snapshot().tasks], ['t2'])
+
+    def test_add_message_appends_to_conversation(self) -> None:
+        conversation = self.store.add_conversation(
+            Conversation(conversation_id='c1', is_active=True)
+        )
+        message = Message(
+            role=Role.user,
+            parts=[Part(root=TextPart(text='hi'))],
+            message_id='m1',
+            context_id='c1',
+        )
+        self.store.add_message(message, conversation)
+        self.assertIs(self.store.get_message('m1'), message)
+        self.assertEqual(conversation.messages, [message])
+
+    def test_update_task_keeps_position_and_context_index(self) -> None:
+        self.store.add_task(make_task('t1', 'c1'))
+        self.store.add_task(make_task('t2', 'c1'))
+        self.store.add_task(make_task('t3', 'c2'))
+        self.assertTrue(self.store.update_task(make_task('t1', 'c2')))
+        self.assertFalse(self.store.update_task(make_task('t4', 'c1')))
+        self.assertEqual(
+            [t.id for t in self.store.tasks], ['t1', 't2', 't3']
+        )
+        self.assertEqual(
+            [t.id for t in self.store.tasks_for_context('c1')], ['t2']
+        )
+        self.assertEqual(
+            [t.id for t in self.store.tasks_for_context('c2')], ['t3', 't1']
+        )
+        tasks, total = self.store.page_tasks(offset=1, limit=1)
+        self.assertEqual(([t.id for t in tasks], total), (['t2'], 3))
+        tasks, total = self.store.page_tasks('c2')
+        self.assertEqual(([t.id for t in tasks], total), (['t1', 't3'], 2))
+
+    def test_since_cursor_returns_only_changes(self) -> None:
+        conversation = self.store.add_conversation(
+            Conversation(conversation_id='c1', is_active=True)
+        )
+        self.store.add_task(make_task('t1', 'c1'))
+        cursor, _, _, reset = self.store.conversations_since(0)
+        self.assertTrue(reset)
+
+        message = Message(
+            role=Role.user,
+            parts=[Part(root=TextPart(text='hi'))],
+            message_id='m1',
+            context_id='c1',
+        )
+        self.store.add_message(message, conversation)
+        self.store.add_task(make_task('t2', 'c1'))
+
+        new_cursor, messages, reset = self.store.messages_since('c1', cursor)
+        self.assertFalse(reset)
+        self.assertEqual([m.message_id for m in messages], ['m1'])
+        _, tasks, _, _ = self.store.tasks_since(cursor)
+        self.assertEqual([t.id for t in tasks], ['t2'])
+        _, tasks, _, _ = self.store.tasks_since(cursor, 'c2')
+        self.assertEqual(tasks, [])
+        _, tasks, _, reset = self.store.tasks_since(0, 'c1')
+        self.assertEqual(([t.id for t in tasks], reset), (['t1', 't2'], True))
+        _, messages, _ = self.store.messages_since('c1', new_cursor)
+        self.assertEqual(messages, [])
+
+        self.store.delete_conversation('c1')
+        _, changed, deleted, _ = self.store.conversations_since(new_cursor)
+        self.assertEqual((changed, deleted), ([], ['c1']))
+        _, changed, deleted, _ = self.store.tasks_since(new_cursor)
+        self.assertEqual((changed, deleted), ([], ['t1', 't2']))
+        _, _, deleted, _ = self.store.tasks_since(new_cursor, 'c2')
+        self.assertEqual(deleted, [])
+        # A cursor from a previous server process forces a full listing,
+        # even once this store's version has passed the old one.
+        _, _, _, reset = self.store.tasks_since(new_cursor + 100)
+        self.assertTrue(reset)
+        previous = ConversationStore()
+        for i in range(3):
+            previous.add_task(make_task(f'p{i}', 'c3'))
+        old_cursor, _, _, _ = previous.tasks_since(0)
+        self.assertGreater(self.store.version, previous.version)
+        _, _, _, reset = self.store.tasks_since(old_cursor)
+        self.assertTrue(reset)
+
+    def test_snapshot_is_copied_on_write(self) -> None:
+        conversation = self.store.add_conversation(
+            Conversation(conversation_id='c1', is_active=True)
+        )
+        self.store.add_conversation(
+            Conversation(conversation_id='c2', is_active=True)
+        )
+        self.store.add_task(make_task('t1', 'c1'))
+        snapshot = self.store.snapshot()
+        self.assertIs(self.store.snapshot(), snapshot)
+        message = Message(
+            role=Role.user,
+            parts=[Part(root=TextPart(text='hi'))],
+            message_id='m1',
+            context_id='c1',
+        )
+        self.store.add_message(message, conversation)
+        self.assertEqual(snapshot.conversations[0].messages, [])
+        updated = self.store.snapshot()
+        self.assertEqual(len(updated.conversations[0].messages), 1)
+        # Unchanged records are shared between snapshots.
+        self.assertIs(updated.conversations[1], snapshot.conversations[1])
+        self.assertIs(updated.tasks[0], snapshot.tasks[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import asyncio
+import unittest
+
+from a2a.types import Message, Part, Role, TextPart
+from service.server.dispatcher import DispatcherBusyError, MessageDispatcher
+
+
+def make_message(context_id: str, index: int) -> Message:
+    return Message(
+        role=Role.user,
+        parts=[Part(root=TextPart(text='hi'))],
+        message_id=f'{context_id}-{index}',
+        context_id=context_id,
+    )
+
+
+class MessageDispatcherTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for the bounded MessageDispatcher."""
+
+    async def test_serial_per_conversation_concurrent_across(self) -> None:
+        processed: list[str] = []
+        running: dict[str, int] = {}
+        peak = 0
+
+        async def handler(message: Message) -> None:
+            nonlocal peak
+            running[message.context_id] = running.get(message.context_id, 0) + 1
+            self.assertEqual(running[message.context_id], 1)
+            peak = max(peak, sum(running.values()))
+            await asyncio.sleep(0.01)
+            processed.append(message.message_id)
+            running[message.context_id] -= 1
+
+        dispatcher = MessageDispatcher(handler, max_workers=3)
+        dispatcher.start()
+        for index in range(3):
+            for context_id in ['a', 'b', 'c']:
+                dispatcher.submit(make_message(context_id, index))
+        while dispatcher.queue_depth or dispatcher.in_flight:
+            await asyncio.sleep(0.01)
+        await dispatcher.stop()
+
+        self.assertEqual(peak, 3)
+        for context_id in ['a', 'b', 'c']:
+            self.assertEqual(
+                [m for m in processed if m.startswith(context_id)],
+                [f'{context_id}-{index}' for index in range(3)],
+            )
+
+    async def test_rejects_when_full(self) -> None:
+        dispatcher = MessageDispatcher(
+            lambda _: asyncio.sleep(0), max_queue_size=1
+        )
+        dispatcher.start()
+        dispatcher.submit(make_message('a', 0))
+        with self.assertRaises(DispatcherBusyError):
+            dispatcher.submit(make_message('a', 1))
+        self.assertEqual(dispatcher.rejected, 1)
+        await dispatcher.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import threading
+import unittest
+
+from unittest import mock
+
+import httpx
+
+from fastapi import FastAPI
+from service.server import server as server_module
+from service.server.event_broker import RESYNC, EventBroker
+from service.server.in_memory_manager import InMemoryFakeAgentManager
+from service.server.server import ConversationServer
+
+
+class EventBrokerTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for the fan-out of host notifications to subscribers."""
+
+    async def test_subscriptions_are_scoped_per_conversation(self) -> None:
+        broker = EventBroker()
+        scoped = broker.subscribe('c1')
+        everything = broker.subscribe()
+        broker.publish('message', 'c1', message_id='m1')
+        broker.publish('message', 'c2', message_id='m2')
+        self.assertEqual(
+            json.loads(await scoped.get(0.1)),
+            {'kind': 'message', 'conversation_id': 'c1', 'message_id': 'm1'},
+        )
+        self.assertIsNone(await scoped.get(0.01))
+        self.assertEqual(everything.queue_size, 2)
+
+    async def test_full_queue_is_replaced_with_resync(self) -> None:
+        broker = EventBroker(max_queue_size=2)
+        subscription = broker.subscribe()
+        for i in range(3):
+            broker.publish('task', 'c1', task_id=f't{i}')
+        self.assertEqual(subscription.dropped, 2)
+        self.assertEqual(await subscription.get(0.1), RESYNC)
+        self.assertIsNone(await subscription.get(0.01))
+
+        broker.publish('task', 'c1', task_id='t3')
+        item = json.loads(await subscription.get(0.1))
+        self.assertEqual(item['task_id'], 't3')
+
+    async def test_publish_from_another_thread(self) -> None:
+        broker = EventBroker()
+        subscription = broker.subscribe('c1')
+        publisher = threading.Thread(
+            target=broker.publish, args=('message', 'c1'), kwargs={'n': 1}
+        )
+        publisher.start()
+        publisher.join()
+        self.assertEqual(json.loads(await subscription.get(1))['n'], 1)
+
+    async def test_unsubscribed_subscription_gets_nothing(self) -> None:
+        broker = EventBroker()
+        subscription = broker.subscribe()
+        broker.unsubscribe(subscription)
+        broker.publish('message', 'c1')
+        self.assertEqual(broker.subscriber_count, 0)
+        self.assertEqual(subscription.queue_size, 0)
+
+    def test_offer_to_a_closed_loop_is_dropped(self) -> None:
+        broker = EventBroker()
+
+        async def subscribe():
+            return broker.subscribe()
+
+        subscription = asyncio.run(subscribe())
+        broker.publish('message', 'c1')
+        self.assertEqual(subscription.queue_size, 0)
+
+
+class FakeRequest:
+    """Request whose client disconnects once disconnected is set."""
+
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+class StreamEventsTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for the Server-Sent Events endpoint."""
+
+    async def asyncSetUp(self) -> None:
+        self._http_client = httpx.AsyncClient()
+        self.server = ConversationServer(FastAPI(), self._http_client)
+        self.server.manager = InMemoryFakeAgentManager()
+        self.broker = self.server.manager.broker
+
+    async def asyncTearDown(self) -> None:
+        await self._http_client.aclose()
+
+    async def test_heartbeat_events_and_disconnect(self) -> None:
+        request = FakeRequest()
+        with mock.patch.object(server_module, 'STREAM_HEARTBEAT_SECONDS', 0.01):
+            response = await self.server._stream_events(request, 'c1')
+            body = response.body_iterator
+            self.assertEqual(await anext(body), ': keep-alive\n\n')
+            self.assertEqual(self.broker.subscriber_count, 1)
+            self.broker.publish('message', 'c1', message_id='m1')
+            self.assertEqual(
+                json.loads((await anext(body)).removeprefix('data: ')),
+                {
+                    'kind': 'message',
+                    'conversation_id': 'c1',
+                    'message_id': 'm1',
+                },
+            )
+            request.disconnected = True
+            with self.assertRaises(StopAsyncIteration):
+                await anext(body)
+        self.assertEqual(self.broker.subscriber_count, 0)
+
+    async def test_closed_stream_unsubscribes(self) -> None:
+        response = await self.server._stream_events(FakeRequest())
+        body = response.body_iterator
+        self.broker.publish('conversation', 'c1')
+        self.assertTrue((await anext(body)).startswith('data: '))
+        await body.aclose()
+        self.assertEqual(self.broker.subscriber_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+from a2a.types import Message, Part, Role, TextPart
+from service.server.event_log import EventLog
+from service.types import Event
+
+
+def make_event(i: int, context_id: str, actor: str = 'user') -> Event:
+    return Event(
+        id=f'e{i}',
+        actor=actor,
+        content=Message(
+            role=Role.user,
+            parts=[Part(root=TextPart(text=str(i)))],
+            message_id=f'm{i}',
+            context_id=context_id,
+        ),
+        timestamp=float(i),
+    )
+
+
+class EventLogTest(unittest.TestCase):
+    """Tests for the ring buffered EventLog."""
+
+    def test_query_pages_newest_first(self) -> None:
+        log = EventLog()
+        for i in range(10):
+            log.append(make_event(i, 'a' if i % 2 else 'b'), i + 1)
+        events, before = log.query(conversation_id='a', limit=3)
+        self.assertEqual([e.id for e in events], ['e5', 'e7', 'e9'])
+        events, before = log.query(conversation_id='a', before=before, limit=3)
+        self.assertEqual([e.id for e in events], ['e1', 'e3'])
+        self.assertIsNone(before)
+        events, _ = log.query(since=7.0)
+        self.assertEqual([e.id for e in events], ['e7', 'e8', 'e9'])
+        events, _ = log.query(since=3.0, until=5.0, actor='user')
+        self.assertEqual([e.id for e in events], ['e3', 'e4', 'e5'])
+        self.assertEqual([e.id for e in log.since_version(8)], ['e8', 'e9'])
+        self.assertEqual(log.count(), 10)
+        self.assertEqual(log.count(conversation_id='a'), 5)
+        self.assertEqual(log.count(conversation_id='a', since=4.0), 3)
+        self.assertEqual(log.count(actor='user', until=5.0), 6)
+        self.assertEqual(log.count(conversation_id='a', actor='host'), 0)
+
+    def test_recorded_again_event_is_reindexed(self) -> None:
+        log = EventLog()
+        for i in range(4):
+            log.append(make_event(i, 'a'), i + 1)
+        log.append(make_event(1, 'b', 'host'), 5)
+        self.assertEqual(len(log), 4)
+        self.assertEqual([e.id for e in log.events], ['e0', 'e2', 'e3', 'e1'])
+        self.assertEqual(
+            [e.content.context_id for e in log.since_version(3)], ['a', 'b']
+        )
+        self.assertEqual(log.count(), 4)
+        self.assertEqual(log.count(conversation_id='a'), 3)
+        self.assertEqual(log.count(actor='host'), 1)
+        events, _ = log.query(conversation_id='b')
+        self.assertEqual([e.actor for e in events], ['host'])
+        events, _ = log.query(actor='user', limit=2)
+        self.assertEqual([e.id for e in events], ['e2', 'e3'])
+
+        small = EventLog(capacity=2)
+        small.append(make_event(0, 'a'), 1)
+        small.append(make_event(1, 'a'), 2)
+        small.append(make_event(0, 'b'), 3)
+        self.assertEqual([e.id for e in small.events], ['e1', 'e0'])
+        self.assertEqual((len(small), small.evicted), (2, 0))
+        self.assertEqual(small.count(conversation_id='b'), 1)
+
+    def test_evicted_events_overflow_to_disk(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'events.jsonl')
+            log = EventLog(capacity=3, overflow_path=path)
+            for i in range(5):
+                log.append(make_event(i, 'c', 'host' if i == 0 else 'user'), i)
+            self.assertEqual([e.id for e in log.events], ['e2', 'e3', 'e4'])
+            self.assertEqual(log.query(actor='host'), ([], None))
+            self.assertEqual([e.id for e in log.archived()], ['e0', 'e1'])
+            log.close()
+
+    def test_archive_is_rotated_and_read_from_the_end(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'events.jsonl')
+            size = len(make_event(0, 'c').model_dump_json()) + 1
+            log = EventLog(
+                capacity=1, overflow_path=path, overflow_max_bytes=3 * size
+            )
+            for i in range(9):
+                log.append(make_event(i, 'c'), i)
+            # e0-e2 went to the rotated file, which e3-e5 then replaced.
+            self.assertEqual(os.path.getsize(path), 2 * size)
+            self.assertEqual(
+                [e.id for e in log.archived(limit=4)], ['e4', 'e5', 'e6', 'e7']
+            )
+            self.assertEqual(len(log.archived(limit=100)), 5)
+            with mock.patch('service.server.event_log._TAIL_BLOCK', 7):
+                self.assertEqual([e.id for e in log.archived(limit=1)], ['e7'])
+            log.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+import httpx
+
+from a2a.types import Message, Part, Role, TextPart
+from service.server.adk_host_manager import ADKHostManager
+
+
+class EmptyConnection:
+    """Remote agent connection whose send returns no result."""
+
+    health = None
+
+    async def send_message(self, message: Message):
+        return None
+
+
+class FastPathFallbackTest(unittest.IsolatedAsyncioTestCase):
+    """The fast path falls back to the host agent when it cannot route."""
+
+    async def asyncSetUp(self) -> None:
+        self._cwd = os.getcwd()
+        self._dir = tempfile.TemporaryDirectory()
+        os.chdir(self._dir.name)
+        self._http_client = httpx.AsyncClient()
+        with mock.patch.dict(os.environ, {'A2A_UI_ROUTER': 'semantic'}), (
+            contextlib.redirect_stdout(io.StringIO())
+        ):
+            self.manager = ADKHostManager(self._http_client)
+
+    async def asyncTearDown(self) -> None:
+        await self.manager.close()
+        await self._http_client.aclose()
+        os.chdir(self._cwd)
+        self._dir.cleanup()
+
+    async def test_routing_error_falls_back(self) -> None:
+        self.manager._semantic_router.top_k = mock.AsyncMock(
+            side_effect=RuntimeError('embedding service down')
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsNone(await self.manager._fast_route('write code'))
+
+    async def test_missing_result_falls_back(self) -> None:
+        self.manager._host_agent.remote_agent_connections['Coder'] = (
+            EmptyConnection()
+        )
+        message = Message(
+            role=Role.user,
+            parts=[Part(root=TextPart(text='write code'))],
+            message_id='m1',
+            context_id='c1',
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            response = await self.manager._delegate_directly(
+                'Coder', message, None, 'c1', None
+            )
+        self.assertIsNone(response)
+
+
+if __name__ == '__main__':
+    unittest.main()
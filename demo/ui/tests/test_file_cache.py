@@ -0,0 +1,132 @@
+import asyncio
+import base64
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+import httpx
+
+from a2a.types import FilePart, FileWithBytes, Message, Part, Role
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from service.server.file_cache import FileCache, parse_range
+from service.server.in_memory_manager import InMemoryFakeAgentManager
+from service.server import server as server_module
+from service.server.server import ConversationServer
+
+
+class FileCacheTest(unittest.TestCase):
+    """Tests for the bounded FileCache."""
+
+    def test_evicts_least_recently_used_over_budget(self) -> None:
+        cache = FileCache(max_bytes=100)
+        cache.put('a', b'a' * 40, 'text/plain')
+        cache.put('b', b'b' * 40, 'text/plain')
+        self.assertIsNotNone(cache.get('a'))
+        cache.put('c', b'c' * 40, 'text/plain')
+        self.assertNotIn('b', cache)
+        self.assertIn('a', cache)
+        self.assertEqual(cache.memory_bytes, 80)
+
+    def test_spills_to_disk_and_reads_ranges(self) -> None:
+        with tempfile.TemporaryDirectory() as spill_dir:
+            cache = FileCache(max_bytes=10, spill_dir=spill_dir)
+            first = cache.put('a', b'0123456789', 'text/plain')
+            cache.put('b', b'abcdefghij', 'text/plain')
+            self.assertIsNone(first.data)
+            self.assertEqual(cache.read(first, 2, 5), b'234')
+            self.assertEqual((cache.memory_bytes, cache.disk_bytes), (10, 10))
+
+    def test_parse_range(self) -> None:
+        self.assertEqual(parse_range('bytes=0-4', 10), (0, 4))
+        self.assertEqual(parse_range('bytes=5-', 10), (5, 9))
+        self.assertEqual(parse_range('bytes=-3', 10), (7, 9))
+        self.assertIsNone(parse_range('bytes=0-1,3-4', 10))
+        with self.assertRaises(ValueError):
+            parse_range('bytes=10-', 10)
+
+
+class CacheContentTest(unittest.TestCase):
+    """Tests for the file links in message listings."""
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        app = FastAPI()
+        self.server = ConversationServer(app, httpx.AsyncClient())
+        # No blob store, listed files only go to the bounded cache.
+        self.server.manager = InMemoryFakeAgentManager()
+        self.server._file_cache = FileCache(
+            max_bytes=4, spill_dir=self._dir.name
+        )
+        self.client = TestClient(app)
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def cache_content(self, messages: list[Message]) -> list[Message]:
+        return asyncio.run(self.server.cache_content(messages))
+
+    def make_message(self, message_id: str, data: bytes) -> Message:
+        return Message(
+            role=Role.user,
+            message_id=message_id,
+            context_id='c1',
+            parts=[
+                Part(
+                    root=FilePart(
+                        file=FileWithBytes(
+                            bytes=base64.b64encode(data).decode(),
+                            mime_type='text/plain',
+                        )
+                    )
+                )
+            ],
+        )
+
+    def test_message_keeps_bytes_the_cache_evicted(self) -> None:
+        message = self.make_message('m1', b'first')
+        url = self.cache_content([message])[0].parts[0].root.file.uri
+        self.assertIsInstance(message.parts[0].root.file, FileWithBytes)
+        self.assertEqual(self.client.get(url).content, b'first')
+
+        # Evicted by a newer file, the next listing caches it again.
+        self.cache_content([self.make_message('m2', b'second')])
+        self.server._file_cache._remove(url.rsplit('/', 1)[1])
+        self.assertEqual(self.client.get(url).status_code, 404)
+        relisted = self.cache_content([message])[0]
+        self.assertEqual(relisted.parts[0].root.file.uri, url)
+        self.assertEqual(self.client.get(url).content, b'first')
+
+    def test_spilled_file_ranges_are_streamed(self) -> None:
+        data = bytes(range(200))
+        message = self.make_message('m1', data)
+        url = self.cache_content([message])[0].parts[0].root.file.uri
+        self.cache_content([self.make_message('m2', b'newer')])
+        entry = self.server._file_cache.get(url.rsplit('/', 1)[1])
+        self.assertIsNone(entry.data)
+        with mock.patch.object(server_module, 'FILE_CHUNK_SIZE', 16):
+            response = self.client.get(url, headers={'Range': 'bytes=10-99'})
+            self.assertEqual(response.status_code, 206)
+            self.assertEqual(response.content, data[10:100])
+            self.assertEqual(response.headers['content-length'], '90')
+            self.assertEqual(
+                response.headers['content-range'], 'bytes 10-99/200'
+            )
+            response = self.client.get(url, headers={'Range': 'bytes=0-'})
+            self.assertEqual(response.content, data)
+            self.assertEqual(self.client.get(url).content, data)
+
+    def test_missing_spill_file_is_not_found(self) -> None:
+        message = self.make_message('m1', b'spilled')
+        url = self.cache_content([message])[0].parts[0].root.file.uri
+        self.cache_content([self.make_message('m2', b'newer')])
+        entry = self.server._file_cache.get(url.rsplit('/', 1)[1])
+        self.assertIsNotNone(entry.path)
+        os.remove(entry.path)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
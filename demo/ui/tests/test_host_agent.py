@@ -0,0 +1,164 @@
+import asyncio
+import base64
+import unittest
+
+from types import SimpleNamespace
+
+import httpx
+
+from a2a.types import (
+    FilePart,
+    FileWithBytes,
+    Message,
+    Part,
+    Role,
+    Task,
+    TaskState,
+    TaskStatus,
+    TextPart,
+)
+from demo.ui.service.server.blob_store import BlobQuotaError
+from samples.python.hosts.multiagent.host_agent import (
+    HostAgent,
+    agent_response_prefix,
+    convert_part,
+)
+
+
+class StubConnection:
+    """Answers send_message with reply after delay seconds."""
+
+    def __init__(self, reply, delay: float = 0):
+        self.reply = reply
+        self.delay = delay
+        self.cancelled = False
+
+    async def send_message(self, message: Message):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if isinstance(self.reply, Exception):
+            raise self.reply
+        return self.reply
+
+
+def make_message(text: str) -> Message:
+    return Message(
+        role=Role.agent,
+        parts=[Part(root=TextPart(text=text))],
+        message_id=text,
+    )
+
+
+def make_tool_context() -> SimpleNamespace:
+    return SimpleNamespace(
+        state={},
+        actions=SimpleNamespace(skip_summarization=False, escalate=False),
+    )
+
+
+class SendMessagesParallelTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for the parallel fan-out of HostAgent.send_messages_parallel."""
+
+    async def asyncSetUp(self) -> None:
+        self.http_client = httpx.AsyncClient()
+        self.host = HostAgent([], self.http_client, agent_timeout=0.2)
+
+    async def asyncTearDown(self) -> None:
+        await self.http_client.aclose()
+
+    async def send(self, connections: dict[str, StubConnection]) -> list:
+        self.host.remote_agent_connections.update(connections)
+        names = list(connections)
+        return await self.host.send_messages_parallel(
+            names, [f'to {name}' for name in names], make_tool_context()
+        )
+
+    async def test_results_follow_agent_names_order(self) -> None:
+        task = Task(
+            id='t1',
+            context_id='c1',
+            status=TaskStatus(
+                state=TaskState.completed, message=make_message('done')
+            ),
+        )
+        results = await self.send(
+            {
+                'Slow': StubConnection(make_message('slow'), delay=0.05),
+                'Fast': StubConnection(task),
+            }
+        )
+        self.assertEqual(
+            results,
+            [
+                {'agent_name': 'Slow', 'response': ['slow']},
+                {
+                    'agent_name': 'Fast',
+                    'task_id': 't1',
+                    'state': 'completed',
+                    'response': [agent_response_prefix('Fast') + 'done'],
+                },
+            ],
+        )
+
+    async def test_failures_do_not_cancel_other_agents(self) -> None:
+        slow = StubConnection(make_message('slow'), delay=0.05)
+        results = await self.send(
+            {
+                'Broken': StubConnection(ValueError('down')),
+                'Slow': slow,
+                'Hung': StubConnection(make_message('late'), delay=10),
+                'Empty': StubConnection(None),
+            }
+        )
+        self.assertFalse(slow.cancelled)
+        self.assertEqual(
+            results[0], {'agent_name': 'Broken', 'error': 'down'}
+        )
+        self.assertEqual(results[1]['response'], ['slow'])
+        self.assertEqual(
+            results[2],
+            {'agent_name': 'Hung', 'error': 'No response within 0.2 seconds'},
+        )
+        self.assertEqual(
+            results[3],
+            {'agent_name': 'Empty', 'error': 'Agent Empty sent no response'},
+        )
+
+    async def test_mismatched_lists_are_reported(self) -> None:
+        results = await self.host.send_messages_parallel(
+            ['A', 'B'], ['only one'], make_tool_context()
+        )
+        self.assertEqual(len(results), 1)
+        self.assertIn('2 agent_names and 1 messages', results[0]['error'])
+
+
+class ConvertPartTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for passing remote agent parts on to the model."""
+
+    async def test_file_over_quota_is_described(self) -> None:
+        async def save_artifact(filename, artifact):
+            raise BlobQuotaError('quota reached')
+
+        tool_context = make_tool_context()
+        tool_context.save_artifact = save_artifact
+        part = Part(
+            root=FilePart(
+                file=FileWithBytes(
+                    name='photo.png',
+                    bytes=base64.b64encode(b'image').decode(),
+                    mime_type='image/png',
+                )
+            )
+        )
+        self.assertEqual(
+            await convert_part(part, tool_context),
+            '[photo.png not stored: quota reached]',
+        )
+        self.assertFalse(tool_context.actions.escalate)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+import httpx
+
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
+from google.genai import types
+from service.server.adk_host_manager import ADKHostManager
+from service.server.journal_session_service import JournalSessionService
+
+
+def make_event(text: str, **state) -> Event:
+    return Event(
+        author='user',
+        invocation_id='invocation',
+        content=types.Content(role='user', parts=[types.Part(text=text)]),
+        actions=EventActions(state_delta=state),
+    )
+
+
+class JournalSessionServiceTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for the append-only JournalSessionService."""
+
+    async def asyncSetUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self.root = self._dir.name
+
+    async def asyncTearDown(self) -> None:
+        self._dir.cleanup()
+
+    async def test_sessions_survive_restart(self) -> None:
+        service = JournalSessionService(self.root, compact_after=2)
+        session = await service.create_session(app_name='app', user_id='u')
+        for i in range(3):
+            await service.append_event(
+                session,
+                make_event(
+                    f'hi {i}',
+                    count=i,
+                    **{'temp:t': i, 'app:theme': 'dark', 'user:name': f'u{i}'},
+                ),
+            )
+        await service.close()
+
+        restarted = JournalSessionService(self.root)
+        self.assertEqual(restarted.sessions, {})
+        loaded = await restarted.get_session(
+            app_name='app', user_id='u', session_id=session.id
+        )
+        self.assertEqual(
+            [e.content.parts[0].text for e in loaded.events],
+            ['hi 0', 'hi 1', 'hi 2'],
+        )
+        self.assertEqual(
+            loaded.state,
+            {'count': 2, 'app:theme': 'dark', 'user:name': 'u2'},
+        )
+        self.assertEqual(restarted.user_state['app']['u'], {'name': 'u2'})
+        await restarted.close()
+
+    async def test_torn_tail_is_dropped(self) -> None:
+        service = JournalSessionService(self.root)
+        session = await service.create_session(app_name='app', user_id='u')
+        await service.append_event(session, make_event('kept'))
+        await service.close()
+        path = os.path.join(self.root, 'app', 'u', f'{session.id}.jsonl')
+        with open(path, 'a') as f:
+            f.write('{"event":{"auth')
+
+        restarted = JournalSessionService(self.root)
+        loaded = await restarted.get_session(
+            app_name='app', user_id='u', session_id=session.id
+        )
+        self.assertEqual(len(loaded.events), 1)
+        with open(path) as f:
+            self.assertEqual(len(f.read().splitlines()), 1)
+        await restarted.close()
+
+    async def test_manager_restores_conversations_lazily(self) -> None:
+        service = JournalSessionService(self.root)
+        session = await service.create_session(
+            app_name='A2A', user_id='test_user'
+        )
+        await service.append_event(session, make_event('hello'))
+        await service.close()
+
+        env = {
+            'A2A_UI_SESSION_STORE': 'journal',
+            'A2A_UI_SESSION_DIR': self.root,
+        }
+        cwd = os.getcwd()
+        os.chdir(self.root)
+        try:
+            with mock.patch.dict(os.environ, env), contextlib.redirect_stdout(
+                io.StringIO()
+            ):
+                manager = ADKHostManager(httpx.AsyncClient())
+                await manager._restore_conversations()
+                conversation = manager.store.get_conversation(session.id)
+                self.assertEqual(conversation.messages, [])
+                # The journal is not read until the conversation is used.
+                self.assertEqual(manager._session_service.sessions, {})
+                loaded = await manager.load_conversation(session.id)
+                self.assertEqual(
+                    [m.parts[0].root.text for m in loaded.messages], ['hello']
+                )
+                await manager.close()
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == '__main__':
+    unittest.main()
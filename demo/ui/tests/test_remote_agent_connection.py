@@ -0,0 +1,124 @@
+import asyncio
+import contextlib
+import io
+import unittest
+
+from a2a.types import (
+    AgentCapabilities,
+    AgentCard,
+    Artifact,
+    Message,
+    Part,
+    Role,
+    Task,
+    TaskArtifactUpdateEvent,
+    TaskState,
+    TaskStatus,
+    TaskStatusUpdateEvent,
+    TextPart,
+)
+from samples.python.hosts.multiagent.agent_health import AgentHealth
+from samples.python.hosts.multiagent.remote_agent_connection import (
+    RemoteAgentConnections,
+)
+
+
+CARD = AgentCard(
+    name='Coder',
+    description='Coder',
+    url='http://coder',
+    version='1.0.0',
+    capabilities=AgentCapabilities(streaming=True),
+    default_input_modes=['text'],
+    default_output_modes=['text'],
+    skills=[],
+)
+
+
+def make_task(state: TaskState) -> Task:
+    return Task(id='t1', context_id='c1', status=TaskStatus(state=state))
+
+
+class StreamingClient:
+    """Streams a working update, an artifact and the completed task."""
+
+    async def send_message(self, message: Message):
+        working = make_task(TaskState.working)
+        yield working, TaskStatusUpdateEvent(
+            task_id='t1',
+            context_id='c1',
+            status=working.status,
+            final=False,
+        )
+        await asyncio.sleep(0)
+        yield working, TaskArtifactUpdateEvent(
+            task_id='t1',
+            context_id='c1',
+            artifact=Artifact(
+                artifact_id='a1', parts=[Part(root=TextPart(text='code'))]
+            ),
+        )
+        await asyncio.sleep(0)
+        yield make_task(TaskState.completed), None
+
+
+class StubFactory:
+    def __init__(self, client):
+        self.client = client
+
+    def create(self, card: AgentCard):
+        return self.client
+
+
+def make_message() -> Message:
+    return Message(
+        role=Role.user,
+        parts=[Part(root=TextPart(text='hi'))],
+        message_id='m1',
+    )
+
+
+class RemoteAgentConnectionsTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for streamed task updates of RemoteAgentConnections."""
+
+    async def test_updates_reach_callback_before_result(self) -> None:
+        updates = []
+        returned = False
+
+        def callback(update, card):
+            self.assertFalse(returned)
+            updates.append(type(update).__name__)
+
+        connection = RemoteAgentConnections(
+            StubFactory(StreamingClient()), CARD, callback
+        )
+        task = await connection.send_message(make_message())
+        returned = True
+        self.assertEqual(task.status.state, TaskState.completed)
+        self.assertEqual(
+            updates,
+            ['TaskStatusUpdateEvent', 'TaskArtifactUpdateEvent', 'Task'],
+        )
+
+    async def test_failing_callback_does_not_end_stream(self) -> None:
+        calls = []
+
+        def callback(update, card):
+            calls.append(update)
+            raise ValueError('broken callback')
+
+        health = AgentHealth(failure_count=1)
+        connection = RemoteAgentConnections(
+            StubFactory(StreamingClient()), CARD, callback, health
+        )
+        with contextlib.redirect_stdout(io.StringIO()), (
+            contextlib.redirect_stderr(io.StringIO())
+        ):
+            task = await connection.send_message(make_message())
+        self.assertEqual(task.status.state, TaskState.completed)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(health.state, 'closed')
+
+
+if __name__ == '__main__':
+    unittest.main()
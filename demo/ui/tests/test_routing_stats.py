@@ -0,0 +1,24 @@
+import unittest
+
+from service.server.routing_stats import FastPathStats
+
+
+class FastPathStatsTest(unittest.TestCase):
+    """Tests for the fast path hit rate and latency bookkeeping."""
+
+    def test_saving_is_measured_against_host_latency(self) -> None:
+        stats = FastPathStats('keyword', 0.6, alpha=0.5)
+        self.assertEqual(stats.record_direct(0.5), 0.0)
+        stats.record_host(3.0)
+        stats.record_host(1.0)
+        self.assertEqual(stats.host_latency, 2.0)
+        self.assertEqual(stats.record_direct(0.5), 1.5)
+        stats.record_fallback()
+        metrics = stats.metrics()
+        self.assertEqual((metrics.requests, metrics.fast_path_hits), (4, 2))
+        self.assertEqual(metrics.hit_rate, 0.5)
+        self.assertEqual(metrics.saved_seconds_per_hit, 0.75)
+
+
+if __name__ == '__main__':
+    unittest.main()
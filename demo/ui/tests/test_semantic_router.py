@@ -0,0 +1,95 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from unittest import mock
+
+from a2a.types import AgentCapabilities, AgentCard, AgentSkill
+from service.server.semantic_router import HashingEmbedder, SemanticAgentRouter
+
+
+def make_card(name: str, url: str, examples: list[str]) -> AgentCard:
+    return AgentCard(
+        name=name,
+        description=name,
+        url=url,
+        version='1.0.0',
+        capabilities=AgentCapabilities(),
+        default_input_modes=['text'],
+        default_output_modes=['text'],
+        skills=[
+            AgentSkill(
+                id=url,
+                name=name,
+                description=name,
+                tags=[],
+                examples=examples,
+            )
+        ],
+    )
+
+
+CARDS = [
+    make_card('Travel', 'http://travel', ['book a flight to paris']),
+    make_card('Coder', 'http://coder', ['write a python function']),
+    make_card('Video', 'http://video', ['generate a short video clip']),
+]
+
+
+class SemanticAgentRouterTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for the embedding based SemanticAgentRouter."""
+
+    async def asyncSetUp(self) -> None:
+        self.router = SemanticAgentRouter(HashingEmbedder(), threshold=0.3)
+        for card in CARDS:
+            await self.router.register_agent(card)
+
+    async def test_top_k_orders_by_similarity(self) -> None:
+        matches = await self.router.top_k(
+            'please write a python function', k=2
+        )
+        self.assertEqual(len(matches), 2)
+        self.assertEqual(matches[0][0], 'http://coder')
+        self.assertGreater(matches[0][1], matches[1][1])
+
+    async def test_below_threshold_is_not_routed(self) -> None:
+        self.assertEqual(
+            await self.router.route_message('book a flight to paris'),
+            'http://travel',
+        )
+        self.assertIsNone(
+            await self.router.route_message('what is the weather')
+        )
+
+    async def test_embedder_runs_off_the_event_loop(self) -> None:
+        threads = []
+
+        def embedder(texts: list[str]):
+            threads.append(threading.get_ident())
+            return HashingEmbedder()(texts)
+
+        router = SemanticAgentRouter(embedder)
+        await router.register_agent(CARDS[0])
+        await router.top_k('book a flight')
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    async def test_saved_vectors_are_reused(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'agents.vectors.npz')
+            self.router.save(path)
+            embedder = mock.Mock(wraps=HashingEmbedder())
+            embedder.name = 'hashing-512'
+            restored = SemanticAgentRouter(embedder)
+            cached = restored.load(path)
+            for card in CARDS:
+                await restored.register_agent(card, cached)
+            embedder.assert_not_called()
+            changed = make_card('Travel', 'http://travel', ['rent a car'])
+            await restored.register_agent(changed, cached)
+            embedder.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,15 +1,21 @@
+import asyncio
 import httpx
-import requests
 import json
+import time
 
 from a2a.types import AgentCard, AgentCapabilities
 from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH
 
 
-async def get_agent_card(remote_agent_address: str) -> AgentCard:
-    """Get the agent card."""
+def normalize_address(remote_agent_address: str) -> str:
     if not remote_agent_address.startswith(('http://', 'https://')):
         remote_agent_address = 'http://' + remote_agent_address
+    return remote_agent_address.rstrip('/')
+
+
+async def get_agent_card(remote_agent_address: str) -> AgentCard:
+    """Get the agent card."""
+    remote_agent_address = normalize_address(remote_agent_address)
     try:
         async with httpx.AsyncClient() as client:
             agent_card_response = await client.get(
@@ -30,3 +36,96 @@ async def get_agent_card(remote_agent_address: str) -> AgentCard:
             skills=[], # Provide an empty list
             version="0.0.0" # Provide a default version
         )
+
+
+class _CachedCard:
+    __slots__ = ('card', 'etag', 'last_modified', 'fetched_at')
+
+    def __init__(self, card: AgentCard, etag: str | None, last_modified: str | None):
+        self.card = card
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = time.monotonic()
+
+
+class AgentCardCache:
+    """Agent cards cached per address for ttl_seconds.
+
+    Expired cards are revalidated with If-None-Match / If-Modified-Since, so
+    an unchanged card costs a 304 instead of a full download. Concurrent
+    requests for the same address share a single fetch, and every fetch is
+    bounded by timeout seconds.
+    """
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        ttl_seconds: float = 300,
+        timeout: float = 5.0,
+    ):
+        self._http_client = http_client
+        self.ttl_seconds = ttl_seconds
+        self.timeout = timeout
+        self._cards: dict[str, _CachedCard] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def get(self, remote_agent_address: str, force: bool = False) -> AgentCard:
+        """Returns the card of an agent, raising if it cannot be fetched."""
+        address = normalize_address(remote_agent_address)
+        cached = self._cards.get(address)
+        if (
+            cached
+            and not force
+            and time.monotonic() - cached.fetched_at < self.ttl_seconds
+        ):
+            return cached.card
+        inflight = self._inflight.get(address)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch(address))
+            self._inflight[address] = inflight
+            inflight.add_done_callback(
+                lambda _: self._inflight.pop(address, None)
+            )
+        return await asyncio.shield(inflight)
+
+    async def get_many(
+        self, remote_agent_addresses: list[str]
+    ) -> dict[str, AgentCard | Exception]:
+        """Fetches cards concurrently; failures are returned, not raised."""
+        results = await asyncio.gather(
+            *(self.get(address) for address in remote_agent_addresses),
+            return_exceptions=True,
+        )
+        return dict(zip(remote_agent_addresses, results, strict=True))
+
+    def invalidate(self, remote_agent_address: str):
+        self._cards.pop(normalize_address(remote_agent_address), None)
+
+    async def _fetch(self, address: str) -> AgentCard:
+        cached = self._cards.get(address)
+        headers = {}
+        if cached and cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached and cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+        url = f'{address}{AGENT_CARD_WELL_KNOWN_PATH}'
+        if self._http_client:
+            response = await self._http_client.get(
+                url, headers=headers, timeout=self.timeout
+            )
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.get(url, headers=headers)
+        if response.status_code == 304 and cached:
+            cached.fetched_at = time.monotonic()
+            return cached.card
+        response.raise_for_status()
+        card = AgentCard(**response.json())
+        if not card.url:
+            card.url = address
+        self._cards[address] = _CachedCard(
+            card,
+            response.headers.get('etag'),
+            response.headers.get('last-modified'),
+        )
+        return card
@@ -9,11 +9,10 @@ from typing import Any
 
 from a2a_mcp.common.agent_runner import AgentRunner
 from a2a_mcp.common.base_agent import BaseAgent
-from a2a_mcp.common.utils import get_mcp_server_config, init_api_key
+from a2a_mcp.common.utils import init_api_key
+from a2a_mcp.mcp.session_pool import get_mcp_tools
 from google.adk.agents import Agent
 from google.adk.models.lite_llm import LiteLlm
-from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
-from google.adk.tools.mcp_tool.mcp_session_manager import SseServerParams
 from google.genai import types as genai_types
 
 
@@ -39,11 +38,7 @@ class TravelAgent(BaseAgent):
 
     async def init_agent(self):
         logger.info(f'Initializing {self.agent_name} metadata')
-        config = get_mcp_server_config()
-        logger.info(f'MCP Server url={config.url}')
-        tools = await MCPToolset(
-            connection_params=SseServerParams(url=config.url)
-        ).get_tools()
+        tools = await get_mcp_tools()
 
         for tool in tools:
             logger.info(f'Loaded tools {tool.name}')
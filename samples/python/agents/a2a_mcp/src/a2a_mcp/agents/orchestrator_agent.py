@@ -1,9 +1,12 @@
+import asyncio
 import json
 import logging
+import weakref
 
 from collections.abc import AsyncIterable
 
 from a2a.types import (
+    Artifact,
     SendStreamingMessageSuccessResponse,
     TaskArtifactUpdateEvent,
     TaskState,
@@ -13,6 +16,7 @@ from a2a_mcp.common import prompts
 from a2a_mcp.common.base_agent import BaseAgent
 from a2a_mcp.common.utils import init_api_key
 from a2a_mcp.common.workflow import Status, WorkflowGraph, WorkflowNode
+from a2a_mcp.common.workflow_store import WorkflowCheckpointStore
 from google import genai
 
 
@@ -34,6 +38,9 @@ class OrchestratorAgent(BaseAgent):
         self.travel_context = {}
         self.query_history = []
         self.context_id = None
+        self.checkpoints = WorkflowCheckpointStore()
+        # Runs of a context are serialized, kept while a run holds them.
+        self._stream_locks = weakref.WeakValueDictionary()
 
     async def generate_summary(self) -> str:
         client = genai.Client()
@@ -98,6 +105,105 @@ class OrchestratorAgent(BaseAgent):
         self.set_node_attributes(node.id, task_id, context_id, query)
         return node
 
+    def add_task_nodes(
+        self, tasks: list[dict], planner_node_id: str, task_id, context_id
+    ) -> None:
+        """Add the planner's tasks to the graph, with edges for dependencies.
+
+        Tasks without dependencies follow the planner and run concurrently.
+        If the planner does not declare dependencies for a task, the task
+        follows the previous one.
+        """
+        node_ids = [
+            self.add_graph_node(
+                task_id=task_id,
+                context_id=context_id,
+                query=task_data['description'],
+            ).id
+            for task_data in tasks
+        ]
+        task_nodes = {
+            task_data.get('id'): node_id
+            for task_data, node_id in zip(tasks, node_ids, strict=True)
+        }
+
+        previous_node_id = planner_node_id
+        for task_data, node_id in zip(tasks, node_ids, strict=True):
+            depends_on = task_data.get('depends_on')
+            if depends_on is None:
+                parents = [previous_node_id]
+            else:
+                parents = [
+                    task_nodes[d] for d in depends_on if d in task_nodes
+                ]
+            for parent_id in parents:
+                try:
+                    self.graph.add_edge(parent_id, node_id)
+                except ValueError:
+                    logger.info(
+                        f'Ignoring dependency of task {task_data.get("id")}'
+                        ' that would create a cycle'
+                    )
+            if not self.graph.graph.in_degree(node_id):
+                self.graph.add_edge(planner_node_id, node_id)
+            previous_node_id = node_id
+
+    def new_graph(self, graph: WorkflowGraph | None = None) -> WorkflowGraph:
+        """Use graph, or a new empty one, checkpointing after each node."""
+        self.graph = graph or WorkflowGraph()
+        self.graph.on_node_completed = lambda node: self.save_checkpoint()
+        return self.graph
+
+    def save_checkpoint(self):
+        """Persist the workflow of the current context."""
+        if not self.graph or not self.context_id:
+            return
+        try:
+            self.checkpoints.save(
+                self.context_id,
+                {
+                    'graph': self.graph.to_dict(),
+                    'results': [
+                        r.model_dump(mode='json', exclude_none=True)
+                        for r in self.results
+                    ],
+                    'travel_context': self.travel_context,
+                    'query_history': self.query_history,
+                },
+            )
+        except Exception as e:
+            logger.error(f'Could not checkpoint workflow: {e}')
+
+    def restore_checkpoint(self, context_id, task_id) -> bool:
+        """Load the saved workflow of context_id, if there is one.
+
+        Nodes that did not complete are moved to task_id, so the workflow
+        resumes from the first incomplete node as part of this task.
+        """
+        try:
+            checkpoint = self.checkpoints.load(context_id)
+            if not checkpoint:
+                return False
+            graph = WorkflowGraph.from_dict(checkpoint['graph'])
+            results = [
+                Artifact.model_validate(r) for r in checkpoint['results']
+            ]
+        except Exception as e:
+            logger.error(f'Could not restore workflow for {context_id}: {e}')
+            return False
+        self.new_graph(graph)
+        self.results = results
+        self.travel_context = checkpoint.get('travel_context') or {}
+        self.query_history = checkpoint.get('query_history') or []
+        for node_id, node in self.graph.nodes.items():
+            if node.state != Status.COMPLETED:
+                self.set_node_attributes(node_id, task_id, context_id)
+        logger.info(
+            f'Restored workflow for {context_id} with'
+            f' {len(self.graph.nodes)} nodes'
+        )
+        return True
+
     def clear_state(self):
         self.graph = None
         self.results.clear()
@@ -107,7 +213,22 @@ class OrchestratorAgent(BaseAgent):
     async def stream(
         self, query, context_id, task_id
     ) -> AsyncIterable[dict[str, any]]:
-        """Execute and stream response."""
+        """Execute and stream response.
+
+        A reply can arrive while the run that asked the question still waits
+        for sibling nodes, it waits for that run so it resumes the paused
+        node instead of starting the workflow over.
+        """
+        lock = self._stream_locks.get(context_id)
+        if lock is None:
+            lock = self._stream_locks[context_id] = asyncio.Lock()
+        async with lock:
+            async for chunk in self._stream(query, context_id, task_id):
+                yield chunk
+
+    async def _stream(
+        self, query, context_id, task_id
+    ) -> AsyncIterable[dict[str, any]]:
         logger.info(
             f'Running {self.agent_name} stream for session {context_id}, task {task_id} - {query}'
         )
@@ -117,12 +238,13 @@ class OrchestratorAgent(BaseAgent):
             # Clear state when the context changes
             self.clear_state()
             self.context_id = context_id
+            self.restore_checkpoint(context_id, task_id)
 
         self.query_history.append(query)
         start_node_id = None
         # Graph does not exist, start a new graph with planner node.
         if not self.graph:
-            self.graph = WorkflowGraph()
+            self.new_graph()
             planner_node = self.add_graph_node(
                 task_id=task_id,
                 context_id=context_id,
@@ -203,23 +325,17 @@ class OrchestratorAgent(BaseAgent):
                             logger.info(
                                 f'Updating workflow with {len(artifact_data["tasks"])} task nodes'
                             )
-                            # Define the edges
-                            current_node_id = start_node_id
-                            for idx, task_data in enumerate(
-                                artifact_data['tasks']
-                            ):
-                                node = self.add_graph_node(
-                                    task_id=task_id,
-                                    context_id=context_id,
-                                    query=task_data['description'],
-                                    node_id=current_node_id,
-                                )
-                                current_node_id = node.id
-                                # Restart graph from the newly inserted subgraph state
-                                # Start from the new node just created.
-                                if idx == 0:
-                                    should_resume_workflow = True
-                                    start_node_id = node.id
+                            self.add_task_nodes(
+                                artifact_data['tasks'],
+                                planner_node_id=start_node_id,
+                                task_id=task_id,
+                                context_id=context_id,
+                            )
+                            # Restart graph from the planner, it is complete
+                            # so the new task nodes without pending
+                            # dependencies run next.
+                            if artifact_data['tasks']:
+                                should_resume_workflow = True
                         else:
                             # Not planner but artifacts from other tasks,
                             # continue to the next node in the workflow.
@@ -231,6 +347,7 @@ class OrchestratorAgent(BaseAgent):
                     logger.info('No workflow resume detected, yielding chunk')
                     # Yield partial execution
                     yield chunk
+            self.save_checkpoint()
             # The graph is complete and no updates, so okay to break from the loop.
             if not should_resume_workflow:
                 logger.info(
@@ -244,6 +361,7 @@ class OrchestratorAgent(BaseAgent):
             # All individual actions complete, now generate the summary
             logger.info(f'Generating summary for {len(self.results)} results')
             summary = await self.generate_summary()
+            self.checkpoints.delete(self.context_id)
             self.clear_state()
             logger.info(f'Summary: {summary}')
             yield {
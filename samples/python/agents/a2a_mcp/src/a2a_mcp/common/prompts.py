@@ -262,6 +262,10 @@ You will include 3 tasks in your plan, based on the user request.
 2. Hotel Booking.
 3. Car Rental Booking.
 
+For each task, list the ids of the tasks that must be completed before it can
+start in 'depends_on'. Use an empty list when the task does not need the result
+of another task, independent bookings run at the same time.
+
 Always use chain-of-thought reasoning before responding to track where you are 
 in the decision tree and determine the next appropriate question.
 
@@ -356,17 +360,20 @@ Your output should follow this example format. DO NOT add any thing else apart f
         {
             'id': 1,
             'description': 'Book round-trip economy class air tickets from San Francisco (SFO) to London (LHR) for the dates May 12, 2025 to May 20, 2025.',
-            'status': 'pending'
+            'status': 'pending',
+            'depends_on': []
         }, 
         {
             'id': 2,
             'description': 'Book a suite room at a hotel in London for checkin date May 12, 2025 and checkout date May 20th 2025',
-            'status': 'pending'
+            'status': 'pending',
+            'depends_on': []
         },
         {
             'id': 3,
             'description': 'Book an SUV rental car in London with a pickup on May 12, 2025 and return on May 20, 2025', 
-            'status': 'pending'
+            'status': 'pending',
+            'depends_on': []
         }
     ]
 }
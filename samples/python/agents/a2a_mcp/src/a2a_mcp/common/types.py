@@ -34,6 +34,11 @@ class PlannerTask(BaseModel):
         ]
         | None
     ) = Field(description='Status of the task', default='input_required')
+    depends_on: list[int] | None = Field(
+        description='IDs of the tasks that must complete before this task'
+        ' starts. Empty if the task does not depend on other tasks.',
+        default=None,
+    )
 
 
 class TripInfo(BaseModel):
@@ -97,7 +102,8 @@ class TaskList(BaseModel):
     trip_info: TripInfo | None = Field(description='Trip information')
 
     tasks: list[PlannerTask] = Field(
-        description='A list of tasks to be executed sequentially.'
+        description='A list of tasks, each executed once the tasks it depends'
+        ' on completed.'
     )
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import uuid
@@ -12,19 +13,23 @@ import networkx as nx
 from a2a.client import A2AClient
 from a2a.types import (
     AgentCard,
+    Artifact,
     MessageSendParams,
     SendStreamingMessageRequest,
+    SendStreamingMessageResponse,
     SendStreamingMessageSuccessResponse,
     TaskArtifactUpdateEvent,
     TaskState,
     TaskStatusUpdateEvent,
 )
-from a2a_mcp.common.utils import get_mcp_server_config
 from a2a_mcp.mcp import client
+from a2a_mcp.mcp.session_pool import get_session_pool
 
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENT_NODES = 4
+
 
 class Status(Enum):
     """Represents the status of a workflow and its associated node."""
@@ -57,29 +62,65 @@ class WorkflowNode:
         self.task = task
         self.results = None
         self.state = Status.READY
+        # The input_required chunk the node paused with.
+        self.input_request = None
+
+    def to_dict(self) -> dict:
+        """JSON serializable state of the node, see from_dict."""
+        return {
+            'id': self.id,
+            'task': self.task,
+            'node_key': self.node_key,
+            'node_label': self.node_label,
+            'state': self.state.value,
+            'results': self.results.model_dump(mode='json', exclude_none=True)
+            if self.results
+            else None,
+            'input_request': self.input_request.model_dump(
+                mode='json', exclude_none=True
+            )
+            if self.input_request
+            else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'WorkflowNode':
+        node = cls(
+            task=data['task'],
+            node_key=data.get('node_key'),
+            node_label=data.get('node_label'),
+        )
+        node.id = data['id']
+        node.state = Status(data['state'])
+        # A node that was running when the state was saved starts over.
+        if node.state == Status.RUNNING:
+            node.state = Status.READY
+        if data.get('results'):
+            node.results = Artifact.model_validate(data['results'])
+        if data.get('input_request'):
+            node.input_request = SendStreamingMessageResponse.model_validate(
+                data['input_request']
+            )
+        return node
 
     async def get_planner_resource(self) -> AgentCard | None:
         logger.info(f'Getting resource for node {self.id}')
-        config = get_mcp_server_config()
-        async with client.init_session(
-            config.host, config.port, config.transport
-        ) as session:
-            response = await client.find_resource(
+        response = await get_session_pool().call(
+            lambda session: client.find_resource(
                 session, 'resource://agent_cards/planner_agent'
             )
-            data = json.loads(response.contents[0].text)
-            return AgentCard(**data['agent_card'][0])
+        )
+        data = json.loads(response.contents[0].text)
+        return AgentCard(**data['agent_card'][0])
 
     async def find_agent_for_task(self) -> AgentCard | None:
         logger.info(f'Find agent for task - {self.task}')
-        config = get_mcp_server_config()
-        async with client.init_session(
-            config.host, config.port, config.transport
-        ) as session:
-            result = await client.find_agent(session, self.task)
-            agent_card_json = json.loads(result.content[0].text)
-            logger.debug(f'Found agent {agent_card_json} for task {self.task}')
-            return AgentCard(**agent_card_json)
+        result = await get_session_pool().call(
+            lambda session: client.find_agent(session, self.task)
+        )
+        agent_card_json = json.loads(result.content[0].text)
+        logger.debug(f'Found agent {agent_card_json} for task {self.task}')
+        return AgentCard(**agent_card_json)
 
     async def run_node(
         self,
@@ -120,15 +161,60 @@ class WorkflowNode:
 
 
 class WorkflowGraph:
-    """Represents a graph of workflow nodes."""
+    """Represents a graph of workflow nodes.
 
-    def __init__(self) -> None:
+    Nodes run as soon as all of their predecessors completed, up to
+    max_concurrency nodes at a time.
+    """
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENT_NODES) -> None:
         self.graph = nx.DiGraph()
         self.nodes = {}
         self.latest_node = None
         self.node_type = None
         self.state = Status.INITIALIZED
+        self.max_concurrency = max(max_concurrency, 1)
+        # The node whose input request was last passed on to the caller.
         self.paused_node_id = None
+        # All nodes waiting for input, in the order they paused.
+        self.paused_node_ids = []
+        # Called with the node after each node completed.
+        self.on_node_completed = None
+
+    def to_dict(self) -> dict:
+        """JSON serializable state of the graph, see from_dict."""
+        return {
+            'state': self.state.value,
+            'max_concurrency': self.max_concurrency,
+            'paused_node_id': self.paused_node_id,
+            'paused_node_ids': list(self.paused_node_ids),
+            'nodes': [
+                {
+                    **self.nodes[node_id].to_dict(),
+                    'attributes': dict(self.graph.nodes[node_id]),
+                }
+                for node_id in self.graph.nodes
+            ],
+            'edges': [list(edge) for edge in self.graph.edges],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'WorkflowGraph':
+        graph = cls(
+            max_concurrency=data.get('max_concurrency', MAX_CONCURRENT_NODES)
+        )
+        for node_data in data['nodes']:
+            node = WorkflowNode.from_dict(node_data)
+            graph.add_node(node)
+            graph.set_node_attributes(node.id, node_data.get('attributes', {}))
+        for from_node_id, to_node_id in data['edges']:
+            graph.graph.add_edge(from_node_id, to_node_id)
+        graph.state = Status(data['state'])
+        if graph.state == Status.RUNNING:
+            graph.state = Status.READY
+        graph.paused_node_id = data.get('paused_node_id')
+        graph.paused_node_ids = list(data.get('paused_node_ids', []))
+        return graph
 
     def add_node(self, node) -> None:
         logger.info(f'Adding node {node.id}')
@@ -139,14 +225,46 @@ class WorkflowGraph:
     def add_edge(self, from_node_id: str, to_node_id: str) -> None:
         if from_node_id not in self.nodes or to_node_id not in self.nodes:
             raise ValueError('Invalid node IDs')
+        if nx.has_path(self.graph, to_node_id, from_node_id):
+            raise ValueError('Edge would create a cycle')
 
         self.graph.add_edge(from_node_id, to_node_id)
 
+    def is_ready(self, node_id: str, resume_node_id: str | None) -> bool:
+        """Whether the node can run, all its predecessors have completed.
+
+        A paused node only runs again when it is the node being resumed.
+        Nodes an overlapping run started or completed are not run again.
+        """
+        node = self.nodes[node_id]
+        if node.state in (Status.RUNNING, Status.COMPLETED):
+            return False
+        if node.state == Status.PAUSED and node_id != resume_node_id:
+            return False
+        return all(
+            self.nodes[p].state == Status.COMPLETED
+            for p in self.graph.predecessors(node_id)
+        )
+
+    async def _run_node(self, node, queue: asyncio.Queue) -> None:
+        """Forwards the chunks of a node to the queue, then None or an error."""
+        query = self.graph.nodes[node.id].get('query')
+        task_id = self.graph.nodes[node.id].get('task_id')
+        context_id = self.graph.nodes[node.id].get('context_id')
+        try:
+            async for chunk in node.run_node(query, task_id, context_id):
+                await queue.put((node, chunk))
+        except Exception as e:
+            await queue.put((node, e))
+            return
+        await queue.put((node, None))
+
     async def run_workflow(
         self, start_node_id: str | None = None
     ) -> AsyncIterable[dict[str, any]]:
         logger.info('Executing workflow graph')
         if not start_node_id or start_node_id not in self.nodes:
+            start_node_id = None
             start_nodes = [n for n, d in self.graph.in_degree() if d == 0]
         else:
             start_nodes = [self.nodes[start_node_id].id]
@@ -158,42 +276,94 @@ class WorkflowGraph:
             applicable_graph.update(nx.descendants(self.graph, node_id))
 
         complete_graph = list(nx.topological_sort(self.graph))
-        sub_graph = [n for n in complete_graph if n in applicable_graph]
+        # Completed nodes keep their results and are not run again, nodes
+        # still running in an earlier run are left to that run.
+        sub_graph = [
+            n
+            for n in complete_graph
+            if n in applicable_graph
+            and self.nodes[n].state not in (Status.COMPLETED, Status.RUNNING)
+        ]
         logger.info(f'Sub graph {sub_graph} size {len(sub_graph)}')
         self.state = Status.RUNNING
-        # Alternative is to loop over all nodes, but we only need the connected nodes.
-        for node_id in sub_graph:
-            node = self.nodes[node_id]
-            node.state = Status.RUNNING
-            query = self.graph.nodes[node_id].get('query')
-            task_id = self.graph.nodes[node_id].get('task_id')
-            context_id = self.graph.nodes[node_id].get('context_id')
-            async for chunk in node.run_node(query, task_id, context_id):
+        # Chunks of all running nodes are merged through one queue.
+        queue = asyncio.Queue()
+        running: dict[str, asyncio.Task] = {}
+        asked_for_input = False
+        try:
+            while True:
+                for node_id in list(sub_graph):
+                    if len(running) >= self.max_concurrency:
+                        break
+                    if not self.is_ready(node_id, start_node_id):
+                        continue
+                    sub_graph.remove(node_id)
+                    if node_id in self.paused_node_ids:
+                        self.paused_node_ids.remove(node_id)
+                    node = self.nodes[node_id]
+                    node.state = Status.RUNNING
+                    running[node_id] = asyncio.create_task(
+                        self._run_node(node, queue)
+                    )
+                if not running:
+                    break
+                node, chunk = await queue.get()
+                if chunk is None or isinstance(chunk, Exception):
+                    del running[node.id]
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    if node.state == Status.RUNNING:
+                        node.state = Status.COMPLETED
+                        if self.on_node_completed:
+                            self.on_node_completed(node)
+                    continue
                 # When the workflow node is paused, do not yield any chunks
-                # but, let the loop complete.
-                if node.state != Status.PAUSED:
-                    if isinstance(
-                        chunk.root, SendStreamingMessageSuccessResponse
-                    ) and (
-                        isinstance(chunk.root.result, TaskStatusUpdateEvent)
+                # but, let the node complete.
+                if node.state == Status.PAUSED:
+                    continue
+                if isinstance(
+                    chunk.root, SendStreamingMessageSuccessResponse
+                ) and (isinstance(chunk.root.result, TaskStatusUpdateEvent)):
+                    task_status_event = chunk.root.result
+                    if (
+                        task_status_event.status.state
+                        == TaskState.input_required
+                        and task_status_event.context_id
                     ):
-                        task_status_event = chunk.root.result
-                        context_id = task_status_event.context_id
-                        if (
-                            task_status_event.status.state
-                            == TaskState.input_required
-                            and context_id
-                        ):
-                            node.state = Status.PAUSED
-                            self.state = Status.PAUSED
-                            self.paused_node_id = node.id
-                    yield chunk
-            if self.state == Status.PAUSED:
-                break
-            if node.state == Status.RUNNING:
-                node.state = Status.COMPLETED
-        if self.state == Status.RUNNING:
+                        # Sibling nodes keep running while this one waits.
+                        node.state = Status.PAUSED
+                        node.input_request = chunk
+                        self.paused_node_ids.append(node.id)
+                        if asked_for_input:
+                            # One question at a time, this one is passed on
+                            # once the current one was answered.
+                            continue
+                        asked_for_input = True
+                        self.paused_node_id = node.id
+                        # A reply may arrive before the siblings finish, it
+                        # must resume this node.
+                        self.state = Status.PAUSED
+                yield chunk
+        finally:
+            for task in running.values():
+                task.cancel()
+            await asyncio.gather(*running.values(), return_exceptions=True)
+            # Cancelled nodes run again from the start in the next run.
+            for node_id in running:
+                if self.nodes[node_id].state == Status.RUNNING:
+                    self.nodes[node_id].state = Status.READY
+        if self.paused_node_ids:
+            self.state = Status.PAUSED
+            if not asked_for_input:
+                # Ask for the input a node paused for in an earlier run.
+                self.paused_node_id = self.paused_node_ids[0]
+                yield self.nodes[self.paused_node_id].input_request
+        elif any(n.state == Status.RUNNING for n in self.nodes.values()):
+            # An overlapping run still has nodes running.
+            self.state = Status.RUNNING
+        else:
             self.state = Status.COMPLETED
+            self.paused_node_id = None
 
     def set_node_attribute(self, node_id, attribute, value) -> None:
         nx.set_node_attributes(self.graph, {node_id: value}, attribute)
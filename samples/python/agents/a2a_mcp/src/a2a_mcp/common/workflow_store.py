@@ -0,0 +1,60 @@
+import json
+import logging
+import sqlite3
+import time
+
+from contextlib import closing
+
+
+logger = logging.getLogger(__name__)
+
+WORKFLOW_CHECKPOINT_DB = 'workflow_checkpoints.db'
+
+
+class WorkflowCheckpointStore:
+    """Workflow checkpoints per context id, kept in a SQLite database.
+
+    A checkpoint is the JSON serializable state of a workflow, saved again
+    after every completed node so a restarted agent can continue the
+    workflow instead of running it from the start.
+    """
+
+    def __init__(self, db_path: str = WORKFLOW_CHECKPOINT_DB):
+        self.db_path = db_path
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS workflow_checkpoints ('
+                ' context_id TEXT PRIMARY KEY,'
+                ' checkpoint TEXT NOT NULL,'
+                ' updated_at REAL NOT NULL)'
+            )
+
+    def save(self, context_id: str, checkpoint: dict) -> None:
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO workflow_checkpoints'
+                ' (context_id, checkpoint, updated_at) VALUES (?, ?, ?)',
+                (context_id, json.dumps(checkpoint), time.time()),
+            )
+
+    def load(self, context_id: str) -> dict | None:
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            row = conn.execute(
+                'SELECT checkpoint FROM workflow_checkpoints'
+                ' WHERE context_id = ?',
+                (context_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError as e:
+            logger.error(f'Ignoring corrupt checkpoint for {context_id}: {e}')
+            return None
+
+    def delete(self, context_id: str) -> None:
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute(
+                'DELETE FROM workflow_checkpoints WHERE context_id = ?',
+                (context_id,),
+            )
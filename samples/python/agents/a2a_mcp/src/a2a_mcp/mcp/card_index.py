@@ -0,0 +1,221 @@
+import hashlib
+import json
+import logging
+import os
+import time
+
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = 'index.npz'
+
+
+class AgentCardIndex:
+    """Persisted embedding index of the agent cards in a directory.
+
+    The embeddings are kept as a float32 matrix with L2 normalized rows,
+    one per card, saved in a single .npz file together with the SHA-256 of
+    each card file and the model name. Refreshing the index only embeds the
+    cards whose content changed since the index was saved, in batches, so a
+    start with an unchanged card directory makes no embedding calls. The
+    matrix stays resident and a query is scored with a single matvec.
+    """
+
+    def __init__(
+        self,
+        cards_dir: str,
+        index_dir: str,
+        embed_documents: Callable[[list[str]], list[list[float]]],
+        model: str = '',
+        batch_size: int = 100,
+        check_interval: float = 30.0,
+    ):
+        """Creates an empty index, call refresh to load or build it.
+
+        Args:
+            cards_dir: Directory with one JSON agent card per file.
+            index_dir: Directory the index file is saved in.
+            embed_documents: Embeds a batch of card texts.
+            model: Name of the embedding model. Embeddings from another model
+                are not reused.
+            batch_size: Maximum number of texts per embed_documents call.
+            check_interval: Minimum seconds between checks of the card
+                directory in refresh_if_changed.
+        """
+        self.cards_dir = Path(cards_dir)
+        self.index_dir = Path(index_dir)
+        self.embed_documents = embed_documents
+        self.model = model
+        self.batch_size = max(batch_size, 1)
+        self.check_interval = check_interval
+        self.card_uris: list[str] = []
+        self.cards: list[dict] = []
+        self.hashes: list[str] = []
+        self.matrix = np.zeros((0, 0), dtype=np.float32)
+        self.embedding_calls = 0
+        self._signature = None
+        self._checked_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def refresh(self) -> int:
+        """Brings the index up to date with the card directory.
+
+        Returns:
+            The number of cards that had to be embedded.
+        """
+        self._checked_at = time.monotonic()
+        # Taken before reading the cards, so a change made while refreshing
+        # is picked up by the next check.
+        signature = self._directory_signature()
+        saved = self._load_saved()
+        card_uris, cards, hashes, texts = [], [], [], []
+        for file_path in sorted(self.cards_dir.glob('*.json')):
+            try:
+                content = file_path.read_bytes()
+                card = json.loads(content)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f'Skipping agent card {file_path.name}: {e}')
+                continue
+            card_uris.append(f'resource://agent_cards/{file_path.stem}')
+            cards.append(card)
+            hashes.append(hashlib.sha256(content).hexdigest())
+            texts.append(json.dumps(card))
+
+        rows: list[np.ndarray | None] = [saved.get(h) for h in hashes]
+        missing = [i for i, row in enumerate(rows) if row is None]
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start : start + self.batch_size]
+            self.embedding_calls += 1
+            vectors = self.embed_documents([texts[i] for i in batch])
+            for i, vector in zip(batch, vectors, strict=True):
+                rows[i] = np.asarray(vector, dtype=np.float32)
+
+        self.card_uris, self.cards, self.hashes = card_uris, cards, hashes
+        self.matrix = (
+            normalize(np.stack(rows))
+            if rows
+            else np.zeros((0, 0), dtype=np.float32)
+        )
+        if missing or len(saved) != len(hashes):
+            self._save()
+        # Only set once the index is up to date, a failed refresh is retried
+        # by the next refresh_if_changed.
+        self._signature = signature
+        logger.info(
+            f'Agent card index has {len(cards)} cards,'
+            f' embedded {len(missing)}'
+        )
+        return len(missing)
+
+    def refresh_if_changed(self) -> bool:
+        """Refreshes the index if card files were added, changed or removed.
+
+        The directory is checked at most once per check_interval seconds. If
+        the refresh fails, for example because embedding failed, the error is
+        logged and the previous index is kept.
+        """
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return False
+        self._checked_at = now
+        if self._directory_signature() == self._signature:
+            return False
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.error(f'Could not refresh the agent card index: {e}')
+            return False
+        return True
+
+    def scores(self, query_embedding) -> np.ndarray:
+        """Cosine similarity of every card to the query embedding."""
+        if not len(self):
+            return np.zeros(0, dtype=np.float32)
+        query = np.asarray(query_embedding, dtype=np.float32)
+        return self.matrix @ (query / (np.linalg.norm(query) or 1.0))
+
+    def top_k(
+        self, query_embedding, k: int, min_score: float | None = None
+    ) -> list[tuple[int, float]]:
+        """The k best matching cards as (row, score), best first.
+
+        Args:
+            query_embedding: Embedding of the query.
+            k: Maximum number of cards to return.
+            min_score: If set, cards scoring below it are left out.
+        """
+        scores = self.scores(query_embedding)
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        if k < len(scores):
+            # Selects the k best in linear time, only those get sorted.
+            rows = np.argpartition(scores, -k)[-k:]
+        else:
+            rows = np.arange(len(scores))
+        rows = rows[np.argsort(-scores[rows], kind='stable')]
+        return [
+            (int(row), float(scores[row]))
+            for row in rows
+            if min_score is None or scores[row] >= min_score
+        ]
+
+    def _directory_signature(self) -> tuple:
+        try:
+            return tuple(
+                sorted(
+                    (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+                    for entry in os.scandir(self.cards_dir)
+                    if entry.name.lower().endswith('.json')
+                )
+            )
+        except OSError:
+            return ()
+
+    def _load_saved(self) -> dict[str, np.ndarray]:
+        """Saved embedding rows by card hash, empty if unusable."""
+        try:
+            with np.load(self.index_dir / INDEX_FILE) as saved:
+                if str(saved['model']) != self.model:
+                    return {}
+                matrix, hashes = saved['matrix'], saved['hashes']
+            if len(hashes) != len(matrix):
+                raise ValueError(
+                    f'{len(hashes)} hashes for {len(matrix)} embeddings'
+                )
+            return {
+                str(card_hash): matrix[i] for i, card_hash in enumerate(hashes)
+            }
+        except (OSError, ValueError, KeyError) as e:
+            if not isinstance(e, FileNotFoundError):
+                logger.warning(f'Ignoring agent card index: {e}')
+            return {}
+
+    def _save(self):
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        # The embeddings, their card hashes and the model share one file,
+        # written to a temporary file first and renamed into place, so the
+        # saved hashes always match the saved matrix.
+        index_tmp = self.index_dir / f'{INDEX_FILE}.tmp'
+        with index_tmp.open('wb') as f:
+            np.savez(
+                f,
+                matrix=self.matrix,
+                hashes=np.array(self.hashes, dtype=str),
+                model=np.array(self.model),
+            )
+        os.replace(index_tmp, self.index_dir / INDEX_FILE)
+
+
+def normalize(matrix: np.ndarray) -> np.ndarray:
+    """Scales every row to unit length, leaving zero rows as they are."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
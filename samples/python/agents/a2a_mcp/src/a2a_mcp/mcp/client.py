@@ -98,6 +98,31 @@ async def find_agent(session: ClientSession, query) -> CallToolResult:
     )
 
 
+async def find_agents(
+    session: ClientSession, query, k: int = 3, min_score: float = 0.0
+) -> CallToolResult:
+    """Calls the 'find_agents' tool on the connected MCP server.
+
+    Args:
+        session: The active ClientSession.
+        query: The natural language query to send to the 'find_agents' tool.
+        k: The maximum number of agent cards to return.
+        min_score: The minimum similarity score of a returned agent card.
+
+    Returns:
+        The result of the tool call.
+    """
+    logger.info(f"Calling 'find_agents' tool with query: '{query[:50]}...'")
+    return await session.call_tool(
+        name='find_agents',
+        arguments={
+            'query': query,
+            'k': k,
+            'min_score': min_score,
+        },
+    )
+
+
 async def find_resource(session: ClientSession, resource) -> ReadResourceResult:
     """Reads a resource from the connected MCP server.
 
@@ -0,0 +1,87 @@
+import threading
+import time
+
+from collections import OrderedDict
+from collections.abc import Callable
+
+import numpy as np
+
+
+def normalize_query(query: str) -> str:
+    """Cache key of a query, ignoring case and whitespace differences."""
+    return ' '.join(query.lower().split())
+
+
+class QueryEmbeddingCache:
+    """LRU cache of query embeddings with a time to live.
+
+    Planner tasks with the same wording recur across requests, caching
+    their embeddings saves an embedding round trip per lookup. Entries are
+    keyed by the normalized query text, but the query is embedded as it was
+    written on the miss. The least recently used entry is evicted once
+    max_size is reached and entries older than ttl seconds are embedded
+    again.
+    """
+
+    def __init__(
+        self,
+        embed_query: Callable[[str], list[float]],
+        max_size: int = 1024,
+        ttl: float = 3600.0,
+    ):
+        self.embed_query = embed_query
+        self.max_size = max(max_size, 1)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, np.ndarray]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, query: str) -> np.ndarray:
+        """The float32 embedding of query, embedding it on a cache miss."""
+        key = normalize_query(query)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+        # Embedded outside the lock, concurrent misses for the same query
+        # both embed it and the last one wins.
+        embedding = np.asarray(self.embed_query(query), dtype=np.float32)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return embedding
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'ttl_seconds': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'expirations': self.expirations,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
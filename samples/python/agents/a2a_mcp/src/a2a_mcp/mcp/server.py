@@ -8,16 +8,21 @@ from pathlib import Path
 
 import google.generativeai as genai
 import numpy as np
-import pandas as pd
 import requests
 
 from a2a_mcp.common.utils import init_api_key
+from a2a_mcp.mcp.card_index import AgentCardIndex
+from a2a_mcp.mcp.query_cache import QueryEmbeddingCache
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.utilities.logging import get_logger
 
 
 logger = get_logger(__name__)
 AGENT_CARDS_DIR = 'agent_cards'
+AGENT_CARD_INDEX_DIR = '.agent_card_index'
+EMBEDDING_BATCH_SIZE = 100
+QUERY_CACHE_SIZE = 1024
+QUERY_CACHE_TTL_SECONDS = 3600
 MODEL = 'models/embedding-001'
 SQLLITE_DB = 'travel_agency.db'
 PLACES_API_URL = 'https://places.googleapis.com/v1/places:searchText'
@@ -27,10 +32,12 @@ def generate_embeddings(text):
     """Generates embeddings for the given text using Google Generative AI.
 
     Args:
-        text: The input string for which to generate embeddings.
+        text: The input string, or a list of strings, for which to generate
+            embeddings. A list is embedded in a single request.
 
     Returns:
-        A list of embeddings representing the input text.
+        A list of embeddings representing the input text, or a list of such
+        lists when text is a list.
     """
     return genai.embed_content(
         model=MODEL,
@@ -39,78 +46,54 @@ def generate_embeddings(text):
     )['embedding']
 
 
-def load_agent_cards():
-    """Loads agent card data from JSON files within a specified directory.
+def generate_query_embedding(query):
+    """Generates the embedding of a search query for matching agent cards.
+
+    Args:
+        query: The natural language query string.
 
     Returns:
-        A list containing JSON data from an agent card file found in the specified directory.
-        Returns an empty list if the directory is empty, contains no '.json' files,
-        or if all '.json' files encounter errors during processing.
+        A list of embeddings representing the query.
     """
-    card_uris = []
-    agent_cards = []
-    dir_path = Path(AGENT_CARDS_DIR)
-    if not dir_path.is_dir():
-        logger.error(
-            f'Agent cards directory not found or is not a directory: {AGENT_CARDS_DIR}'
-        )
-        return agent_cards
-
-    logger.info(f'Loading agent cards from card repo: {AGENT_CARDS_DIR}')
+    return genai.embed_content(
+        model=MODEL, content=query, task_type='retrieval_query'
+    )['embedding']
 
-    for filename in os.listdir(AGENT_CARDS_DIR):
-        if filename.lower().endswith('.json'):
-            file_path = dir_path / filename
-
-            if file_path.is_file():
-                logger.info(f'Reading file: {filename}')
-                try:
-                    with file_path.open('r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        card_uris.append(
-                            f'resource://agent_cards/{Path(filename).stem}'
-                        )
-                        agent_cards.append(data)
-                except json.JSONDecodeError as jde:
-                    logger.error(f'JSON Decoder Error {jde}')
-                except OSError as e:
-                    logger.error(f'Error reading file {filename}: {e}.')
-                except Exception as e:
-                    logger.error(
-                        f'An unexpected error occurred processing {filename}: {e}',
-                        exc_info=True,
-                    )
-    logger.info(
-        f'Finished loading agent cards. Found {len(agent_cards)} cards.'
-    )
-    return card_uris, agent_cards
 
+def build_agent_card_index() -> AgentCardIndex:
+    """Loads the agent card embedding index, embedding only changed cards.
 
-def build_agent_card_embeddings() -> pd.DataFrame:
-    """Loads agent cards, generates embeddings for them, and returns a DataFrame.
+    The embeddings are persisted in AGENT_CARD_INDEX_DIR keyed by a hash of
+    each card file, so a restart with unchanged agent cards does not call the
+    embedding model.
 
     Returns:
-        Optional[pd.DataFrame]: A Pandas DataFrame containing the original
-        'agent_card' data and their corresponding 'Embeddings'. Returns None
-        if no agent cards were loaded initially or if an exception occurred
-        during the embedding generation process.
+        The AgentCardIndex for the cards in AGENT_CARDS_DIR. It is empty if
+        the directory holds no readable cards or embedding failed.
     """
-    card_uris, agent_cards = load_agent_cards()
-    logger.info('Generating Embeddings for agent cards')
+    index = AgentCardIndex(
+        AGENT_CARDS_DIR,
+        AGENT_CARD_INDEX_DIR,
+        generate_embeddings,
+        model=MODEL,
+        batch_size=EMBEDDING_BATCH_SIZE,
+    )
+    if not Path(AGENT_CARDS_DIR).is_dir():
+        logger.error(
+            f'Agent cards directory not found or is not a directory: {AGENT_CARDS_DIR}'
+        )
+        return index
+
+    logger.info(f'Loading agent cards from card repo: {AGENT_CARDS_DIR}')
     try:
-        if agent_cards:
-            df = pd.DataFrame(
-                {'card_uri': card_uris, 'agent_card': agent_cards}
-            )
-            df['card_embeddings'] = df.apply(
-                lambda row: generate_embeddings(json.dumps(row['agent_card'])),
-                axis=1,
-            )
-            return df
-        logger.info('Done generating embeddings for agent cards')
+        embedded = index.refresh()
+        logger.info(
+            f'Finished loading agent cards. Found {len(index)} cards,'
+            f' generated {embedded} embeddings.'
+        )
     except Exception as e:
         logger.error(f'An unexpected error occurred : {e}.', exc_info=True)
-        return None
+    return index
 
 
 def serve(host, port, transport):  # noqa: PLR0915
@@ -128,7 +111,12 @@ def serve(host, port, transport):  # noqa: PLR0915
     logger.info('Starting Agent Cards MCP Server')
     mcp = FastMCP('agent-cards', host=host, port=port)
 
-    df = build_agent_card_embeddings()
+    index = build_agent_card_index()
+    query_cache = QueryEmbeddingCache(
+        generate_query_embedding,
+        max_size=QUERY_CACHE_SIZE,
+        ttl=QUERY_CACHE_TTL_SECONDS,
+    )
 
     @mcp.tool(
         name='find_agent',
@@ -139,9 +127,9 @@ def serve(host, port, transport):  # noqa: PLR0915
 
         This function takes a user query, typically a natural language question or a task generated by an agent,
         generates its embedding, and compares it against the
-        pre-computed embeddings of the loaded agent cards. It uses the dot
-        product to measure similarity and identifies the agent card with the
-        highest similarity score.
+        pre-computed, normalized embeddings of the loaded agent cards with a
+        single matrix-vector product. It identifies the agent card with the
+        highest cosine similarity score.
 
         Args:
             query: The natural language query string used to search for a
@@ -150,18 +138,57 @@ def serve(host, port, transport):  # noqa: PLR0915
         Returns:
             The json representing the agent card deemed most relevant
             to the input query based on embedding similarity.
+
+        Raises:
+            ValueError: If no agent cards are indexed.
         """
-        query_embedding = genai.embed_content(
-            model=MODEL, content=query, task_type='retrieval_query'
-        )
-        dot_products = np.dot(
-            np.stack(df['card_embeddings']), query_embedding['embedding']
-        )
-        best_match_index = np.argmax(dot_products)
+        index.refresh_if_changed()
+        if not len(index):
+            raise ValueError('No agent cards are available')
+        scores = index.scores(query_cache.get(query))
+        best_match_index = int(np.argmax(scores))
         logger.debug(
-            f'Found best match at index {best_match_index} with score {dot_products[best_match_index]}'
+            f'Found best match at index {best_match_index} with score {scores[best_match_index]}'
         )
-        return df.iloc[best_match_index]['agent_card']
+        return index.cards[best_match_index]
+
+    @mcp.tool(
+        name='find_agents',
+        description='Finds the k most relevant agent cards, with their similarity scores, for a natural language query string.',
+    )
+    def find_agents(query: str, k: int = 3, min_score: float = 0.0) -> dict:
+        """Finds the most relevant agent cards based on a query string.
+
+        Unlike find_agent this returns the runners-up too, so a caller can
+        fall back to the next best agent without searching again.
+
+        Args:
+            query: The natural language query string used to search for
+                   relevant agents.
+            k: The maximum number of agent cards to return.
+            min_score: Agent cards with a lower similarity score are left
+                       out.
+
+        Returns:
+            A json / dictionary structured as {'agents': [...]}, a list of
+            {'card_uri', 'score', 'agent_card'} dictionaries ordered from the
+            best to the worst match.
+        """
+        index.refresh_if_changed()
+        if not len(index):
+            return {'agents': []}
+        matches = index.top_k(query_cache.get(query), k, min_score)
+        logger.debug(f'Found {len(matches)} matches for query {query[:50]}')
+        return {
+            'agents': [
+                {
+                    'card_uri': index.card_uris[row],
+                    'score': score,
+                    'agent_card': index.cards[row],
+                }
+                for row, score in matches
+            ]
+        }
 
     @mcp.tool()
     def query_places_data(query: str):
@@ -260,9 +287,21 @@ def serve(host, port, transport):  # noqa: PLR0915
         """
         resources = {}
         logger.info('Starting read resources')
-        resources['agent_cards'] = df['card_uri'].to_list()
+        resources['agent_cards'] = list(index.card_uris)
         return resources
 
+    @mcp.resource(
+        'resource://find_agent/cache_stats', mime_type='application/json'
+    )
+    def get_query_cache_stats() -> dict:
+        """Retrieves the hit rate and size of the query embedding cache.
+
+        Returns:
+            A json / dictionary with the cache size, limits, hit and miss
+            counts and the hit rate.
+        """
+        return query_cache.stats()
+
     @mcp.resource(
         'resource://agent_cards/{card_name}', mime_type='application/json'
     )
@@ -279,12 +318,12 @@ def serve(host, port, transport):  # noqa: PLR0915
         logger.info(
             f'Starting read resource resource://agent_cards/{card_name}'
         )
-        resources['agent_card'] = (
-            df.loc[
-                df['card_uri'] == f'resource://agent_cards/{card_name}',
-                'agent_card',
-            ]
-        ).to_list()
+        card_uri = f'resource://agent_cards/{card_name}'
+        resources['agent_card'] = [
+            card
+            for uri, card in zip(index.card_uris, index.cards, strict=True)
+            if uri == card_uri
+        ]
 
         return resources
 
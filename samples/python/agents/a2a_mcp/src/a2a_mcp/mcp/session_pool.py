@@ -0,0 +1,245 @@
+# type: ignore
+import asyncio
+import logging
+import time
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import TypeVar
+
+from a2a_mcp.common.utils import get_mcp_server_config
+from a2a_mcp.mcp import client
+from mcp import ClientSession
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+MAX_SESSIONS = 4
+HEALTH_CHECK_INTERVAL = 30.0
+PING_TIMEOUT = 5.0
+
+
+class _PooledSession:
+    """An MCP session kept open by a background task.
+
+    The transports are anyio context managers that have to be exited by
+    the task that entered them, so each session lives in its own task
+    until it is closed or its connection fails.
+    """
+
+    def __init__(self):
+        self.session: ClientSession | None = None
+        self.last_used = time.monotonic()
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._error: Exception | None = None
+
+    @property
+    def alive(self) -> bool:
+        return (
+            self.session is not None
+            and self._task is not None
+            and not self._task.done()
+        )
+
+    async def open(self, host, port, transport):
+        self._task = asyncio.create_task(self._run(host, port, transport))
+        await self._ready.wait()
+        if self._error:
+            raise self._error
+
+    async def _run(self, host, port, transport):
+        try:
+            async with client.init_session(host, port, transport) as session:
+                self.session = session
+                self._ready.set()
+                await self._closing.wait()
+        except Exception as e:
+            if not self._ready.is_set():
+                self._error = e
+            else:
+                logger.warning(f'MCP session closed with error: {e}')
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def close(self):
+        self._closing.set()
+        if self._task:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class MCPSessionPool:
+    """Long lived, initialized MCP client sessions shared by the process.
+
+    Opening a session costs a connection (or, for stdio, a server process)
+    plus the MCP initialize handshake. The pool keeps up to max_sessions
+    sessions open and hands them out one caller at a time, callers beyond
+    that wait for a session to be returned. A session that was idle for
+    health_check_interval seconds is pinged before reuse and replaced if
+    the ping fails, and a session whose call failed is closed.
+    """
+
+    def __init__(
+        self,
+        host,
+        port,
+        transport,
+        max_sessions: int = MAX_SESSIONS,
+        health_check_interval: float = HEALTH_CHECK_INTERVAL,
+    ):
+        self.host = host
+        self.port = port
+        self.transport = transport
+        self.max_sessions = max_sessions
+        self.health_check_interval = health_check_interval
+        self.connects = 0
+        self._semaphore = asyncio.Semaphore(max_sessions)
+        self._idle: list[_PooledSession] = []
+        self._closed = False
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[ClientSession]:
+        """Borrows an initialized session for the duration of the block."""
+        if self._closed:
+            raise RuntimeError('MCP session pool is closed')
+        async with self._semaphore:
+            pooled = await self._checkout()
+            try:
+                yield pooled.session
+            except BaseException:
+                # The connection may be broken, do not hand it out again.
+                # The idle sessions likely share its fate, for example when
+                # the server restarted, so they are pinged before reuse.
+                for idle in self._idle:
+                    idle.last_used = float('-inf')
+                await pooled.close()
+                raise
+            pooled.last_used = time.monotonic()
+            if self._closed:
+                await pooled.close()
+            else:
+                self._idle.append(pooled)
+
+    async def call(
+        self,
+        operation: Callable[[ClientSession], Awaitable[T]],
+        retries: int = 1,
+    ) -> T:
+        """Runs operation with a pooled session, reconnecting on failure.
+
+        Args:
+            operation: Called with a session, e.g. a client.find_agent call.
+            retries: How often a failed operation is retried on a new
+                session.
+        """
+        for attempt in range(retries + 1):
+            try:
+                async with self.session() as session:
+                    return await operation(session)
+            except Exception as e:
+                if attempt == retries or self._closed:
+                    raise
+                logger.warning(f'MCP call failed, reconnecting: {e}')
+
+    async def _checkout(self) -> _PooledSession:
+        while self._idle:
+            # Most recently used first, it is the least likely to be stale.
+            pooled = self._idle.pop()
+            if await self._healthy(pooled):
+                return pooled
+            await pooled.close()
+        pooled = _PooledSession()
+        await pooled.open(self.host, self.port, self.transport)
+        self.connects += 1
+        logger.info(
+            f'Opened MCP session {self.connects} to {self.host}:{self.port}'
+        )
+        return pooled
+
+    async def _healthy(self, pooled: _PooledSession) -> bool:
+        if not pooled.alive:
+            return False
+        if time.monotonic() - pooled.last_used < self.health_check_interval:
+            return True
+        try:
+            await asyncio.wait_for(pooled.session.send_ping(), PING_TIMEOUT)
+            return True
+        except Exception as e:
+            logger.info(f'Dropping unhealthy MCP session: {e}')
+            return False
+
+    async def close(self):
+        self._closed = True
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(pooled.close() for pooled in idle))
+
+
+_pool: MCPSessionPool | None = None
+_pool_loop: asyncio.AbstractEventLoop | None = None
+_tools = None
+
+
+def get_session_pool() -> MCPSessionPool:
+    """The process wide session pool for the configured MCP server.
+
+    Sessions are bound to the event loop they were opened on, a new pool is
+    created when called from another loop and the previous pool is retired.
+    """
+    global _pool, _pool_loop
+    loop = asyncio.get_running_loop()
+    if _pool is None or _pool_loop is not loop:
+        if _pool is not None:
+            _retire(_pool, _pool_loop)
+        config = get_mcp_server_config()
+        _pool = MCPSessionPool(config.host, config.port, config.transport)
+        _pool_loop = loop
+    return _pool
+
+
+def _retire(pool: MCPSessionPool, loop: asyncio.AbstractEventLoop):
+    """Closes a pool whose sessions belong to another event loop.
+
+    The sessions can only be closed on their own loop. A closed loop had
+    its session tasks cancelled on shutdown (asyncio.run does so), which
+    exited their transports, so the sessions are just dropped.
+    """
+    if loop.is_closed():
+        pool._closed = True
+        pool._idle.clear()
+        return
+    asyncio.run_coroutine_threadsafe(pool.close(), loop)
+
+
+async def get_mcp_tools() -> list:
+    """ADK tools of the MCP server, loaded once per process.
+
+    The tools share one MCPToolset, whose session manager keeps its
+    session open between tool calls and reconnects when it is lost.
+    """
+    global _tools
+    if _tools is None:
+        from google.adk.tools.mcp_tool.mcp_session_manager import (
+            SseServerParams,
+        )
+        from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
+
+        config = get_mcp_server_config()
+        logger.info(f'MCP Server url={config.url}')
+        _tools = await MCPToolset(
+            connection_params=SseServerParams(url=config.url)
+        ).get_tools()
+    return _tools
+
+
+async def close_session_pool():
+    global _pool, _pool_loop
+    if _pool is not None:
+        if _pool_loop is asyncio.get_running_loop():
+            await _pool.close()
+        else:
+            _retire(_pool, _pool_loop)
+    _pool = _pool_loop = None
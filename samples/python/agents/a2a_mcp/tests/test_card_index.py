@@ -0,0 +1,100 @@
+import json
+import os
+import tempfile
+import unittest
+
+from pathlib import Path
+
+import numpy as np
+
+from a2a_mcp.mcp.card_index import INDEX_FILE, AgentCardIndex
+
+
+def write_card(cards_dir: str, name: str, description: str):
+    with open(os.path.join(cards_dir, f'{name}.json'), 'w') as f:
+        json.dump({'name': name, 'description': description}, f)
+
+
+class FakeEmbedder:
+    """Embeds texts by their length, failing while failing is set."""
+
+    def __init__(self):
+        self.calls = 0
+        self.failing = False
+
+    def __call__(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        if self.failing:
+            raise RuntimeError('embedding service down')
+        return [[len(text), 1.0, 0.0] for text in texts]
+
+
+class AgentCardIndexTest(unittest.TestCase):
+    """Tests for the persisted agent card embedding index."""
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self.cards_dir = os.path.join(self._dir.name, 'cards')
+        self.index_dir = os.path.join(self._dir.name, 'index')
+        os.makedirs(self.cards_dir)
+        self.embed = FakeEmbedder()
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def make_index(self) -> AgentCardIndex:
+        return AgentCardIndex(
+            self.cards_dir,
+            self.index_dir,
+            self.embed,
+            model='test-model',
+            check_interval=0,
+        )
+
+    def test_unchanged_cards_are_not_embedded_again(self) -> None:
+        write_card(self.cards_dir, 'hotels', 'Books hotels')
+        write_card(self.cards_dir, 'flights', 'Books flights')
+        self.assertEqual(self.make_index().refresh(), 2)
+        self.assertEqual(os.listdir(self.index_dir), [INDEX_FILE])
+
+        restarted = self.make_index()
+        self.assertEqual(restarted.refresh(), 0)
+        self.assertEqual(self.embed.calls, 1)
+        self.assertEqual(len(restarted), 2)
+        np.testing.assert_allclose(
+            np.linalg.norm(restarted.matrix, axis=1), [1.0, 1.0], rtol=1e-6
+        )
+
+    def test_failed_refresh_is_retried(self) -> None:
+        index = self.make_index()
+        index.refresh()
+        write_card(self.cards_dir, 'hotels', 'Books hotels')
+        self.embed.failing = True
+        self.assertFalse(index.refresh_if_changed())
+        self.assertEqual(len(index), 0)
+        self.embed.failing = False
+        self.assertTrue(index.refresh_if_changed())
+        self.assertEqual(len(index), 1)
+        self.assertFalse(index.refresh_if_changed())
+
+    def test_empty_index_has_no_matches(self) -> None:
+        index = self.make_index()
+        index.refresh()
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.scores([1.0, 0.0, 0.0]).shape, (0,))
+        self.assertEqual(index.top_k([1.0, 0.0, 0.0], 3), [])
+
+    def test_inconsistent_saved_index_is_ignored(self) -> None:
+        write_card(self.cards_dir, 'hotels', 'Books hotels')
+        self.make_index().refresh()
+        path = Path(self.index_dir) / INDEX_FILE
+        with np.load(path) as saved:
+            matrix, model = saved['matrix'], saved['model']
+        np.savez(
+            path, matrix=matrix, hashes=np.array(['a', 'b']), model=model
+        )
+        self.assertEqual(self.make_index().refresh(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,248 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+import networkx as nx
+
+from a2a.types import (
+    Artifact,
+    DataPart,
+    Message,
+    Part,
+    Role,
+    SendStreamingMessageResponse,
+    SendStreamingMessageSuccessResponse,
+    TaskState,
+    TaskStatus,
+    TaskStatusUpdateEvent,
+    TextPart,
+)
+from a2a_mcp.agents.orchestrator_agent import OrchestratorAgent
+from a2a_mcp.common.workflow import Status, WorkflowNode
+
+
+def new_agent() -> OrchestratorAgent:
+    with mock.patch.dict(os.environ, {'GOOGLE_API_KEY': 'test-key'}):
+        return OrchestratorAgent()
+
+
+def status_chunk(
+    state: TaskState, task_id: str, context_id: str, text: str | None = None
+) -> SendStreamingMessageResponse:
+    message = None
+    if text:
+        message = Message(
+            role=Role.agent,
+            message_id='m1',
+            parts=[Part(root=TextPart(text=text))],
+        )
+    return SendStreamingMessageResponse(
+        root=SendStreamingMessageSuccessResponse(
+            id='1',
+            result=TaskStatusUpdateEvent(
+                task_id=task_id,
+                context_id=context_id,
+                final=state == TaskState.completed,
+                status=TaskStatus(state=state, message=message),
+            ),
+        )
+    )
+
+
+class OrchestratorAgentTest(unittest.TestCase):
+    """Tests for building the workflow graph from the planner's tasks."""
+
+    def setUp(self) -> None:
+        self._cwd = os.getcwd()
+        self._dir = tempfile.TemporaryDirectory()
+        os.chdir(self._dir.name)
+        self.agent = new_agent()
+        self.agent.new_graph()
+        self.planner = self.agent.add_graph_node(
+            task_id='t1', context_id='c1', query='plan', node_key='planner'
+        )
+
+    def tearDown(self) -> None:
+        os.chdir(self._cwd)
+        self._dir.cleanup()
+
+    def task_node_ids(self) -> list[str]:
+        return [n for n in self.agent.graph.graph if n != self.planner.id]
+
+    def test_dependencies_become_edges(self) -> None:
+        self.agent.add_task_nodes(
+            [
+                {'id': 1, 'description': 'flight', 'depends_on': []},
+                {'id': 2, 'description': 'hotel', 'depends_on': []},
+                {'id': 3, 'description': 'car', 'depends_on': [1, 2]},
+            ],
+            self.planner.id,
+            't1',
+            'c1',
+        )
+        flight, hotel, car = self.task_node_ids()
+        self.assertCountEqual(
+            self.agent.graph.graph.edges,
+            [
+                (self.planner.id, flight),
+                (self.planner.id, hotel),
+                (flight, car),
+                (hotel, car),
+            ],
+        )
+
+    def test_dependency_cycle_is_ignored(self) -> None:
+        self.agent.add_task_nodes(
+            [
+                {'id': 1, 'description': 'flight', 'depends_on': [2]},
+                {'id': 2, 'description': 'hotel', 'depends_on': [1]},
+            ],
+            self.planner.id,
+            't1',
+            'c1',
+        )
+        flight, hotel = self.task_node_ids()
+        graph = self.agent.graph.graph
+        self.assertTrue(nx.is_directed_acyclic_graph(graph))
+        self.assertCountEqual(
+            graph.edges, [(hotel, flight), (self.planner.id, hotel)]
+        )
+
+
+class OrchestratorCheckpointTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for resuming a checkpointed workflow in a new agent."""
+
+    def setUp(self) -> None:
+        self._cwd = os.getcwd()
+        self._dir = tempfile.TemporaryDirectory()
+        os.chdir(self._dir.name)
+        agent = new_agent()
+        agent.context_id = 'c1'
+        agent.new_graph()
+        planner = agent.add_graph_node('t1', 'c1', 'plan', node_key='planner')
+        self.flight = agent.add_graph_node('t1', 'c1', 'flight', planner.id)
+        self.hotel = agent.add_graph_node('t1', 'c1', 'hotel', self.flight.id)
+        self.car = agent.add_graph_node('t1', 'c1', 'car', self.hotel.id)
+        self.artifact = Artifact(
+            artifact_id='a1',
+            name='AirTicketingAgent-result',
+            parts=[Part(root=DataPart(data={'price': 100}))],
+        )
+        for node in (planner, self.flight):
+            node.state = Status.COMPLETED
+        self.flight.results = self.artifact
+        self.hotel.state = Status.RUNNING
+        agent.results = [self.artifact]
+        agent.save_checkpoint()
+
+    def tearDown(self) -> None:
+        os.chdir(self._cwd)
+        self._dir.cleanup()
+
+    def test_restore_moves_incomplete_nodes_to_the_new_task(self) -> None:
+        agent = new_agent()
+        self.assertTrue(agent.restore_checkpoint('c1', 't2'))
+        self.assertFalse(agent.restore_checkpoint('c2', 't2'))
+        graph = agent.graph
+        self.assertEqual(agent.results, [self.artifact])
+        self.assertEqual(graph.nodes[self.flight.id].results, self.artifact)
+        self.assertEqual(graph.nodes[self.hotel.id].state, Status.READY)
+        self.assertEqual(graph.graph.nodes[self.flight.id]['task_id'], 't1')
+        self.assertEqual(graph.graph.nodes[self.hotel.id]['task_id'], 't2')
+        self.assertEqual(graph.graph.nodes[self.car.id]['task_id'], 't2')
+
+    async def test_stream_resumes_at_first_incomplete_node(self) -> None:
+        agent = new_agent()
+        ran = []
+
+        async def run_node(node, query, task_id, context_id):
+            ran.append((node.task, task_id))
+            yield status_chunk(TaskState.completed, task_id, context_id)
+
+        async def generate_summary():
+            # The checkpoint is kept until the summary was generated.
+            self.assertIsNotNone(agent.checkpoints.load('c1'))
+            return 'summary'
+
+        with (
+            mock.patch.object(WorkflowNode, 'run_node', run_node),
+            mock.patch.object(agent, 'generate_summary', generate_summary),
+        ):
+            chunks = [
+                chunk async for chunk in agent.stream('go on', 'c1', 't2')
+            ]
+        self.assertEqual(ran, [('hotel', 't2'), ('car', 't2')])
+        self.assertEqual(chunks[-1]['content'], 'summary')
+        self.assertTrue(chunks[-1]['is_task_complete'])
+        self.assertIsNone(agent.checkpoints.load('c1'))
+        self.assertIsNone(agent.graph)
+
+
+class OrchestratorReplyTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for a reply that arrives while the workflow still runs."""
+
+    def setUp(self) -> None:
+        self._cwd = os.getcwd()
+        self._dir = tempfile.TemporaryDirectory()
+        os.chdir(self._dir.name)
+
+    def tearDown(self) -> None:
+        os.chdir(self._cwd)
+        self._dir.cleanup()
+
+    async def test_reply_waits_for_running_siblings(self) -> None:
+        agent = new_agent()
+        agent.context_id = 'c1'
+        agent.new_graph()
+        agent.add_graph_node('t1', 'c1', 'hotel')
+        agent.add_graph_node('t1', 'c1', 'flight')
+        flight_booked = asyncio.Event()
+        started = []
+
+        async def run_node(node, query, task_id, context_id):
+            started.append(node.task)
+            if node.task == 'flight':
+                await flight_booked.wait()
+            elif query != 'a quiet room':
+                yield status_chunk(
+                    TaskState.input_required, task_id, context_id, 'hotel?'
+                )
+                return
+            yield status_chunk(TaskState.completed, task_id, context_id)
+
+        async def collect(stream):
+            return [chunk async for chunk in stream]
+
+        with (
+            mock.patch.object(WorkflowNode, 'run_node', run_node),
+            mock.patch.object(
+                agent,
+                'answer_user_question',
+                return_value='{"can_answer": "no"}',
+            ),
+            mock.patch.object(
+                agent, 'generate_summary', mock.AsyncMock(return_value='done')
+            ),
+        ):
+            first = agent.stream('plan a trip', 'c1', 't1')
+            question = await anext(first)
+            self.assertEqual(
+                question.root.result.status.state, TaskState.input_required
+            )
+            reply = asyncio.create_task(
+                collect(agent.stream('a quiet room', 'c1', 't1'))
+            )
+            await asyncio.sleep(0.01)
+            self.assertFalse(reply.done())
+            flight_booked.set()
+            self.assertEqual(await collect(first), [])
+            chunks = await reply
+        self.assertEqual(started, ['hotel', 'flight', 'hotel'])
+        self.assertEqual(chunks[-1]['content'], 'done')
+
+
+if __name__ == '__main__':
+    unittest.main()
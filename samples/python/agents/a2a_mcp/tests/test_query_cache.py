@@ -0,0 +1,34 @@
+import unittest
+
+from a2a_mcp.mcp.query_cache import QueryEmbeddingCache
+
+
+class QueryEmbeddingCacheTest(unittest.TestCase):
+    """Tests for the LRU cache of query embeddings."""
+
+    def setUp(self) -> None:
+        self.embedded: list[str] = []
+
+        def embed(text: str) -> list[float]:
+            self.embedded.append(text)
+            return [float(len(self.embedded)), 0.0]
+
+        self.cache = QueryEmbeddingCache(embed, max_size=2)
+
+    def test_variants_share_the_embedding_of_the_original_text(self) -> None:
+        first = self.cache.get('Book a Flight to  Paris')
+        second = self.cache.get('book a flight to paris ')
+        self.assertIs(second, first)
+        self.assertEqual(self.embedded, ['Book a Flight to  Paris'])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        for query in ['a', 'b', 'a', 'c', 'b']:
+            self.cache.get(query)
+        self.assertEqual(self.embedded, ['a', 'b', 'c', 'b'])
+        self.assertEqual(self.cache.evictions, 2)
+        self.assertEqual(len(self.cache), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
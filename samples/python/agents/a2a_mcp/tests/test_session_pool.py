@@ -0,0 +1,152 @@
+import asyncio
+import unittest
+
+from contextlib import asynccontextmanager
+from unittest import mock
+
+from a2a_mcp.common.types import ServerConfig
+from a2a_mcp.mcp import session_pool
+from a2a_mcp.mcp.session_pool import MCPSessionPool
+
+
+class FakeSession:
+    """Stands in for an initialized MCP ClientSession."""
+
+    def __init__(self, number: int):
+        self.number = number
+        self.closed = False
+        self.ping_fails = False
+        self.pings = 0
+
+    async def send_ping(self):
+        self.pings += 1
+        if self.ping_fails:
+            raise ConnectionError('server went away')
+
+
+class FakeServer:
+    """Replaces client.init_session, keeping every session it opened."""
+
+    def __init__(self):
+        self.sessions: list[FakeSession] = []
+
+    @asynccontextmanager
+    async def init_session(self, host, port, transport):
+        session = FakeSession(len(self.sessions))
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            session.closed = True
+
+
+class MCPSessionPoolTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for the pool of long lived MCP client sessions."""
+
+    async def asyncSetUp(self) -> None:
+        self.server = FakeServer()
+        patcher = mock.patch.object(
+            session_pool.client, 'init_session', self.server.init_session
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = MCPSessionPool('localhost', 10100, 'sse', max_sessions=2)
+
+    async def asyncTearDown(self) -> None:
+        await self.pool.close()
+
+    async def test_sessions_are_reused(self) -> None:
+        for _ in range(3):
+            async with self.pool.session() as session:
+                self.assertIs(session, self.server.sessions[0])
+        self.assertEqual(self.pool.connects, 1)
+
+    async def test_callers_wait_at_max_sessions(self) -> None:
+        active = 0
+        most_active = 0
+
+        async def use():
+            nonlocal active, most_active
+            async with self.pool.session():
+                active += 1
+                most_active = max(most_active, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(use() for _ in range(6)))
+        self.assertEqual(most_active, 2)
+        self.assertEqual(self.pool.connects, 2)
+
+    async def test_session_is_closed_after_failed_call(self) -> None:
+        with self.assertRaises(ValueError):
+            async with self.pool.session():
+                raise ValueError('call failed')
+        self.assertTrue(self.server.sessions[0].closed)
+        async with self.pool.session() as session:
+            self.assertIs(session, self.server.sessions[1])
+
+    async def test_call_retries_on_a_new_session(self) -> None:
+        async def operation(session):
+            if session.number == 0:
+                raise ConnectionError('connection reset')
+            return session.number
+
+        self.assertEqual(await self.pool.call(operation), 1)
+        self.assertEqual(self.pool.connects, 2)
+
+        async def always_fails(session):
+            raise ConnectionError('connection reset')
+
+        with self.assertRaises(ConnectionError):
+            await self.pool.call(always_fails)
+        # The first attempt used the idle session, the retry a new one.
+        self.assertEqual(self.pool.connects, 3)
+        self.assertTrue(all(s.closed for s in self.server.sessions))
+
+    async def test_idle_session_is_pinged_before_reuse(self) -> None:
+        self.pool.health_check_interval = 0
+        async with self.pool.session():
+            pass
+        async with self.pool.session() as session:
+            self.assertIs(session, self.server.sessions[0])
+        self.assertEqual(self.server.sessions[0].pings, 1)
+        self.server.sessions[0].ping_fails = True
+        async with self.pool.session() as session:
+            self.assertIs(session, self.server.sessions[1])
+        self.assertTrue(self.server.sessions[0].closed)
+
+
+class GetSessionPoolTest(unittest.TestCase):
+    """Tests for the process wide pool shared by the agents."""
+
+    def test_pool_of_a_finished_loop_is_retired(self) -> None:
+        server = FakeServer()
+        config = ServerConfig(
+            host='localhost', port=10100, transport='sse', url=''
+        )
+
+        async def use_pool():
+            pool = session_pool.get_session_pool()
+            async with pool.session():
+                pass
+            return pool
+
+        with (
+            mock.patch.object(
+                session_pool.client, 'init_session', server.init_session
+            ),
+            mock.patch.object(
+                session_pool, 'get_mcp_server_config', return_value=config
+            ),
+        ):
+            first = asyncio.run(use_pool())
+            second = asyncio.run(use_pool())
+            self.assertIsNot(second, first)
+            self.assertTrue(first._closed)
+            self.assertEqual(first._idle, [])
+            self.assertTrue(server.sessions[0].closed)
+            asyncio.run(session_pool.close_session_pool())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,272 @@
+import asyncio
+import json
+import unittest
+
+from a2a.types import (
+    Artifact,
+    DataPart,
+    Message,
+    Part,
+    Role,
+    SendStreamingMessageResponse,
+    SendStreamingMessageSuccessResponse,
+    TaskState,
+    TaskStatus,
+    TaskStatusUpdateEvent,
+    TextPart,
+)
+from a2a_mcp.common.workflow import Status, WorkflowGraph, WorkflowNode
+
+
+def status_chunk(
+    state: TaskState, text: str, context_id: str = 'c1'
+) -> SendStreamingMessageResponse:
+    return SendStreamingMessageResponse(
+        root=SendStreamingMessageSuccessResponse(
+            id='1',
+            result=TaskStatusUpdateEvent(
+                task_id='t1',
+                context_id=context_id,
+                final=False,
+                status=TaskStatus(
+                    state=state,
+                    message=Message(
+                        role=Role.agent,
+                        message_id='m1',
+                        parts=[Part(root=TextPart(text=text))],
+                    ),
+                ),
+            ),
+        )
+    )
+
+
+def chunk_text(chunk: SendStreamingMessageResponse) -> str:
+    return chunk.root.result.status.message.parts[0].root.text
+
+
+class Tracker:
+    """Counts the stub nodes running at the same time."""
+
+    def __init__(self):
+        self.active = 0
+        self.most_active = 0
+        self.started: list[str] = []
+
+
+class StubNode(WorkflowNode):
+    """Node that streams a few chunks instead of calling a remote agent.
+
+    With asks set the node asks a question until its query holds the answer.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tracker: Tracker,
+        asks: bool = False,
+        fails: bool = False,
+        delay: float = 0.01,
+    ):
+        super().__init__(task=name)
+        self.name = name
+        self.tracker = tracker
+        self.asks = asks
+        self.fails = fails
+        self.delay = delay
+        self.cancelled = False
+
+    async def run_node(self, query, task_id, context_id):
+        self.tracker.started.append(self.name)
+        self.tracker.active += 1
+        self.tracker.most_active = max(
+            self.tracker.most_active, self.tracker.active
+        )
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fails:
+                raise RuntimeError(f'{self.name} failed')
+            if self.asks and query != 'answer':
+                yield status_chunk(
+                    TaskState.input_required, f'{self.name}?', context_id
+                )
+                return
+            yield status_chunk(TaskState.working, self.name, context_id)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        finally:
+            self.tracker.active -= 1
+
+
+class WorkflowGraphTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for running the nodes of a workflow graph concurrently."""
+
+    def setUp(self) -> None:
+        self.tracker = Tracker()
+
+    def make_graph(self, *nodes: StubNode, max_concurrency: int = 4):
+        graph = WorkflowGraph(max_concurrency=max_concurrency)
+        for node in nodes:
+            graph.add_node(node)
+            graph.set_node_attributes(node.id, {'context_id': 'c1'})
+        return graph
+
+    async def run_graph(
+        self, graph: WorkflowGraph, start_node_id=None
+    ) -> list[str]:
+        return [
+            chunk_text(chunk)
+            async for chunk in graph.run_workflow(start_node_id)
+        ]
+
+    async def test_independent_nodes_overlap(self) -> None:
+        nodes = [StubNode(f'n{i}', self.tracker) for i in range(5)]
+        graph = self.make_graph(*nodes, max_concurrency=2)
+        self.assertCountEqual(
+            await self.run_graph(graph), [node.name for node in nodes]
+        )
+        self.assertEqual(self.tracker.most_active, 2)
+        self.assertEqual(graph.state, Status.COMPLETED)
+        self.assertTrue(all(n.state == Status.COMPLETED for n in nodes))
+
+    async def test_dependent_node_waits_for_its_parents(self) -> None:
+        first = StubNode('first', self.tracker)
+        second = StubNode('second', self.tracker, delay=0.05)
+        last = StubNode('last', self.tracker)
+        graph = self.make_graph(first, second, last)
+        graph.add_edge(first.id, last.id)
+        graph.add_edge(second.id, last.id)
+        self.assertEqual(
+            await self.run_graph(graph), ['first', 'second', 'last']
+        )
+        self.assertEqual(self.tracker.started[-1], 'last')
+        with self.assertRaises(ValueError):
+            graph.add_edge(last.id, first.id)
+
+    async def test_paused_node_does_not_block_siblings(self) -> None:
+        asking = StubNode('asking', self.tracker, asks=True, delay=0)
+        sibling = StubNode('sibling', self.tracker, delay=0.05)
+        graph = self.make_graph(asking, sibling)
+        self.assertEqual(await self.run_graph(graph), ['asking?', 'sibling'])
+        self.assertEqual(asking.state, Status.PAUSED)
+        self.assertEqual(sibling.state, Status.COMPLETED)
+        self.assertEqual(graph.state, Status.PAUSED)
+        self.assertEqual(graph.paused_node_id, asking.id)
+
+    async def test_questions_are_asked_one_at_a_time(self) -> None:
+        first = StubNode('first', self.tracker, asks=True, delay=0)
+        second = StubNode('second', self.tracker, asks=True, delay=0.02)
+        graph = self.make_graph(first, second)
+        self.assertEqual(await self.run_graph(graph), ['first?'])
+        self.assertEqual(graph.paused_node_ids, [first.id, second.id])
+
+        graph.set_node_attribute(first.id, 'query', 'answer')
+        self.assertEqual(
+            await self.run_graph(graph, first.id), ['first', 'second?']
+        )
+        self.assertEqual(first.state, Status.COMPLETED)
+        self.assertEqual(graph.paused_node_id, second.id)
+
+        graph.set_node_attribute(second.id, 'query', 'answer')
+        self.assertEqual(await self.run_graph(graph, second.id), ['second'])
+        self.assertEqual(graph.state, Status.COMPLETED)
+        self.assertIsNone(graph.paused_node_id)
+
+    async def test_reply_before_siblings_finish(self) -> None:
+        planner = StubNode('planner', self.tracker, delay=0)
+        hotel = StubNode('hotel', self.tracker, asks=True, delay=0)
+        flight = StubNode('flight', self.tracker, delay=0.05)
+        graph = self.make_graph(planner, hotel, flight)
+        graph.add_edge(planner.id, hotel.id)
+        graph.add_edge(planner.id, flight.id)
+        first_run = graph.run_workflow()
+        self.assertEqual(chunk_text(await anext(first_run)), 'planner')
+        self.assertEqual(chunk_text(await anext(first_run)), 'hotel?')
+        self.assertEqual(graph.state, Status.PAUSED)
+        self.assertEqual(flight.state, Status.RUNNING)
+
+        graph.set_node_attribute(hotel.id, 'query', 'answer')
+        self.assertEqual(
+            await self.run_graph(graph, graph.paused_node_id), ['hotel']
+        )
+        self.assertEqual(graph.state, Status.RUNNING)
+        self.assertEqual([chunk_text(c) async for c in first_run], ['flight'])
+        self.assertEqual(
+            self.tracker.started, ['planner', 'hotel', 'flight', 'hotel']
+        )
+        self.assertEqual(graph.state, Status.COMPLETED)
+
+    async def test_cancelled_node_runs_again(self) -> None:
+        quick = StubNode('quick', self.tracker, delay=0)
+        slow = StubNode('slow', self.tracker, delay=10)
+        graph = self.make_graph(quick, slow)
+        run = graph.run_workflow()
+        self.assertEqual(chunk_text(await anext(run)), 'quick')
+        await run.aclose()
+        self.assertTrue(slow.cancelled)
+        self.assertEqual(slow.state, Status.READY)
+        slow.delay = 0
+        self.assertIn('slow', await self.run_graph(graph))
+        self.assertEqual(graph.state, Status.COMPLETED)
+
+    async def test_node_error_cancels_siblings(self) -> None:
+        failing = StubNode('failing', self.tracker, fails=True)
+        slow = StubNode('slow', self.tracker, delay=10)
+        graph = self.make_graph(failing, slow)
+        with self.assertRaisesRegex(RuntimeError, 'failing failed'):
+            await self.run_graph(graph)
+        self.assertTrue(slow.cancelled)
+        self.assertEqual(self.tracker.active, 0)
+
+
+class WorkflowCheckpointTest(unittest.TestCase):
+    """Tests for saving and restoring the state of a workflow graph."""
+
+    def test_round_trip(self) -> None:
+        graph = WorkflowGraph(max_concurrency=2)
+        done, paused, running = (
+            WorkflowNode(task=task) for task in ('done', 'paused', 'running')
+        )
+        for node in (done, paused, running):
+            graph.add_node(node)
+        graph.add_edge(done.id, paused.id)
+        graph.add_edge(done.id, running.id)
+        graph.set_node_attributes(running.id, {'task_id': 't1'})
+        done.state = Status.COMPLETED
+        done.results = Artifact(
+            artifact_id='a1',
+            name='result',
+            parts=[Part(root=DataPart(data={'price': 100}))],
+        )
+        paused.state = Status.PAUSED
+        paused.input_request = status_chunk(TaskState.input_required, 'when?')
+        running.state = Status.RUNNING
+        graph.state = Status.PAUSED
+        graph.paused_node_id = paused.id
+        graph.paused_node_ids = [paused.id]
+
+        restored = WorkflowGraph.from_dict(
+            json.loads(json.dumps(graph.to_dict()))
+        )
+
+        self.assertEqual(restored.max_concurrency, 2)
+        self.assertEqual(restored.state, Status.PAUSED)
+        self.assertEqual(restored.paused_node_id, paused.id)
+        self.assertEqual(restored.paused_node_ids, [paused.id])
+        self.assertCountEqual(restored.graph.edges, graph.graph.edges)
+        self.assertEqual(
+            restored.graph.nodes[running.id],
+            {'query': 'running', 'task_id': 't1'},
+        )
+        self.assertEqual(restored.nodes[done.id].state, Status.COMPLETED)
+        self.assertEqual(restored.nodes[done.id].results, done.results)
+        self.assertEqual(restored.nodes[paused.id].state, Status.PAUSED)
+        self.assertEqual(
+            restored.nodes[paused.id].input_request, paused.input_request
+        )
+        self.assertEqual(restored.nodes[running.id].state, Status.READY)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+import asyncio
+import time
+
+from collections import deque
+
+import httpx
+
+from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to an agent whose circuit is open."""
+
+    def __init__(self, agent_name: str, retry_in: float):
+        self.agent_name = agent_name
+        self.retry_in = retry_in
+        super().__init__(
+            f'Agent {agent_name} is unavailable after repeated failures,'
+            f' retry in {retry_in:.0f}s'
+        )
+
+
+class AgentHealth:
+    """Circuit breaker and latency window of one remote agent.
+
+    The circuit opens after failure_count consecutive failures, or when at
+    least half of the last window outcomes failed. Timeouts count as
+    failures. An open circuit rejects requests for open_seconds, then lets a
+    single trial request through (half open); the trial's outcome closes or
+    re-opens it. A successful probe also moves an open circuit to half open.
+    """
+
+    def __init__(
+        self,
+        failure_count: int = 3,
+        error_rate: float = 0.5,
+        window: int = 20,
+        open_seconds: float = 30.0,
+    ):
+        self.failure_count = failure_count
+        self.error_rate_threshold = error_rate
+        self.open_seconds = open_seconds
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._latencies: deque[float] = deque(maxlen=100)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.consecutive_failures = 0
+        self.timeouts = 0
+        self.last_error = ''
+        self.last_probe_ok: bool | None = None
+        self.probe_latency: float | None = None
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == OPEN
+            and time.monotonic() - self._opened_at >= self.open_seconds
+        ):
+            self._state = HALF_OPEN
+        return self._state
+
+    @property
+    def error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def retry_in(self) -> float:
+        return max(self.open_seconds - (time.monotonic() - self._opened_at), 0)
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self, seconds: float):
+        self._trial_in_flight = False
+        self._outcomes.append(True)
+        self._latencies.append(seconds)
+        self.consecutive_failures = 0
+        if self._state != CLOSED:
+            self._state = CLOSED
+            self._outcomes.clear()
+
+    def record_failure(self, error: Exception, timeout: bool = False):
+        self._trial_in_flight = False
+        self._outcomes.append(False)
+        self.consecutive_failures += 1
+        self.timeouts += timeout
+        self.last_error = str(error) or type(error).__name__
+        if (
+            self._state == HALF_OPEN
+            or self.consecutive_failures >= self.failure_count
+            or (
+                len(self._outcomes) >= self.failure_count
+                and self.error_rate >= self.error_rate_threshold
+            )
+        ):
+            self._open()
+
+    def record_probe(self, ok: bool, seconds: float):
+        self.last_probe_ok = ok
+        self.probe_latency = seconds if ok else None
+        if ok and self.state == OPEN:
+            self._state = HALF_OPEN
+        elif not ok and self.state == CLOSED:
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.failure_count:
+                self._open()
+
+    def _open(self):
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+
+    def percentile(self, q: float) -> float | None:
+        """Latency percentile in seconds over the recent requests."""
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def summary(self) -> dict:
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        return {
+            'state': self.state,
+            'p50_ms': round(p50 * 1000) if p50 is not None else None,
+            'p95_ms': round(p95 * 1000) if p95 is not None else None,
+            'error_rate': round(self.error_rate, 2),
+            'timeouts': self.timeouts,
+            'last_probe_ok': self.last_probe_ok,
+            'last_error': self.last_error,
+        }
+
+
+class AgentHealthMonitor:
+    """Tracks the health of remote agents and probes their cards periodically."""
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        interval: float = 30.0,
+        timeout: float = 5.0,
+    ):
+        self.http_client = http_client
+        self.interval = interval
+        self.timeout = timeout
+        self.agents: dict[str, AgentHealth] = {}
+        self._urls: dict[str, str] = {}
+        self._task: asyncio.Task | None = None
+
+    def track(self, agent_name: str, url: str) -> AgentHealth:
+        """Health of an agent, kept across re-registrations with the same name."""
+        self._urls[agent_name] = url.rstrip('/')
+        return self.agents.setdefault(agent_name, AgentHealth())
+
+    def untrack(self, agent_name: str):
+        self._urls.pop(agent_name, None)
+        self.agents.pop(agent_name, None)
+
+    def start(self):
+        """Starts the probe loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await self.probe_all()
+            await asyncio.sleep(self.interval)
+
+    async def probe_all(self):
+        await asyncio.gather(
+            *(self.probe(name) for name in list(self._urls)),
+            return_exceptions=True,
+        )
+
+    async def probe(self, agent_name: str):
+        url = self._urls.get(agent_name)
+        health = self.agents.get(agent_name)
+        if not url or not health:
+            return
+        started = time.perf_counter()
+        try:
+            response = await self.http_client.get(
+                f'{url}{AGENT_CARD_WELL_KNOWN_PATH}', timeout=self.timeout
+            )
+            ok = response.status_code < 500
+        except httpx.HTTPError:
+            ok = False
+        health.record_probe(ok, time.perf_counter() - started)
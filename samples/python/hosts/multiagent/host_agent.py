@@ -10,6 +10,7 @@ from a2a.client import A2ACardResolver, ClientConfig, ClientFactory
 from a2a.types import (
     AgentCard,
     DataPart,
+    FileWithUri,
     Message,
     Part,
     Role,
@@ -24,10 +25,26 @@ from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.models.lite_llm import LiteLlm
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
+from samples.python.hosts.multiagent.agent_health import (
+    AgentHealthMonitor,
+    CircuitOpenError,
+)
 from samples.python.hosts.multiagent.remote_agent_connection import RemoteAgentConnections, TaskUpdateCallback
 from samples.python.hosts.multiagent.timestamp_ext import TimestampExtension
 
 
+try:
+    from demo.ui.service.server.blob_store import BlobQuotaError
+except ImportError:
+    # Without the demo UI the artifact service has no quota to exceed.
+    class BlobQuotaError(Exception):
+        pass
+
+
+DEFAULT_AGENT_TIMEOUT = 300.0
+DEFAULT_PROBE_INTERVAL = 30.0
+
+
 class HostAgent:
     """The host agent.
 
@@ -40,9 +57,18 @@ class HostAgent:
         remote_agent_addresses: list[str],
         http_client: httpx.AsyncClient,
         task_callback: TaskUpdateCallback | None = None,
+        agent_timeout: float = DEFAULT_AGENT_TIMEOUT,
+        probe_interval: float = DEFAULT_PROBE_INTERVAL,
     ):
         self.task_callback = task_callback
+        # Seconds each agent gets to answer in send_messages_parallel.
+        self.agent_timeout = agent_timeout
         self.httpx_client = http_client
+        # Circuit breakers and latencies of the remote agents. Probing only
+        # runs once start_health_probes is called on a running loop.
+        self.health_monitor = AgentHealthMonitor(
+            http_client, interval=probe_interval
+        )
         self.timestamp_extension = TimestampExtension()
         config = ClientConfig(
             httpx_client=self.httpx_client,
@@ -82,14 +108,48 @@ class HostAgent:
         self.register_agent_card(card)
 
     def register_agent_card(self, card: AgentCard):
-        remote_connection = RemoteAgentConnections(self.client_factory, card)
+        remote_connection = RemoteAgentConnections(
+            self.client_factory,
+            card,
+            self.task_callback,
+            self.health_monitor.track(card.name, card.url),
+        )
         self.remote_agent_connections[card.name] = remote_connection
         self.cards[card.name] = card
+        self._refresh_agents_info()
+
+    def unregister_agent_card(self, agent_name: str) -> bool:
+        if agent_name not in self.remote_agent_connections:
+            return False
+        del self.remote_agent_connections[agent_name]
+        self.cards.pop(agent_name, None)
+        self.health_monitor.untrack(agent_name)
+        self._refresh_agents_info()
+        return True
+
+    def _refresh_agents_info(self):
+        # root_instruction reads self.agents on every turn, so the running
+        # agent picks up the change without being re-created.
         agent_info = []
-        for ra in self.list_remote_agents():
-            agent_info.append(json.dumps(ra))
+        for card in self.cards.values():
+            agent_info.append(
+                json.dumps({'name': card.name, 'description': card.description})
+            )
         self.agents = '\n'.join(agent_info)
 
+    def start_health_probes(self):
+        self.health_monitor.start()
+
+    async def stop_health_probes(self):
+        await self.health_monitor.stop()
+
+    def agent_health(self) -> dict[str, dict]:
+        """Health summary of every remote agent, by agent name."""
+        return {
+            name: health.summary()
+            for name, health in self.health_monitor.agents.items()
+        }
+
     def create_agent(self) -> Agent:
         LITELLM_MODEL = os.getenv(
             'LITELLM_MODEL', 'gemini/gemini-2.0-flash-001'
@@ -106,6 +166,7 @@ class HostAgent:
             tools=[
                 self.list_remote_agents,
                 self.send_message,
+                self.send_messages_parallel,
             ],
         )
 
@@ -115,12 +176,14 @@ class HostAgent:
 
 Discovery:
 - You can use `list_remote_agents` to list the available remote agents you can use to delegate the task.
+- Each agent has a health `state` and its p50/p95 latency. Agents in the `open` state are failing and reject messages; when several agents fit a request, prefer the `closed` ones with the lower latency.
 
 Execution:
 - For actionable requests, you can use `send_message` to interact with remote agents to take action.
+- When a request needs several agents, use `send_messages_parallel` to message them all at once instead of calling `send_message` for each.
 
 CRITICAL RESPONSE RULES:
-- When you receive a response from a remote agent via `send_message`, you MUST format your response as follows:
+- When you receive a response from a remote agent via `send_message` or `send_messages_parallel`, you MUST format your response as follows:
   **[Agent Name]**: [Exact agent response without any modification]
 - DO NOT summarize, paraphrase, or modify the agent's response
 - DO NOT add commentary like "The agent provided..." or "Okay, the agent said..."
@@ -166,9 +229,14 @@ Current agent: {current_agent['active_agent']}
 
         remote_agent_info = []
         for card in self.cards.values():
-            remote_agent_info.append(
-                {'name': card.name, 'description': card.description}
-            )
+            info = {'name': card.name, 'description': card.description}
+            if health := self.health_monitor.agents.get(card.name):
+                summary = health.summary()
+                info['health'] = {
+                    key: summary[key]
+                    for key in ('state', 'p50_ms', 'p95_ms', 'error_rate')
+                }
+            remote_agent_info.append(info)
         return remote_agent_info
 
     async def send_message(
@@ -200,14 +268,13 @@ Current agent: {current_agent['active_agent']}
         if not message_id:
             message_id = str(uuid.uuid4())
 
-        request_message = Message(
-            role=Role.user,
-            parts=[Part(root=TextPart(text=message))],
-            message_id=message_id,
-            context_id=context_id,
-            task_id=task_id,
-        )
-        response = await client.send_message(request_message)
+        try:
+            response = await self._send_to_agent(
+                agent_name, message, context_id, task_id, message_id
+            )
+        except CircuitOpenError as e:
+            # Fail fast, the LLM can pick another agent or tell the user.
+            return [str(e)]
         if isinstance(response, Message):
             return await convert_parts(response.parts, tool_context)
         task: Task = response
@@ -231,6 +298,116 @@ Current agent: {current_agent['active_agent']}
         elif task.status.state == TaskState.failed:
             # Don't raise error, return the agent's error message instead
             pass  # Continue to process the response normally
+        return await self.task_response(agent_name, task, tool_context)
+
+    async def send_messages_parallel(
+        self,
+        agent_names: list[str],
+        messages: list[str],
+        tool_context: ToolContext,
+    ):
+        """Sends messages to several remote agents at the same time.
+
+        Use this instead of several send_message calls when a request needs
+        more than one agent. messages[i] is sent to agent_names[i].
+
+        Args:
+          agent_names: The names of the agents to send the messages to.
+          messages: The message for each agent, in the same order.
+          tool_context: The tool context this method runs in.
+
+        Returns:
+          One result per agent, in the order of agent_names. Each result has
+          the agent_name and either its response or an error. If the lists
+          differ in length, a single result with only an error.
+        """
+        if len(agent_names) != len(messages):
+            # Reported like an agent failure, so the model can call again.
+            return [
+                {
+                    'error': (
+                        f'Got {len(agent_names)} agent_names and'
+                        f' {len(messages)} messages, send one message per'
+                        ' agent'
+                    )
+                }
+            ]
+        context_id = tool_context.state.get('context_id', None)
+        results: list[dict] = [{} for _ in agent_names]
+
+        async def send(index: int):
+            agent_name = agent_names[index]
+            try:
+                async with asyncio.timeout(self.agent_timeout):
+                    response = await self._send_to_agent(
+                        agent_name, messages[index], context_id, None, None
+                    )
+                    if response is None:
+                        results[index] = {
+                            'agent_name': agent_name,
+                            'error': f'Agent {agent_name} sent no response',
+                        }
+                        return
+                    if isinstance(response, Message):
+                        output = await convert_parts(
+                            response.parts, tool_context
+                        )
+                        results[index] = {
+                            'agent_name': agent_name,
+                            'response': output,
+                        }
+                        return
+                    output = await self.task_response(
+                        agent_name, response, tool_context
+                    )
+                if response.status.state == TaskState.input_required:
+                    tool_context.actions.skip_summarization = True
+                    tool_context.actions.escalate = True
+                results[index] = {
+                    'agent_name': agent_name,
+                    'task_id': response.id,
+                    'state': response.status.state.value,
+                    'response': output,
+                }
+            except TimeoutError:
+                results[index] = {
+                    'agent_name': agent_name,
+                    'error': f'No response within {self.agent_timeout} seconds',
+                }
+            except Exception as e:
+                results[index] = {'agent_name': agent_name, 'error': str(e)}
+
+        # Failures are recorded per agent, so one agent failing does not
+        # cancel the others.
+        async with asyncio.TaskGroup() as task_group:
+            for index in range(len(agent_names)):
+                task_group.create_task(send(index))
+        return results
+
+    async def _send_to_agent(
+        self,
+        agent_name: str,
+        message: str,
+        context_id: str | None,
+        task_id: str | None,
+        message_id: str | None,
+    ) -> Task | Message | None:
+        client = self.remote_agent_connections.get(agent_name)
+        if not client:
+            raise ValueError(f'Agent {agent_name} not found')
+        request_message = Message(
+            role=Role.user,
+            parts=[Part(root=TextPart(text=message))],
+            message_id=message_id or str(uuid.uuid4()),
+            context_id=context_id,
+            task_id=task_id,
+        )
+        return await client.send_message(request_message)
+
+    async def task_response(
+        self, agent_name: str, task: Task, tool_context: ToolContext
+    ) -> list:
+        """The status message and artifacts of a task, for the host LLM."""
         response = []
         if task.status.message:
             # Assume the information is in the task message.
@@ -251,14 +428,7 @@ Current agent: {current_agent['active_agent']}
         
         # Add visual enhancement for agent responses
         if response:
-            # Add agent name with appropriate emoji indicator
-            if "VEO" in agent_name or "Video" in agent_name:
-                agent_prefix = f"🎬 **{agent_name}**:\n\n"
-            elif "Coder" in agent_name:
-                agent_prefix = f"💻 **{agent_name}**:\n\n"
-            else:
-                agent_prefix = f"🤖 **{agent_name}**:\n\n"
-                
+            agent_prefix = agent_response_prefix(agent_name)
             if isinstance(response[0], str):
                 response[0] = agent_prefix + response[0]
             else:
@@ -267,6 +437,15 @@ Current agent: {current_agent['active_agent']}
         return response
 
 
+def agent_response_prefix(agent_name: str) -> str:
+    """Agent name with an emoji indicator, shown before its response."""
+    if 'VEO' in agent_name or 'Video' in agent_name:
+        return f'🎬 **{agent_name}**:\n\n'
+    if 'Coder' in agent_name:
+        return f'💻 **{agent_name}**:\n\n'
+    return f'🤖 **{agent_name}**:\n\n'
+
+
 async def convert_parts(parts: list[Part], tool_context: ToolContext):
     rval = []
     for p in parts:
@@ -280,17 +459,33 @@ async def convert_part(part: Part, tool_context: ToolContext):
     if part.root.kind == 'data':
         return part.root.data
     if part.root.kind == 'file':
-        # Repackage A2A FilePart to google.genai Blob
-        # Currently not considering plain text as files
-        file_id = part.root.file.name
+        if isinstance(part.root.file, FileWithUri):
+            tool_context.actions.skip_summarization = True
+            tool_context.actions.escalate = True
+            # Already a reference, pass it on as is.
+            return part.root.model_dump(mode='json', exclude_none=True)
+        # Repackage A2A FilePart to google.genai Blob. The bytes are decoded
+        # once and kept in the artifact service; only a handle to them is
+        # returned. Currently not considering plain text as files
+        file_id = part.root.file.name or f'file-{uuid.uuid4()}'
         file_bytes = base64.b64decode(part.root.file.bytes)
         file_part = types.Part(
             inline_data=types.Blob(
                 mime_type=part.root.file.mime_type, data=file_bytes
             )
         )
-        await tool_context.save_artifact(file_id, file_part)
+        try:
+            version = await tool_context.save_artifact(file_id, file_part)
+        except BlobQuotaError as e:
+            # The turn goes on, the model is told the file is missing.
+            return f'[{file_id} not stored: {e}]'
         tool_context.actions.skip_summarization = True
         tool_context.actions.escalate = True
-        return DataPart(data={'artifact-file-id': file_id})
+        return DataPart(
+            data={
+                'artifact-file-id': file_id,
+                'artifact-version': version,
+                'mime-type': part.root.file.mime_type,
+            }
+        )
     return f'Unknown type: {part.kind}'
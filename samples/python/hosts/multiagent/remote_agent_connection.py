@@ -1,3 +1,5 @@
+import asyncio
+import time
 import traceback
 
 from collections.abc import Callable
@@ -6,6 +8,7 @@ from a2a.client import (
     Client,
     ClientFactory,
 )
+from a2a.client.errors import A2AClientTimeoutError
 from a2a.types import (
     AgentCard,
     Message,
@@ -14,6 +17,11 @@ from a2a.types import (
     TaskState,
     TaskStatusUpdateEvent,
 )
+from httpx import TimeoutException
+from samples.python.hosts.multiagent.agent_health import (
+    AgentHealth,
+    CircuitOpenError,
+)
 
 
 TaskCallbackArg = Task | TaskStatusUpdateEvent | TaskArtifactUpdateEvent
@@ -23,29 +31,84 @@ TaskUpdateCallback = Callable[[TaskCallbackArg, AgentCard], Task]
 class RemoteAgentConnections:
     """A class to hold the connections to the remote agents."""
 
-    def __init__(self, client_factory: ClientFactory, agent_card: AgentCard):
+    def __init__(
+        self,
+        client_factory: ClientFactory,
+        agent_card: AgentCard,
+        task_callback: TaskUpdateCallback | None = None,
+        health: AgentHealth | None = None,
+    ):
         self.agent_client: Client = client_factory.create(agent_card)
         self.card: AgentCard = agent_card
+        self.task_callback = task_callback
+        self.health = health
         self.pending_tasks = set()
 
     def get_agent(self) -> AgentCard:
         return self.card
 
     async def send_message(self, message: Message) -> Task | Message | None:
+        """Sends a message and returns the final task or message.
+
+        Every streamed status or artifact update is passed to task_callback
+        as soon as it arrives, before the final result is returned.
+
+        Raises CircuitOpenError without contacting the agent while its
+        circuit is open. Otherwise the outcome and latency of the call are
+        recorded in the agent's health.
+        """
+        if self.health and not self.health.allow_request():
+            raise CircuitOpenError(self.card.name, self.health.retry_in())
+        started = time.perf_counter()
+        try:
+            result = await self._send_message(message)
+        except (Exception, asyncio.CancelledError) as e:
+            if self.health:
+                self.health.record_failure(
+                    e,
+                    timeout=isinstance(
+                        e,
+                        TimeoutException
+                        | A2AClientTimeoutError
+                        | asyncio.CancelledError,
+                    ),
+                )
+            raise
+        if self.health:
+            self.health.record_success(time.perf_counter() - started)
+        return result
+
+    async def _send_message(self, message: Message) -> Task | Message | None:
         lastTask: Task | None = None
         try:
             async for event in self.agent_client.send_message(message):
                 if isinstance(event, Message):
                     return event
-                if self.is_terminal_or_interrupted(event[0]):
-                    return event[0]
-                lastTask = event[0]
+                task, update = event
+                self._notify(update or task)
+                if self.is_terminal_or_interrupted(task):
+                    return task
+                lastTask = task
         except Exception as e:
             print('Exception found in send_message')
             traceback.print_exc()
             raise e
         return lastTask
 
+    def _notify(self, update: TaskCallbackArg):
+        """Passes an update to task_callback.
+
+        A failing callback is logged and does not end the stream, the
+        remote agent is not at fault.
+        """
+        if not self.task_callback:
+            return
+        try:
+            self.task_callback(update, self.card)
+        except Exception:
+            print(f'Exception in task_callback for {self.card.name}')
+            traceback.print_exc()
+
     def is_terminal_or_interrupted(self, task: Task) -> bool:
         return task.status.state in [
             TaskState.completed,